@@ -13,6 +13,9 @@ namespace KeyMaker {
     public class Application : Adw.Application {
         
         public KeyMaker.Window? window = null;
+        
+        // Last applied theme, so spurious "changed" emissions are no-ops
+        private string? current_theme = null;
 
         public Application () {
             Object (
@@ -30,6 +33,7 @@ namespace KeyMaker {
             add_command_line_options ();
             
             // Connect signals
+            handle_local_options.connect (on_handle_local_options);
             command_line.connect (on_command_line);
             activate.connect (on_activate);
             startup.connect (on_startup);
@@ -37,15 +41,8 @@ namespace KeyMaker {
         }
 
         private void on_startup () {
-            // Initialize Adwaita
-            Adw.init ();
-            
-            // Ensure .ssh directory exists early on
-            try {
-                KeyMaker.Filesystem.ensure_ssh_dir ();
-            } catch (Error e) {
-                warning ("Failed to ensure SSH directory: %s", e.message);
-            }
+            // Adw.Application initializes libadwaita in its own startup handler,
+            // which runs before this one.
             
             // Optional: allow disabling forwarded SSH agent inside Flatpak to avoid
             // sandbox socket issues (e.g. "Connection reset by peer" from ssh-auth).
@@ -57,11 +54,44 @@ namespace KeyMaker {
             }
 
             
-            // Setup GSettings and apply theme
+            // Setup GSettings and apply theme before the first frame
             setup_settings ();
             
-            // Create application actions
+            // Everything else can wait until the window has been presented
+            Idle.add (deferred_startup, Priority.DEFAULT_IDLE);
+        }
+        
+        private bool deferred_startup () {
+            // Ensure .ssh directory exists before the initial scan
+            try {
+                KeyMaker.Filesystem.ensure_ssh_dir ();
+            } catch (Error e) {
+                warning ("Failed to ensure SSH directory: %s", e.message);
+            }
+            
+            // Create application actions; accelerators only fire once the window is realized
             create_actions ();
+            
+            prewarm_dialog_classes ();
+            return false;
+        }
+        
+        /**
+         * Initialize the most used dialog classes in the background, one per idle
+         * pass, so their templates are already parsed by the time one is opened
+         */
+        private void prewarm_dialog_classes () {
+            Type[] types = {
+                typeof (KeyMaker.GenerateKeyDialog),
+                typeof (KeyMaker.KeyDetailsDialog),
+                typeof (KeyMaker.CopyIdDialog),
+                typeof (KeyMaker.ChangePassphraseDialog)
+            };
+            int next = 0;
+            Idle.add (() => {
+                types[next++].class_ref ();
+                return next < types.length;
+            }, Priority.LOW);
         }
         
         private void setup_settings () {
@@ -77,6 +107,11 @@ namespace KeyMaker {
         }
         
         private void apply_theme (string theme) {
+            if (theme == current_theme) {
+                return;
+            }
+            current_theme = theme;
+            
             var style_manager = Adw.StyleManager.get_default ();
             
             switch (theme) {
@@ -98,22 +133,30 @@ namespace KeyMaker {
                 window = new KeyMaker.Window (this);
             }
             window.present ();
-            // Trigger initial key refresh after window is shown unless deferred via env
+            // Trigger initial key refresh after window is shown; KEYMAKER_DEFER_SCAN
+            // pushes it behind all other pending idle work
             var defer_scan = Environment.get_variable ("KEYMAKER_DEFER_SCAN");
-            if (defer_scan == null || defer_scan.strip () == "" || defer_scan == "0") {
-                Idle.add (() => { window.refresh_keys (); return false; });
+            var scan_priority = Priority.DEFAULT_IDLE;
+            if (defer_scan != null && defer_scan.strip () != "" && defer_scan != "0") {
+                scan_priority = Priority.LOW;
             }
+            Idle.add (() => { window.refresh_keys (); return false; }, scan_priority);
         }
 
-        private int on_command_line (ApplicationCommandLine command_line) {
-            var options = command_line.get_options_dict ();
-            
-            // Handle version option
+        private int on_handle_local_options (VariantDict options) {
+            // Answer --version in the launching process, before registration and startup run
             if (options.contains ("version")) {
                 print ("%s %s\n", Config.APP_NAME, Config.VERSION);
                 return 0;
             }
             
+            // Continue with the default command line handling
+            return -1;
+        }
+
+        private int on_command_line (ApplicationCommandLine command_line) {
+            var options = command_line.get_options_dict ();
+            
             // Handle verbose option
             if (options.contains ("verbose")) {
                 // Enable verbose logging if needed
@@ -131,64 +174,36 @@ namespace KeyMaker {
                 window.destroy ();
                 window = null;
             }
+            
+            // Let the next start reuse this session's key metadata
+            SSHMetadata.save_key_info_cache ();
         }
 
         private void create_actions () {
-            // Quit action
-            var quit_action = new SimpleAction ("quit", null);
-            quit_action.activate.connect (() => quit ());
-            add_action (quit_action);
-            set_accels_for_action ("app.quit", {"<Control>q"});
+            ActionEntry[] action_entries = {
+                { "quit", on_quit_action },
+                { "about", on_about_action },
+                { "preferences", on_preferences_action },
+                { "generate-key", on_generate_key_action },
+                { "refresh", on_refresh_action },
+                { "help", on_help_action },
+                { "shortcuts", on_shortcuts_action },
+                { "ssh-agent", on_ssh_agent_action },
+                { "ssh-config", on_ssh_config_action },
+                { "backup-center", on_backup_center_action }
+            };
+            add_action_entries (action_entries, this);
 
-            // About action
-            var about_action = new SimpleAction ("about", null);
-            about_action.activate.connect (on_about_action);
-            add_action (about_action);
+            set_accels_for_action ("app.quit", {"<Control>q"});
             set_accels_for_action ("app.about", {"F1"});
-
-            // Preferences action
-            var preferences_action = new SimpleAction ("preferences", null);
-            preferences_action.activate.connect (on_preferences_action);
-            add_action (preferences_action);
             set_accels_for_action ("app.preferences", {"<Control>comma"});
-
-            // Generate key action
-            var generate_action = new SimpleAction ("generate-key", null);
-            generate_action.activate.connect (on_generate_key_action);
-            add_action (generate_action);
             set_accels_for_action ("app.generate-key", {"<Control>n"});
-
-            // Refresh action
-            var refresh_action = new SimpleAction ("refresh", null);
-            refresh_action.activate.connect (on_refresh_action);
-            add_action (refresh_action);
             set_accels_for_action ("app.refresh", {"<Control>r", "F5"});
-
-            // Help action
-            var help_action = new SimpleAction ("help", null);
-            help_action.activate.connect (on_help_action);
-            add_action (help_action);
-
-            // Shortcuts action  
-            var shortcuts_action = new SimpleAction ("shortcuts", null);
-            shortcuts_action.activate.connect (on_shortcuts_action);
-            add_action (shortcuts_action);
             set_accels_for_action ("app.shortcuts", {"<Control>question"});
+        }
 
-            // SSH Agent action
-            var ssh_agent_action = new SimpleAction ("ssh-agent", null);
-            ssh_agent_action.activate.connect (on_ssh_agent_action);
-            add_action (ssh_agent_action);
-
-            // SSH Config action  
-            var ssh_config_action = new SimpleAction ("ssh-config", null);
-            ssh_config_action.activate.connect (on_ssh_config_action);
-            add_action (ssh_config_action);
-
-            // Backup Center action
-            var backup_center_action = new SimpleAction ("backup-center", null);
-            backup_center_action.activate.connect (on_backup_center_action);
-            add_action (backup_center_action);
+        private void on_quit_action () {
+            quit ();
         }
 
         private void on_about_action () {
@@ -12,6 +12,11 @@
  */
 
 int main (string[] args) {
+    // Bind straight to the configured locale dir; GTK sets the locale itself during startup
+    Intl.bindtextdomain (Config.GETTEXT_PACKAGE, Config.LOCALEDIR);
+    Intl.bind_textdomain_codeset (Config.GETTEXT_PACKAGE, "UTF-8");
+    Intl.textdomain (Config.GETTEXT_PACKAGE);
+    
     var app = new KeyMaker.Application ();
     return app.run (args);
 }
\ No newline at end of file
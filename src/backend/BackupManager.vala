@@ -538,14 +538,15 @@ namespace KeyMaker {
                         var last_modified = private_file_info.get_modification_date_time ();
                         
                         // Parse key properties
-                        var key_type = SSHOperations.get_key_type_sync (key_file);
-                        var fingerprint = SSHOperations.get_fingerprint_sync (key_file);
-                        var bit_size = SSHOperations.extract_bit_size_sync (key_file);
+                        var key_info = yield SSHOperations.get_key_info (key_file);
+                        var key_type = key_info.key_type;
+                        var fingerprint = key_info.fingerprint;
+                        var bit_size = key_info.bit_size;
                         
                         uint8[] public_content;
                         public_key_file.load_contents (null, out public_content, null);
                         var public_key_content = (string) public_content;
-                        var parts = public_key_content.strip ().split (" ");
+                        var parts = public_key_content.strip ().split (" ", 3);
                         string? comment = null;
                         if (parts.length >= 3) {
                             comment = parts[2];
@@ -558,7 +559,7 @@ namespace KeyMaker {
                             fingerprint,
                             comment,
                             last_modified,
-                            bit_size ?? -1
+                            bit_size
                         );
                     } catch (Error e) {
                         warning ("BackupManager: Could not create SSHKey object for %s: %s", safe_name, e.message);
@@ -961,9 +962,11 @@ namespace KeyMaker {
                 var backup = backups_to_delete[i];
 
                 try {
-                    // Try to delete backup file
-                    if (backup.backup_file.query_exists ()) {
+                    // Delete without a prior existence check
+                    try {
                         backup.backup_file.delete ();
+                    } catch (IOError.NOT_FOUND e) {
+                        debug ("BackupManager: Backup file already removed: %s", backup.backup_file.get_path ());
                     }
 
                     // Remove from list
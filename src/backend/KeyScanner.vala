@@ -15,6 +15,49 @@ namespace KeyMaker {
     
     public class KeyScanner {
         
+        // Model built for a key pair as of the given mtime and size of both files;
+        // a change to either makes it stale, since the comment and public key
+        // content come from the .pub
+        private class CachedKey {
+            public uint64 mtime;
+            public uint32 mtime_usec;
+            public uint64 size;
+            public uint64 pub_mtime;
+            public uint32 pub_mtime_usec;
+            public uint64 pub_size;
+            public SSHKey ssh_key;
+            
+            public CachedKey (FileInfo private_info, FileInfo public_info, SSHKey ssh_key) {
+                this.mtime = private_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
+                this.mtime_usec = private_info.get_attribute_uint32 (FileAttribute.TIME_MODIFIED_USEC);
+                this.size = private_info.get_attribute_uint64 (FileAttribute.STANDARD_SIZE);
+                this.pub_mtime = public_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
+                this.pub_mtime_usec = public_info.get_attribute_uint32 (FileAttribute.TIME_MODIFIED_USEC);
+                this.pub_size = public_info.get_attribute_uint64 (FileAttribute.STANDARD_SIZE);
+                this.ssh_key = ssh_key;
+            }
+            
+            public bool matches (FileInfo private_info, FileInfo public_info) {
+                return mtime == private_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED) &&
+                       mtime_usec == private_info.get_attribute_uint32 (FileAttribute.TIME_MODIFIED_USEC) &&
+                       size == private_info.get_attribute_uint64 (FileAttribute.STANDARD_SIZE) &&
+                       pub_mtime == public_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED) &&
+                       pub_mtime_usec == public_info.get_attribute_uint32 (FileAttribute.TIME_MODIFIED_USEC) &&
+                       pub_size == public_info.get_attribute_uint64 (FileAttribute.STANDARD_SIZE);
+            }
+        }
+        
+        private static HashTable<string, CachedKey>? _scan_cache = null;
+        
+        private static HashTable<string, CachedKey> scan_cache {
+            get {
+                if (_scan_cache == null) {
+                    _scan_cache = new HashTable<string, CachedKey> (str_hash, str_equal);
+                }
+                return _scan_cache;
+            }
+        }
+        
         /**
          * Scan SSH directory for key pairs and return SSH key models
          */
@@ -22,13 +65,19 @@ namespace KeyMaker {
             return yield scan_ssh_directory_with_cancellable (ssh_dir, null);
         }
         
-        public static GenericArray<SSHKey> scan_ssh_directory_sync (File? ssh_dir = null) throws KeyMakerError {
-            var target_dir = ssh_dir ?? File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
-            debug ("KeyScanner: Starting sync scan of directory: %s", target_dir.get_path ());
+        private const int MAX_SCAN_DEPTH = 3;
+        private const int HEADER_PEEK_SIZE = 256;
+        private const int MAX_CONCURRENT_BUILDS = 8;
+        private const int MAX_SCAN_THREADS = 2;
+        // Name and type for the listing, plus what a model build and the scan cache need
+        private const string KEY_FILE_ATTRIBUTES = "standard::name,standard::type,standard::size,time::modified,time::modified-usec,unix::mode";
+
+        public static async GenericArray<SSHKey> scan_ssh_directory_with_cancellable (File? ssh_dir, Cancellable? cancellable) throws KeyMakerError {
+            var target_dir = ssh_dir ?? KeyMaker.Filesystem.ssh_dir ();
+            debug ("KeyScanner: Starting scan of directory: %s", target_dir.get_path ());
             
-            if (!target_dir.query_exists ()) {
-                debug ("KeyScanner: SSH directory does not exist");
-                return new GenericArray<SSHKey> ();
+            if (cancellable != null && cancellable.is_cancelled ()) {
+                throw new GLib.IOError.CANCELLED ("Operation was cancelled");
             }
             
             try {
@@ -36,109 +85,158 @@ namespace KeyMaker {
                 if (file_info.get_file_type () != FileType.DIRECTORY) {
                     throw new KeyMakerError.OPERATION_FAILED ("SSH directory is not a directory: %s", target_dir.get_path ());
                 }
+            } catch (IOError.NOT_FOUND e) {
+                debug ("KeyScanner: SSH directory does not exist");
+                return new GenericArray<SSHKey> ();
             } catch (GLib.Error e) {
                 throw new KeyMakerError.OPERATION_FAILED ("Failed to access SSH directory: %s", e.message);
             }
             
             try {
                 debug ("KeyScanner: Directory exists, enumerating files recursively...");
-                // Find all potential private key files
-                var private_keys = new GenericArray<File> ();
-                scan_directory_recursive (target_dir, private_keys, 0, null);
+                // Find all potential private key files recursively
+                GenericArray<FileInfo> key_infos;
+                var private_keys = yield find_private_keys (target_dir, cancellable, out key_infos);
                 
                 debug ("KeyScanner: Found %d private keys, building models...", private_keys.length);
                 
-                // Build SSH key models for each valid pair
-                var ssh_keys = new GenericArray<SSHKey> ();
+                // Build SSH key models for the pairs concurrently; each build waits on
+                // ssh-keygen, so overlapping them keeps the scan well below the sum
+                var built = yield build_ssh_key_models (private_keys, key_infos, cancellable);
                 
-                for (int i = 0; i < private_keys.length; i++) {
-                    debug ("KeyScanner: Processing key %d: %s", i, private_keys[i].get_path ());
-                    try {
-                        var ssh_key = build_ssh_key_model_sync (private_keys[i]);
-                        if (ssh_key != null) {
-                            debug ("KeyScanner: Successfully built model for key %d", i);
-                            ssh_keys.add (ssh_key);
-                        }
-                    } catch (Error e) {
-                        // Skip invalid keys but continue processing
-                        debug ("Skipping invalid key %s: %s", private_keys[i].get_path (), e.message);
-                        continue;
+                if (cancellable != null && cancellable.is_cancelled ()) {
+                    throw new IOError.CANCELLED ("Operation was cancelled");
+                }
+                
+                // Keep directory order and drop keys that failed to build
+                var ssh_keys = new GenericArray<SSHKey> ();
+                foreach (var ssh_key in built) {
+                    if (ssh_key != null) {
+                        ssh_keys.add (ssh_key);
                     }
                 }
                 
-                debug ("KeyScanner: Completed sync scan, returning %d keys", ssh_keys.length);
+                debug ("KeyScanner: Completed scan, returning %d keys", ssh_keys.length);
                 return ssh_keys;
                 
+            } catch (IOError.CANCELLED e) {
+                throw new KeyMakerError.OPERATION_CANCELLED ("Key scan was cancelled");
             } catch (Error e) {
                 throw new KeyMakerError.OPERATION_FAILED ("Failed to scan SSH directory: %s", e.message);
             }
         }
         
-        private const int MAX_SCAN_DEPTH = 3;
-
-        public static async GenericArray<SSHKey> scan_ssh_directory_with_cancellable (File? ssh_dir, Cancellable? cancellable) throws KeyMakerError {
-            var target_dir = ssh_dir ?? File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
-            debug ("KeyScanner: Starting scan of directory: %s", target_dir.get_path ());
+        // A directory walk handed to the scan worker pool
+        private class ScanJob {
+            public File dir;
+            public Cancellable? cancellable;
+            public GenericArray<File> private_keys = new GenericArray<File> ();
+            public GenericArray<FileInfo> key_infos = new GenericArray<FileInfo> ();
+            public SourceFunc callback;
             
-            if (cancellable != null && cancellable.is_cancelled ()) {
-                throw new GLib.IOError.CANCELLED ("Operation was cancelled");
+            public ScanJob (File dir, Cancellable? cancellable, owned SourceFunc callback) {
+                this.dir = dir;
+                this.cancellable = cancellable;
+                this.callback = (owned) callback;
             }
-            
-            if (!target_dir.query_exists ()) {
-                debug ("KeyScanner: SSH directory does not exist");
-                return new GenericArray<SSHKey> ();
+        }
+        
+        // Worker threads are kept around between scans instead of spawning one per refresh
+        private static ThreadPool<ScanJob>? _scan_pool = null;
+        
+        private static ThreadPool<ScanJob> scan_pool {
+            get {
+                if (_scan_pool == null) {
+                    try {
+                        _scan_pool = new ThreadPool<ScanJob>.with_owned_data ((job) => {
+                            scan_directory_recursive (job.dir, job.private_keys, job.key_infos, 0, job.cancellable);
+                            Idle.add ((owned) job.callback);
+                        }, MAX_SCAN_THREADS, false);
+                    } catch (ThreadError e) {
+                        error ("Failed to create key scan thread pool: %s", e.message);
+                    }
+                }
+                return _scan_pool;
             }
+        }
+        
+        /**
+         * Walk the directory tree on a worker thread. On a slow or remote home
+         * directory the enumeration would otherwise stall the main loop.
+         */
+        private static async GenericArray<File> find_private_keys (File dir, Cancellable? cancellable, out GenericArray<FileInfo> key_infos) {
+            var job = new ScanJob (dir, cancellable, find_private_keys.callback);
+            var private_keys = job.private_keys;
+            key_infos = job.key_infos;
             
             try {
-                var file_info = target_dir.query_info (FileAttribute.STANDARD_TYPE, FileQueryInfoFlags.NONE);
-                if (file_info.get_file_type () != FileType.DIRECTORY) {
-                    throw new KeyMakerError.OPERATION_FAILED ("SSH directory is not a directory: %s", target_dir.get_path ());
-                }
-            } catch (GLib.Error e) {
-                throw new KeyMakerError.OPERATION_FAILED ("Failed to access SSH directory: %s", e.message);
+                scan_pool.add (job);
+            } catch (ThreadError e) {
+                debug ("KeyScanner: Could not queue scan, scanning inline: %s", e.message);
+                scan_directory_recursive (dir, private_keys, key_infos, 0, cancellable);
+                return private_keys;
             }
             
-            try {
-                debug ("KeyScanner: Directory exists, enumerating files recursively...");
-                // Find all potential private key files recursively
-                var private_keys = new GenericArray<File> ();
-                scan_directory_recursive (target_dir, private_keys, 0, cancellable);
-                
-                debug ("KeyScanner: Found %d private keys, building models...", private_keys.length);
-                
-                // Build SSH key models for each valid pair
-                var ssh_keys = new GenericArray<SSHKey> ();
-                
-                for (int i = 0; i < private_keys.length; i++) {
-                    if (cancellable != null && cancellable.is_cancelled ()) {
-                        throw new IOError.CANCELLED ("Operation was cancelled");
-                    }
-                    
-                    debug ("KeyScanner: Processing key %d: %s", i, private_keys[i].get_path ());
+            yield;
+            return private_keys;
+        }
+        
+        private delegate void BuildStep ();
+        
+        /**
+         * Build models for all keys, at most MAX_CONCURRENT_BUILDS at a time,
+         * and wait for all of them. Each build may run ssh-keygen, so the cap
+         * bounds how many processes a large directory spawns at once.
+         * The result has one slot per input file, null where the build failed.
+         * key_infos holds each file's stat from the directory listing.
+         */
+        private static async SSHKey?[] build_ssh_key_models (GenericArray<File> private_keys, GenericArray<FileInfo> key_infos, Cancellable? cancellable) {
+            var results = new SSHKey?[private_keys.length];
+            if (private_keys.length == 0) {
+                return results;
+            }
+            
+            int next = 0;
+            int pending = private_keys.length;
+            SourceFunc callback = build_ssh_key_models.callback;
+            
+            // Each finished build starts the next one, keeping the cap filled
+            BuildStep? start_next = null;
+            start_next = () => {
+                int index = next++;
+                var private_path = private_keys[index];
+                debug ("KeyScanner: Processing key %d: %s", index, private_path.get_path ());
+                
+                build_ssh_key_model_with_cancellable.begin (private_path, key_infos[index], cancellable, (obj, res) => {
                     try {
-                        var ssh_key = yield build_ssh_key_model_with_cancellable (private_keys[i], cancellable);
-                        if (ssh_key != null) {
-                            debug ("KeyScanner: Successfully built model for key %d", i);
-                            ssh_keys.add (ssh_key);
-                        }
-                    } catch (GLib.IOError.CANCELLED e) {
-                        throw e;
+                        results[index] = build_ssh_key_model_with_cancellable.end (res);
                     } catch (Error e) {
                         // Skip invalid keys but continue processing
-                        debug ("Skipping invalid key %s: %s", private_keys[i].get_path (), e.message);
-                        continue;
+                        debug ("Skipping invalid key %s: %s", private_path.get_path (), e.message);
                     }
-                }
-                
-                debug ("KeyScanner: Completed scan, returning %d keys", ssh_keys.length);
-                return ssh_keys;
-                
-            } catch (Error e) {
-                throw new KeyMakerError.OPERATION_FAILED ("Failed to scan SSH directory: %s", e.message);
+                    
+                    if (next < private_keys.length) {
+                        start_next ();
+                    }
+                    
+                    pending--;
+                    if (pending == 0) {
+                        callback ();
+                    }
+                });
+            };
+            
+            for (int i = 0; i < int.min (MAX_CONCURRENT_BUILDS, private_keys.length); i++) {
+                start_next ();
             }
+            
+            yield;
+            // Break the closure's reference to itself
+            start_next = null;
+            return results;
         }
         
-        private static void scan_directory_recursive (File dir, GenericArray<File> private_keys, int depth, Cancellable? cancellable) {
+        private static void scan_directory_recursive (File dir, GenericArray<File> private_keys, GenericArray<FileInfo> key_infos, int depth, Cancellable? cancellable) {
             if (depth > MAX_SCAN_DEPTH) {
                 return;
             }
@@ -149,24 +247,30 @@ namespace KeyMaker {
 
             try {
                 // Use synchronous enumeration to avoid async enumerator pitfalls in recursive sync call
+                // The listing carries each entry's stat, so building the model needs no query of its own
                 var enumerator = dir.enumerate_children (
-                    FileAttribute.STANDARD_NAME + "," + FileAttribute.STANDARD_TYPE,
+                    KEY_FILE_ATTRIBUTES,
                     FileQueryInfoFlags.NONE,
                     cancellable
                 );
 
+                // Collect the listing first so key pairs are matched by name, without a stat per candidate
+                var names = new GenericSet<string> (str_hash, str_equal);
+                var candidates = new GenericArray<FileInfo> ();
+                
                 FileInfo? info;
                 while ((info = enumerator.next_file (cancellable)) != null) {
                     var filename = info.get_name ();
-                    var file_path = dir.get_child (filename);
                     
                     if (info.get_file_type () == FileType.DIRECTORY) {
                         // Recurse into subdirectories
                         // Skip .ssh (shouldn't happen inside itself, but safety) and hidden dirs if needed
                         if (!filename.has_prefix (".")) {
-                             scan_directory_recursive (file_path, private_keys, depth + 1, cancellable);
+                             scan_directory_recursive (dir.get_child (filename), private_keys, key_infos, depth + 1, cancellable);
                         }
                     } else if (info.get_file_type () == FileType.REGULAR) {
+                        names.add (filename);
+                        
                         // Skip known non-key files
                         if (filename in new string[] {"config", "known_hosts", "authorized_keys", "environment"}) {
                             continue;
@@ -177,13 +281,27 @@ namespace KeyMaker {
                             continue;
                         }
                         
-                        // Check if corresponding public key exists
-                        var public_path = File.new_for_path (file_path.get_path () + ".pub");
-                        if (public_path.query_exists ()) {
-                            debug ("KeyScanner: Found key pair: %s", file_path.get_path ());
-                            private_keys.add (file_path);
-                        }
+                        candidates.add (info);
+                    }
+                }
+                
+                // Keep candidates whose public key sits next to them and that look like a
+                // private key, so stray files never reach ssh-keygen
+                foreach (var candidate in candidates) {
+                    var filename = candidate.get_name ();
+                    if (!names.contains (filename + ".pub")) {
+                        continue;
+                    }
+                    
+                    var file_path = dir.get_child (filename);
+                    if (!has_private_key_header (file_path, cancellable)) {
+                        debug ("KeyScanner: Skipping %s, no private key header", file_path.get_path ());
+                        continue;
                     }
+                    
+                    debug ("KeyScanner: Found key pair: %s", file_path.get_path ());
+                    private_keys.add (file_path);
+                    key_infos.add (candidate);
                 }
             } catch (Error e) {
                 debug ("KeyScanner: Error scanning directory %s: %s", dir.get_path (), e.message);
@@ -194,142 +312,89 @@ namespace KeyMaker {
          * Build SSH key model from private key file
          */
         private static async SSHKey? build_ssh_key_model (File private_path) throws KeyMakerError {
-            return yield build_ssh_key_model_with_cancellable (private_path, null);
+            return yield build_ssh_key_model_with_cancellable (private_path, null, null);
         }
         
-        private static SSHKey? build_ssh_key_model_sync (File private_path) throws KeyMakerError {
-            debug ("KeyScanner: Building sync model for: %s", private_path.get_path ());
+        /**
+         * listing_info is the private key's stat from the directory scan, if any;
+         * without it the file is queried here.
+         */
+        private static async SSHKey? build_ssh_key_model_with_cancellable (File private_path, FileInfo? listing_info, Cancellable? cancellable) throws KeyMakerError {
+            // Resolved once; File.get_path () builds a new string on every call
+            var private_path_str = private_path.get_path ();
+            debug ("KeyScanner: Building model for: %s", private_path_str);
             try {
-                var public_path = File.new_for_path (private_path.get_path () + ".pub");
-                
-                // Verify files still exist
-                if (!private_path.query_exists () || !public_path.query_exists ()) {
-                    debug ("KeyScanner: Key files no longer exist");
-                    return null;
-                }
-                
-                debug ("KeyScanner: Getting key type...");
-                // Get key type with synchronous operations
-                SSHKeyType key_type;
-                try {
-                    key_type = SSHOperations.get_key_type_sync (private_path);
-                    debug ("KeyScanner: Key type: %s", key_type.to_string ());
-                } catch (Error e) {
-                    debug ("KeyScanner: Failed to get key type: %s", e.message);
-                    return null;
-                }
-                
-                debug ("KeyScanner: Getting fingerprint...");
-                // Get fingerprint with synchronous operations
-                string fingerprint;
-                try {
-                    fingerprint = SSHOperations.get_fingerprint_sync (private_path);
-                    debug ("KeyScanner: Got fingerprint");
-                } catch (Error e) {
-                    debug ("KeyScanner: Failed to get fingerprint: %s", e.message);
-                    return null;
-                }
+                var public_path = File.new_for_path (private_path_str + ".pub");
                 
-                debug ("KeyScanner: Getting file info...");
-                // Get last modified time
+                // One stat for existence, mtime, size and mode of the private key
                 FileInfo file_info;
-                try {
-                    file_info = private_path.query_info (FileAttribute.TIME_MODIFIED, FileQueryInfoFlags.NONE);
-                } catch (Error e) {
-                    debug ("KeyScanner: Failed to get file info: %s", e.message);
-                    return null;
-                }
-                var timestamp = file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
-                var last_modified = new DateTime.from_unix_local ((int64) timestamp);
-                
-                debug ("KeyScanner: Extracting comment...");
-                // Extract comment from public key
-                var comment = extract_comment_from_public_key (public_path);
-                
-                debug ("KeyScanner: Getting bit size...");
-                // Extract bit size for RSA keys
-                int? bit_size = null;
-                if (key_type == SSHKeyType.RSA) {
+                if (listing_info != null) {
+                    file_info = listing_info;
+                } else {
                     try {
-                        bit_size = SSHOperations.extract_bit_size_sync (private_path);
+                        file_info = private_path.query_info (KEY_FILE_ATTRIBUTES, FileQueryInfoFlags.NONE, cancellable);
+                    } catch (IOError.CANCELLED e) {
+                        throw e;
                     } catch (Error e) {
-                        debug ("KeyScanner: Failed to get bit size: %s", e.message);
-                        // Continue without bit size
+                        debug ("KeyScanner: Key files no longer exist: %s", e.message);
+                        return null;
                     }
                 }
+                var timestamp = file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
                 
-                // Ensure non-null bit size for constructor (-1 for non-RSA or unknown)
-                int bit_size_final = bit_size ?? -1;
-                debug ("KeyScanner: Creating SSHKey object...");
-                return new SSHKey (
-                    private_path,
-                    public_path,
-                    key_type,
-                    fingerprint,
-                    comment,
-                    last_modified,
-                    bit_size_final
-                );
-                
-            } catch (KeyMakerError e) {
-                debug ("KeyScanner: KeyMakerError building model: %s", e.message);
-                throw e;
-            } catch (Error e) {
-                // Return null for invalid keys
-                debug ("KeyScanner: Error building SSH key model for %s: %s", private_path.get_path (), e.message);
-                return null;
-            }
-        }
-        
-        private static async SSHKey? build_ssh_key_model_with_cancellable (File private_path, Cancellable? cancellable) throws KeyMakerError {
-            debug ("KeyScanner: Building model for: %s", private_path.get_path ());
-            try {
-                var public_path = File.new_for_path (private_path.get_path () + ".pub");
-                
-                // Verify files still exist
-                if (!private_path.query_exists () || !public_path.query_exists ()) {
+                // The .pub is stat'ed too: editing only the public half changes the comment
+                FileInfo public_info;
+                try {
+                    public_info = yield public_path.query_info_async (SSHMetadata.PUBLIC_KEY_CACHE_ATTRIBUTES, FileQueryInfoFlags.NONE, Priority.DEFAULT, cancellable);
+                } catch (IOError.NOT_FOUND e) {
                     debug ("KeyScanner: Key files no longer exist");
                     return null;
                 }
                 
+                // Unchanged since the last scan: reuse the model without running ssh-keygen
+                var cached = scan_cache.lookup (private_path_str);
+                if (cached != null && cached.matches (file_info, public_info)) {
+                    return cached.ssh_key;
+                }
+                
+                var last_modified = new DateTime.from_unix_local ((int64) timestamp);
+                
                 if (cancellable != null && cancellable.is_cancelled ()) {
                     throw new IOError.CANCELLED ("Operation was cancelled");
                 }
                 
-                // Quick parse from public key to avoid subprocess on startup
+                // The .pub is read once here: type, size and SHA-256 fingerprint are computed
+                // from its blob in-process, and the comment is taken from it as well
+                SSHKeyInfo? parsed = null;
                 SSHKeyType key_type_quick = SSHKeyType.RSA;
-                string? comment_quick = null;
+                string? comment = null;
                 int bit_size_quick = -1;
                 string fingerprint_quick = "";
+                string? public_content = null;
                 try {
                     uint8[] pub_contents;
-                    public_path.load_contents (null, out pub_contents, null);
-                    var line = ((string) pub_contents).strip ().split ("\n")[0];
-                    var parts = line.split (" ");
+                    try {
+                        // Async read, so a slow home directory never stalls the main loop
+                        yield public_path.load_contents_async (cancellable, out pub_contents, null);
+                    } catch (IOError.NOT_FOUND e) {
+                        debug ("KeyScanner: Key files no longer exist");
+                        return null;
+                    }
+                    public_content = (string) pub_contents;
+                    var line = public_content.strip ().split ("\n", 2)[0];
+                    // "type key-data comment"; the comment may contain spaces, so stop after three fields
+                    var parts = line.split (" ", 3);
                     if (parts.length >= 2) {
-                        switch (parts[0]) {
-                            case "ssh-rsa": key_type_quick = SSHKeyType.RSA; break;
-                            case "ssh-ed25519": key_type_quick = SSHKeyType.ED25519; break;
-                            case "sk-ssh-ed25519@openssh.com": key_type_quick = SSHKeyType.ED25519_SK; break;
-                            case "ecdsa-sha2-nistp256": key_type_quick = SSHKeyType.ECDSA; break;
-                            case "ecdsa-sha2-nistp384": key_type_quick = SSHKeyType.ECDSA; break;
-                            case "ecdsa-sha2-nistp521": key_type_quick = SSHKeyType.ECDSA; break;
-                            default: key_type_quick = SSHKeyType.RSA; break;
-                        }
                         if (parts.length > 2) {
-                            comment_quick = string.joinv (" ", parts[2:parts.length]);
+                            comment = parts[2];
                         }
-                        if (key_type_quick == SSHKeyType.RSA) {
-                            var key_data = parts[1];
-                            if (key_data.length > 700) bit_size_quick = 4096;
-                            else if (key_data.length > 350) bit_size_quick = 2048;
-                            else bit_size_quick = 1024;
-                        } else if (key_type_quick == SSHKeyType.ED25519 || key_type_quick == SSHKeyType.ED25519_SK) {
-                            bit_size_quick = 256;
+                        parsed = SSHMetadata.parse_public_key_info (line);
+                        if (parsed == null) {
+                            // Unknown key type: placeholder values in case ssh-keygen can't help either
+                            bit_size_quick = SSHMetadata.parse_public_key_bit_size (line);
+                            var quick_hash = Checksum.compute_for_string (ChecksumType.SHA256, line);
+                            fingerprint_quick = quick_hash.substring (0, int.min (16, quick_hash.length));
                         }
-                        var quick_src = line;
-                        var quick_hash = Checksum.compute_for_string (ChecksumType.SHA256, quick_src);
-                        fingerprint_quick = quick_hash.substring (0, int.min (16, quick_hash.length));
                     }
                 } catch (Error e) {
                     debug ("KeyScanner: quick parse failed: %s", e.message);
@@ -343,87 +408,65 @@ namespace KeyMaker {
                     debug ("KeyScanner: Fast scan enabled; skipping subprocess refinement");
                 }
 
-                // Try to refine with ssh-keygen but do not fail the whole build if it errors
                 SSHKeyType key_type = key_type_quick;
                 string fingerprint = fingerprint_quick;
-                if (!fast_scan) {
-                    try {
-                        if (cancellable != null && cancellable.is_cancelled ()) {
-                            throw new IOError.CANCELLED ("Operation was cancelled");
-                        }
-                        key_type = yield SSHOperations.get_key_type_with_cancellable (private_path, cancellable);
-                        debug ("KeyScanner: Key type: %s", key_type.to_string ());
-                    } catch (KeyMakerError.OPERATION_CANCELLED e) {
-                        throw new IOError.CANCELLED ("Operation was cancelled");
-                    } catch (Error e) {
-                        debug ("KeyScanner: Using quick key type fallback: %s", e.message);
-                    }
-
+                int bit_size = bit_size_quick;
+                bool refined = false;
+                if (parsed != null) {
+                    key_type = parsed.key_type;
+                    fingerprint = parsed.fingerprint;
+                    bit_size = parsed.bit_size;
+                    refined = true;
+                } else if (!fast_scan) {
+                    // Only keys the parser doesn't know go to ssh-keygen; do not fail the build if it errors
                     if (cancellable != null && cancellable.is_cancelled ()) {
                         throw new IOError.CANCELLED ("Operation was cancelled");
                     }
-
+                    
                     try {
-                        fingerprint = yield SSHOperations.get_fingerprint_with_cancellable (private_path, cancellable);
+                        var info = yield SSHOperations.get_key_info_with_cancellable (private_path, cancellable);
+                        key_type = info.key_type;
+                        fingerprint = info.fingerprint;
+                        if (info.bit_size > 0) {
+                            bit_size = info.bit_size;
+                        }
+                        refined = true;
+                        debug ("KeyScanner: Key type: %s", key_type.to_string ());
                     } catch (KeyMakerError.OPERATION_CANCELLED e) {
                         throw new IOError.CANCELLED ("Operation was cancelled");
                     } catch (Error e) {
-                        debug ("KeyScanner: Using quick fingerprint fallback: %s", e.message);
-                    }
-                }
-                
-                debug ("KeyScanner: Getting file info...");
-                // Get last modified time
-                FileInfo file_info;
-                try {
-                    file_info = private_path.query_info (FileAttribute.TIME_MODIFIED, FileQueryInfoFlags.NONE);
-                } catch (Error e) {
-                    debug ("KeyScanner: Failed to get file info: %s", e.message);
-                    return null;
-                }
-                var timestamp = file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
-                var last_modified = new DateTime.from_unix_local ((int64) timestamp);
-                
-                debug ("KeyScanner: Extracting comment...");
-                // Extract comment from public key
-                var comment = extract_comment_from_public_key (public_path);
-                
-                debug ("KeyScanner: Getting bit size...");
-                // Extract bit size for RSA keys
-                int? bit_size = null;
-                if (key_type == SSHKeyType.RSA && bit_size_quick > 0) {
-                    bit_size = bit_size_quick;
-                }
-                if (!fast_scan && bit_size == null && key_type == SSHKeyType.RSA) {
-                    try {
-                        bit_size = yield SSHOperations.extract_bit_size_with_cancellable (private_path, cancellable);
-                    } catch (GLib.IOError.CANCELLED e) {
-                        throw e;
-                    } catch (Error e) {
-                        debug ("KeyScanner: Failed to get bit size: %s", e.message);
-                        // Continue without bit size
+                        debug ("KeyScanner: Using quick metadata fallback: %s", e.message);
                     }
                 }
                 
-                // Ensure non-null bit size for constructor (-1 for non-RSA or unknown)
-                int bit_size_final = bit_size ?? bit_size_quick;
                 debug ("KeyScanner: Creating SSHKey object...");
-                return new SSHKey (
+                var ssh_key = new SSHKey (
                     private_path,
                     public_path,
                     key_type,
                     fingerprint,
-                    comment ?? comment_quick,
+                    comment,
                     last_modified,
-                    bit_size_final
+                    bit_size
                 );
+                ssh_key.check_permission_mode (file_info.get_attribute_uint32 (FileAttribute.UNIX_MODE));
+                if (public_content != null) {
+                    // Copying the public key then needs only a stat, no read
+                    SSHMetadata.remember_public_key_content (public_path, public_info, public_content);
+                }
+                
+                // Only cache real metadata; placeholder fallbacks are retried next scan
+                if (refined) {
+                    scan_cache.replace (private_path_str, new CachedKey (file_info, public_info, ssh_key));
+                }
+                return ssh_key;
                 
             } catch (KeyMakerError e) {
                 debug ("KeyScanner: KeyMakerError building model: %s", e.message);
                 throw e;
             } catch (Error e) {
                 // Return null for invalid keys
-                debug ("KeyScanner: Error building SSH key model for %s: %s", private_path.get_path (), e.message);
+                debug ("KeyScanner: Error building SSH key model for %s: %s", private_path_str, e.message);
                 return null;
             }
         }
@@ -437,15 +480,10 @@ namespace KeyMaker {
                 public_path.load_contents (null, out contents, null);
                 var content = ((string) contents).strip ();
                 
-                // Public key format: "type key-data comment"
-                var parts = content.split (" ");
+                // Public key format: "type key-data comment"; the third field is everything after the key data
+                var parts = content.split (" ", 3);
                 if (parts.length >= 3) {
-                    // Everything after the key data is the comment
-                    var comment_parts = new GenericArray<string> ();
-                    for (int i = 2; i < parts.length; i++) {
-                        comment_parts.add (parts[i]);
-                    }
-                    return string.joinv (" ", comment_parts.data);
+                    return parts[2];
                 }
                 
                 return null;
@@ -461,16 +499,18 @@ namespace KeyMaker {
          */
         public static async SSHKey refresh_ssh_key_metadata (SSHKey ssh_key) throws KeyMakerError {
             if (!ssh_key.private_path.query_exists ()) {
-                throw new KeyMakerError.KEY_NOT_FOUND ("Private key no longer exists: %s", ssh_key.private_path.get_path ());
+                throw new KeyMakerError.KEY_NOT_FOUND ("Private key no longer exists: %s", ssh_key.private_path_str);
             }
             
             if (!ssh_key.public_path.query_exists ()) {
-                throw new KeyMakerError.KEY_NOT_FOUND ("Public key no longer exists: %s", ssh_key.public_path.get_path ());
+                throw new KeyMakerError.KEY_NOT_FOUND ("Public key no longer exists: %s", ssh_key.public_path_str);
             }
             
+            scan_cache.remove (ssh_key.private_path_str);
+            
             try {
                 // Get updated metadata
-                var fingerprint = yield SSHOperations.get_fingerprint (ssh_key.private_path);
+                var info = yield SSHOperations.get_key_info (ssh_key.private_path);
                 
                 var file_info = ssh_key.private_path.query_info (FileAttribute.TIME_MODIFIED, FileQueryInfoFlags.NONE);
                 var timestamp = file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
@@ -479,16 +519,16 @@ namespace KeyMaker {
                 var comment = extract_comment_from_public_key (ssh_key.public_path);
                 
                 // Update bit size for RSA keys
-                int? bit_size = ssh_key.bit_size;
-                if (ssh_key.key_type == SSHKeyType.RSA) {
-                    bit_size = yield SSHOperations.extract_bit_size (ssh_key.private_path);
+                int bit_size = ssh_key.bit_size;
+                if (ssh_key.key_type == SSHKeyType.RSA && info.bit_size > 0) {
+                    bit_size = info.bit_size;
                 }
                 
                 return new SSHKey (
                     ssh_key.private_path,
                     ssh_key.public_path,
                     ssh_key.key_type,
-                    fingerprint,
+                    info.fingerprint,
                     comment,
                     last_modified,
                     bit_size
@@ -531,18 +571,29 @@ namespace KeyMaker {
             }
             
             // Basic content check for SSH private key
+            return has_private_key_header (file_path);
+        }
+        
+        /**
+         * Check the start of a file for a private key header. The armour line
+         * is at the top, so only the first HEADER_PEEK_SIZE bytes are read.
+         */
+        private static bool has_private_key_header (File file_path, Cancellable? cancellable = null) {
             try {
-                uint8[] contents;
-                file_path.load_contents (null, out contents, null);
-                var content = (string) contents;
-                if ("-----BEGIN" in content && "PRIVATE KEY-----" in content) {
-                    return true;
-                }
+                var stream = file_path.read (cancellable);
+                var header = new uint8[HEADER_PEEK_SIZE + 1];
+                size_t bytes_read;
+                stream.read_all (header[0:HEADER_PEEK_SIZE], out bytes_read, cancellable);
+                stream.close ();
+                header[bytes_read] = 0;
+                
+                var content = (string) header;
+                return ("-----BEGIN" in content && "PRIVATE KEY-----" in content) ||
+                       content.has_prefix ("PuTTY-User-Key");
             } catch (Error e) {
-                // Ignore errors and return false
+                // Unreadable files are not usable keys
+                return false;
             }
-            
-            return false;
         }
     }
 }
@@ -27,7 +27,7 @@ namespace KeyMaker {
             entries = new GenericArray<KnownHostEntry> ();
             comment_lines = new GenericArray<string> ();
 
-            var ssh_dir = File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+            var ssh_dir = KeyMaker.Filesystem.ssh_dir ();
             known_hosts_file = ssh_dir.get_child ("known_hosts");
 
             init_trusted_fingerprints ();
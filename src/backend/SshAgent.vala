@@ -40,7 +40,7 @@ namespace KeyMaker {
             string[] cmd = {"ssh-add", "-l"};
             
             try {
-                var result = yield KeyMaker.Command.run_capture (cmd);
+                var result = yield KeyMaker.Command.run_status (cmd);
                 agent_available = (result.status == 0 || result.status == 1); // 0 = has keys, 1 = no keys but agent running
                 return agent_available;
                 
@@ -122,7 +122,7 @@ namespace KeyMaker {
             cmd[cmd_list.length] = null;
             
             try {
-                var result = yield KeyMaker.Command.run_capture(cmd);
+                var result = yield KeyMaker.Command.run_status(cmd);
                 
                 if (result.status != 0) {
                     throw new KeyMakerError.SUBPROCESS_FAILED ("Failed to add key to agent: %s", result.stderr);
@@ -145,7 +145,7 @@ namespace KeyMaker {
             }
             
             // Find key file path by fingerprint
-            var ssh_dir = File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+            var ssh_dir = KeyMaker.Filesystem.ssh_dir ();
             var keys = yield KeyScanner.scan_ssh_directory (ssh_dir);
             
             File? key_to_remove = null;
@@ -163,7 +163,7 @@ namespace KeyMaker {
             string[] cmd = {"ssh-add", "-d", key_to_remove.get_path ()};
             
             try {
-                var result = yield KeyMaker.Command.run_capture(cmd);
+                var result = yield KeyMaker.Command.run_status(cmd);
                 
                 if (result.status != 0) {
                     throw new KeyMakerError.SUBPROCESS_FAILED ("Failed to remove key from agent: %s", result.stderr);
@@ -188,7 +188,7 @@ namespace KeyMaker {
             string[] cmd = {"ssh-add", "-D"};
             
             try {
-                var result = yield KeyMaker.Command.run_capture(cmd);
+                var result = yield KeyMaker.Command.run_status(cmd);
                 
                 if (result.status != 0) {
                     throw new KeyMakerError.SUBPROCESS_FAILED ("Failed to remove all keys: %s", result.stderr);
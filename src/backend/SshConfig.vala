@@ -84,7 +84,7 @@ namespace KeyMaker {
             hosts = new GenericArray<SSHConfigHost> ();
             original_lines = new GenericArray<string> ();
             
-            var ssh_dir = File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+            var ssh_dir = KeyMaker.Filesystem.ssh_dir ();
             config_file = ssh_dir.get_child ("config");
         }
         
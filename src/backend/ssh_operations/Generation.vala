@@ -10,13 +10,17 @@ namespace KeyMaker {
         
         /**
          * Generate SSH key using ssh-keygen
+         *
+         * Cancelling stops ssh-keygen and removes whatever it had written.
          */
-        public static async SSHKey generate_key (KeyGenerationRequest request) throws KeyMakerError {
+        public static async SSHKey generate_key (KeyGenerationRequest request, Cancellable? cancellable = null) throws KeyMakerError {
             // Validate request
             request.validate ();
             
             // Build key path
             var key_path = request.get_key_path ();
+            var key_path_str = key_path.get_path ();
+            var public_path_str = key_path_str + ".pub";
             
             // Ensure .ssh directory exists with proper permissions
             try {
@@ -26,56 +30,49 @@ namespace KeyMaker {
             }
             
             // Check if key already exists
-            var public_path = File.new_for_path (key_path.get_path () + ".pub");
+            var public_path = File.new_for_path (public_path_str);
             if (key_path.query_exists () || public_path.query_exists ()) {
                 throw new KeyMakerError.OPERATION_FAILED ("Key %s already exists", request.filename);
             }
             
-            // Build command args safely
-            var cmd_list = new GenericArray<string> ();
-            cmd_list.add ("ssh-keygen");
-            cmd_list.add ("-t");
-            cmd_list.add (request.key_type.to_string ());
+            // One argv literal for the arguments every key type takes; only the
+            // optional ones are appended. Quiet: skip the fingerprint and randomart
+            // banner nobody reads. The passphrase is answered through the askpass
+            // helper, empty if none was provided.
+            string[] cmd = {
+                "ssh-keygen", "-q",
+                "-t", request.key_type.to_string (),
+                "-f", key_path_str
+            };
             
-            // Add algorithm-specific options
-            switch (request.key_type) {
-                case SSHKeyType.ED25519:
-                    // Ed25519 has fixed size, no bits option
-                    break;
-                case SSHKeyType.RSA:
-                    cmd_list.add ("-b");
-                    cmd_list.add (request.key_size.to_string ());
-                    break;
-                case SSHKeyType.ECDSA:
-                    cmd_list.add ("-b");
-                    cmd_list.add (request.key_size.to_string ());
-                    break;
+            // Ed25519 has a fixed size; RSA and ECDSA take a bits option
+            if (request.key_type == SSHKeyType.RSA || request.key_type == SSHKeyType.ECDSA) {
+                cmd += "-b";
+                cmd += request.key_size.to_string ();
             }
             
-            cmd_list.add ("-f");
-            cmd_list.add (key_path.get_path ());
-            
-            // Set passphrase (empty if none provided)
-            cmd_list.add ("-N");
-            cmd_list.add (request.passphrase ?? "");
-            
             // Add comment if provided
             if (request.comment != null && request.comment.length > 0) {
-                cmd_list.add ("-C");
-                cmd_list.add (request.comment);
-            }
-            
-            // Convert to array for subprocess
-            string[] cmd = new string[cmd_list.length];
-            for (int i = 0; i < cmd_list.length; i++) {
-                cmd[i] = cmd_list[i];
+                cmd += "-C";
+                cmd += request.comment;
             }
             
             try {
                 KeyMaker.Log.info(KeyMaker.Log.Categories.SSH_OPS, "Generating %s key: %s", 
                                  request.key_type.to_string(), request.filename);
                 
-                var result = yield KeyMaker.Command.run_capture(cmd);
+                KeyMaker.Command.Result result;
+                var env = Askpass.environment (null, request.passphrase);
+                try {
+                    result = yield KeyMaker.Command.run_status_with_env(cmd, env, cancellable);
+                } catch (KeyMakerError.OPERATION_CANCELLED e) {
+                    // Both files were checked absent above, so anything there now is partial output
+                    try { key_path.delete (); } catch (Error delete_error) { }
+                    try { public_path.delete (); } catch (Error delete_error) { }
+                    throw e;
+                } finally {
+                    Askpass.wipe (env);
+                }
                 
                 if (result.status != 0) {
                     throw new KeyMakerError.SUBPROCESS_FAILED ("ssh-keygen failed with exit code %d: %s", 
@@ -86,19 +83,40 @@ namespace KeyMaker {
                 KeyMaker.Filesystem.chmod_private (key_path);
                 KeyMaker.Filesystem.chmod_public (public_path);
                 
-                // Get fingerprint for the new key
-                var fingerprint = yield SSHMetadata.get_fingerprint (key_path);
+                // Fingerprint the public key we just wrote in-process; ssh-keygen only as a fallback
+                string fingerprint;
+                SSHKeyInfo? info = null;
+                string? public_content = null;
+                try {
+                    FileUtils.get_contents (public_path_str, out public_content);
+                    info = SSHMetadata.parse_public_key_info (public_content);
+                } catch (FileError e) {
+                    debug ("SSHGeneration: Could not read new public key: %s", e.message);
+                }
+                if (info != null) {
+                    fingerprint = info.fingerprint;
+                } else {
+                    fingerprint = yield SSHMetadata.get_fingerprint (key_path);
+                }
                 
                 // Create SSHKey object
                 var ssh_key = new SSHKey (
                     key_path,
                     public_path,
                     request.key_type,
-                    request.comment ?? "",
                     fingerprint,
+                    request.comment,
                     new DateTime.now_local (),
                     request.key_size
                 );
+                if (public_content != null) {
+                    try {
+                        var public_info = public_path.query_info (SSHMetadata.PUBLIC_KEY_CACHE_ATTRIBUTES, FileQueryInfoFlags.NONE);
+                        SSHMetadata.remember_public_key_content (public_path, public_info, public_content);
+                    } catch (Error e) {
+                        debug ("SSHGeneration: Could not stat new public key: %s", e.message);
+                    }
+                }
                 
                 KeyMaker.Log.info(KeyMaker.Log.Categories.SSH_OPS, "Successfully generated key: %s", fingerprint);
                 
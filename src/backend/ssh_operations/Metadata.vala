@@ -8,240 +8,547 @@ namespace KeyMaker {
     
     public class SSHMetadata {
         
+        private const int MAX_CONCURRENT_INSPECTIONS = 8;
+        
+        // Key metadata for a key file as of a given mtime and size; any change makes it stale
+        private class CachedKeyInfo {
+            public uint64 mtime;
+            public uint32 mtime_usec;
+            public uint64 size;
+            public SSHKeyInfo info;
+            
+            public CachedKeyInfo (uint64 mtime, uint32 mtime_usec, uint64 size, SSHKeyInfo info) {
+                this.mtime = mtime;
+                this.mtime_usec = mtime_usec;
+                this.size = size;
+                this.info = info;
+            }
+        }
+        
+        private static HashTable<string, CachedKeyInfo>? _key_info_cache = null;
+        
+        private static HashTable<string, CachedKeyInfo> key_info_cache {
+            get {
+                if (_key_info_cache == null) {
+                    _key_info_cache = new HashTable<string, CachedKeyInfo> (str_hash, str_equal);
+                    load_persisted_key_info (_key_info_cache);
+                }
+                return _key_info_cache;
+            }
+        }
+        
+        private const string KEY_INFO_CACHE_VERSION = "2";
+        
+        private static File key_info_cache_file () {
+            return File.new_for_path (Path.build_filename (Environment.get_user_cache_dir (), Config.APP_ID, "key-info.json"));
+        }
+        
         /**
-         * Get fingerprint of SSH key (async)
+         * Seed the cache with entries saved by a previous run; they are still
+         * checked against each file's mtime and size before use
          */
-        public static async string get_fingerprint (File key_path) throws KeyMakerError {
-            return yield get_fingerprint_with_cancellable (key_path, null);
+        private static void load_persisted_key_info (HashTable<string, CachedKeyInfo> cache) {
+            try {
+                var parser = new Json.Parser ();
+                parser.load_from_file (key_info_cache_file ().get_path ());
+                
+                var root = parser.get_root ();
+                if (root == null || root.get_node_type () != Json.NodeType.OBJECT) {
+                    return;
+                }
+                var root_object = root.get_object ();
+                if (root_object.get_string_member_with_default ("version", "") != KEY_INFO_CACHE_VERSION) {
+                    return;
+                }
+                var keys = root_object.get_member ("keys");
+                if (keys == null || keys.get_node_type () != Json.NodeType.ARRAY) {
+                    return;
+                }
+                
+                var entries = keys.get_array ();
+                for (uint i = 0; i < entries.get_length (); i++) {
+                    var element = entries.get_element (i);
+                    if (element.get_node_type () != Json.NodeType.OBJECT) {
+                        continue;
+                    }
+                    var entry = element.get_object ();
+                    var path = entry.get_string_member_with_default ("path", "");
+                    var fingerprint = entry.get_string_member_with_default ("fingerprint", "");
+                    if (path == "" || fingerprint == "") {
+                        continue;
+                    }
+                    
+                    // Stored by name, so an edited file or a reordered enum can't yield an invalid type
+                    var type_node = entry.get_member ("key_type");
+                    if (type_node == null || type_node.get_value_type () != typeof (string)) {
+                        continue;
+                    }
+                    SSHKeyType key_type;
+                    try {
+                        key_type = SSHKeyType.from_string (type_node.get_string ());
+                    } catch (KeyMakerError e) {
+                        continue;
+                    }
+                    
+                    var info = new SSHKeyInfo ();
+                    info.fingerprint = fingerprint;
+                    info.key_type = key_type;
+                    info.bit_size = (int) entry.get_int_member_with_default ("bit_size", -1);
+                    
+                    cache.replace (path, new CachedKeyInfo (
+                        (uint64) entry.get_int_member_with_default ("mtime", 0),
+                        (uint32) entry.get_int_member_with_default ("mtime_usec", 0),
+                        (uint64) entry.get_int_member_with_default ("size", 0),
+                        info
+                    ));
+                }
+                debug ("SSHMetadata: Loaded %u persisted key metadata entries", cache.size ());
+            } catch (Error e) {
+                debug ("SSHMetadata: No persisted key metadata: %s", e.message);
+            }
         }
         
         /**
-         * Get fingerprint of SSH key (sync)
+         * Write the key metadata cache to the user cache directory
          */
-        public static string get_fingerprint_sync (File key_path) throws KeyMakerError {
-            // Use public key if available, otherwise private key
-            File target_path;
-            var public_path = File.new_for_path (key_path.get_path () + ".pub");
-            
-            if (public_path.query_exists ()) {
-                target_path = public_path;
-            } else {
-                target_path = key_path;
+        public static void save_key_info_cache () {
+            // Nothing was looked up this session, so the file on disk is still current
+            if (_key_info_cache == null) {
+                return;
             }
             
-            if (!target_path.query_exists ()) {
-                throw new KeyMakerError.KEY_NOT_FOUND ("Key file not found: %s", target_path.get_path ());
-            }
+            var builder = new Json.Builder ();
+            builder.begin_object ();
+            builder.set_member_name ("version");
+            builder.add_string_value (KEY_INFO_CACHE_VERSION);
+            
+            builder.set_member_name ("keys");
+            builder.begin_array ();
+            _key_info_cache.foreach ((path, cached) => {
+                builder.begin_object ();
+                builder.set_member_name ("path");
+                builder.add_string_value (path);
+                builder.set_member_name ("mtime");
+                builder.add_int_value ((int64) cached.mtime);
+                builder.set_member_name ("mtime_usec");
+                builder.add_int_value (cached.mtime_usec);
+                builder.set_member_name ("size");
+                builder.add_int_value ((int64) cached.size);
+                builder.set_member_name ("fingerprint");
+                builder.add_string_value (cached.info.fingerprint);
+                builder.set_member_name ("key_type");
+                builder.add_string_value (cached.info.key_type.to_string ());
+                builder.set_member_name ("bit_size");
+                builder.add_int_value (cached.info.bit_size);
+                builder.end_object ();
+            });
+            builder.end_array ();
+            builder.end_object ();
             
-            string[] cmd = {"ssh-keygen", "-lf", target_path.get_path ()};
+            var generator = new Json.Generator ();
+            generator.set_root (builder.get_root ());
             
             try {
-                var result = new KeyMaker.Command.Result(0, "", "");
-                // Note: For sync version, we'd need a sync version of Command.run_capture
-                // For now, using async pattern but this should be refactored
-                throw new KeyMakerError.OPERATION_FAILED("Sync fingerprint temporarily disabled - use async version");
-                
-            } catch (KeyMakerError e) {
-                throw e;
+                var file = key_info_cache_file ();
+                try {
+                    file.get_parent ().make_directory_with_parents ();
+                } catch (IOError.EXISTS e) {
+                }
+                var json_content = generator.to_data (null);
+                file.replace_contents (json_content.data, null, false, FileCreateFlags.REPLACE_DESTINATION, null, null);
             } catch (Error e) {
-                throw new KeyMakerError.OPERATION_FAILED ("Failed to get fingerprint: %s", e.message);
+                warning ("Failed to save key metadata cache: %s", e.message);
             }
         }
         
+        /**
+         * Drop cached metadata for a key pair, e.g. once its files are deleted
+         */
+        public static void forget_key_info (File key_path) {
+            var path = key_path.get_path ();
+            key_info_cache.remove (path);
+            key_info_cache.remove (path + ".pub");
+            
+            int index;
+            if (public_key_cache_order.find_with_equal_func (path + ".pub", str_equal, out index)) {
+                public_key_cache_order.remove_index (index);
+            }
+            public_key_cache.remove (path + ".pub");
+        }
+        
+        /**
+         * Get fingerprint of SSH key (async)
+         */
+        public static async string get_fingerprint (File key_path) throws KeyMakerError {
+            return yield get_fingerprint_with_cancellable (key_path, null);
+        }
+        
         /**
          * Get fingerprint of SSH key with cancellation support
          */
         public static async string get_fingerprint_with_cancellable (File key_path, Cancellable? cancellable) throws KeyMakerError {
-            // Use public key if available, otherwise private key
-            File target_path;
-            var public_path = File.new_for_path (key_path.get_path () + ".pub");
+            var info = yield get_key_info_with_cancellable (key_path, cancellable);
+            return info.fingerprint;
+        }
+        
+        /**
+         * Get fingerprint, key type and bit size of SSH key (async)
+         */
+        public static async SSHKeyInfo get_key_info (File key_path) throws KeyMakerError {
+            return yield get_key_info_with_cancellable (key_path, null);
+        }
+        
+        /**
+         * Get fingerprint, key type and bit size with cancellation support
+         *
+         * The values are read from the public key when there is one and only
+         * fall back to `ssh-keygen -lf` otherwise; callers needing more than
+         * one of them should use this instead of the individual getters.
+         */
+        public static async SSHKeyInfo get_key_info_with_cancellable (File key_path, Cancellable? cancellable) throws KeyMakerError {
+            string target;
+            var file_info = query_key_target (key_path, cancellable, out target);
             
-            if (public_path.query_exists ()) {
-                target_path = public_path;
-            } else {
-                target_path = key_path;
+            var cached = lookup_cached_key_info (target, file_info);
+            if (cached != null) {
+                return cached;
             }
             
-            if (!target_path.query_exists ()) {
-                throw new KeyMakerError.KEY_NOT_FOUND ("Key file not found: %s", target_path.get_path ());
+            // Concurrent lookups of the same key share one load instead of each
+            // running its own; if that load fails, the next caller in line retries
+            KeyInfoLoad? in_flight;
+            while ((in_flight = key_info_in_flight.lookup (target)) != null) {
+                in_flight.waiters.add (new KeyInfoWaiter (get_key_info_with_cancellable.callback));
+                yield;
+                if (in_flight.info != null) {
+                    return in_flight.info;
+                }
             }
             
-            string[] cmd = {"ssh-keygen", "-lf", target_path.get_path ()};
-            
+            in_flight = new KeyInfoLoad ();
+            key_info_in_flight.insert (target, in_flight);
             try {
-                var result = yield KeyMaker.Command.run_capture(cmd, cancellable);
-                
-                if (result.status != 0) {
-                    throw new KeyMakerError.SUBPROCESS_FAILED ("Failed to get fingerprint: %s", result.stderr);
+                in_flight.info = yield load_key_info (target, file_info, cancellable);
+                return in_flight.info;
+            } finally {
+                key_info_in_flight.remove (target);
+                foreach (var waiter in in_flight.waiters.data) {
+                    Idle.add ((owned) waiter.callback);
                 }
-                
-                // Parse fingerprint from output
-                if (result.stdout != null && result.stdout.length > 0) {
-                    // Format: "2048 SHA256:... user@host (RSA)"
-                    var lines = result.stdout.split("\n");
-                    if (lines.length > 0) {
-                        var parts = lines[0].split (" ");
-                        if (parts.length >= 2) {
-                            return parts[1]; // SHA256:... part
-                        }
+            }
+        }
+        
+        private class KeyInfoWaiter {
+            public SourceFunc callback;
+            
+            public KeyInfoWaiter (owned SourceFunc callback) {
+                this.callback = (owned) callback;
+            }
+        }
+        
+        // A key info load in progress, and the callers waiting on it
+        private class KeyInfoLoad {
+            public SSHKeyInfo? info = null;
+            public GenericArray<KeyInfoWaiter> waiters = new GenericArray<KeyInfoWaiter> ();
+        }
+        
+        private static HashTable<string, KeyInfoLoad>? _key_info_in_flight = null;
+        
+        private static HashTable<string, KeyInfoLoad> key_info_in_flight {
+            get {
+                if (_key_info_in_flight == null) {
+                    _key_info_in_flight = new HashTable<string, KeyInfoLoad> (str_hash, str_equal);
+                }
+                return _key_info_in_flight;
+            }
+        }
+        
+        private static async SSHKeyInfo load_key_info (string target, FileInfo file_info, Cancellable? cancellable) throws KeyMakerError {
+            // A public key can be fingerprinted in-process; ssh-keygen is only needed otherwise
+            if (target.has_suffix (".pub")) {
+                try {
+                    uint8[] content;
+                    yield File.new_for_path (target).load_contents_async (cancellable, out content, null);
+                    var info = parse_public_key_info ((string) content);
+                    if (info != null) {
+                        cache_key_info (target, file_info, info);
+                        return info;
                     }
+                } catch (IOError.CANCELLED e) {
+                    throw new KeyMakerError.OPERATION_CANCELLED ("Operation was cancelled");
+                } catch (Error e) {
+                    debug ("SSHMetadata: Could not read public key %s: %s", target, e.message);
                 }
-                
-                throw new KeyMakerError.OPERATION_FAILED ("Unable to parse fingerprint from output: %s", result.stdout);
-                
-            } catch (IOError.CANCELLED e) {
-                throw new KeyMakerError.OPERATION_CANCELLED ("Operation was cancelled");
-            } catch (KeyMakerError.OPERATION_CANCELLED e) {
-                throw e;
-            } catch (KeyMakerError e) {
-                throw e;
-            } catch (Error e) {
-                throw new KeyMakerError.OPERATION_FAILED ("Failed to get fingerprint: %s", e.message);
             }
+            
+            string[] cmd = {"ssh-keygen", "-lf", target};
+            var result = yield KeyMaker.Command.run_capture(cmd, cancellable);
+            return parse_and_cache_key_info (target, file_info, result);
         }
         
+        private delegate void InspectStep ();
+        
         /**
-         * Get key type (async)
+         * Get fingerprint, key type and bit size for several keys at once.
+         * Public keys ssh-keygen must read share one run; private keys without
+         * one get their own, at most MAX_CONCURRENT_INSPECTIONS at a time.
+         * The result has one slot per input file, null where inspection failed.
          */
-        public static async SSHKeyType get_key_type (File key_path) throws KeyMakerError {
-            return yield get_key_type_with_cancellable (key_path, null);
+        public static async SSHKeyInfo?[] get_key_infos (GenericArray<File> key_paths, Cancellable? cancellable = null) {
+            var results = new SSHKeyInfo?[key_paths.length];
+            if (key_paths.length == 0) {
+                return results;
+            }
+            
+            // Cached and parseable keys are answered here; public keys the parser
+            // doesn't know are fingerprinted together by one ssh-keygen run
+            var remaining = new GenericArray<File> ();
+            var remaining_slots = new GenericArray<int> ();
+            var batch = new GenericArray<BatchedKey> ();
+            var batch_input = new StringBuilder ();
+            for (int i = 0; i < key_paths.length; i++) {
+                try {
+                    string target;
+                    var file_info = query_key_target (key_paths[i], cancellable, out target);
+                    
+                    var cached = lookup_cached_key_info (target, file_info);
+                    if (cached != null) {
+                        results[i] = cached;
+                        continue;
+                    }
+                    
+                    if (target.has_suffix (".pub")) {
+                        uint8[] content;
+                        yield File.new_for_path (target).load_contents_async (cancellable, out content, null);
+                        var line = ((string) content).strip ().split ("\n", 2)[0];
+                        var info = parse_public_key_info (line);
+                        if (info != null) {
+                            cache_key_info (target, file_info, info);
+                            results[i] = info;
+                        } else {
+                            batch.add (new BatchedKey (i, target, file_info));
+                            batch_input.append (line);
+                            batch_input.append_c ('\n');
+                        }
+                        continue;
+                    }
+                } catch (KeyMakerError.OPERATION_CANCELLED e) {
+                    return results;
+                } catch (IOError.CANCELLED e) {
+                    return results;
+                } catch (Error e) {
+                    debug ("SSHMetadata: Could not inspect %s: %s", key_paths[i].get_path (), e.message);
+                    continue;
+                }
+                
+                // Private key without a public key: ssh-keygen has to read it itself
+                remaining.add (key_paths[i]);
+                remaining_slots.add (i);
+            }
+            
+            if (batch.length > 0) {
+                var batch_infos = yield fingerprint_batch (batch, batch_input.str, cancellable);
+                for (int i = 0; i < batch.length; i++) {
+                    if (batch_infos != null) {
+                        results[batch[i].slot] = batch_infos[i];
+                    } else {
+                        remaining.add (key_paths[batch[i].slot]);
+                        remaining_slots.add (batch[i].slot);
+                    }
+                }
+            }
+            if (remaining.length == 0) {
+                return results;
+            }
+            
+            int next = 0;
+            int pending = remaining.length;
+            SourceFunc callback = get_key_infos.callback;
+            
+            // Each finished inspection starts the next one, keeping the cap filled
+            InspectStep? start_next = null;
+            start_next = () => {
+                int index = next++;
+                var key_path = remaining[index];
+                
+                get_key_info_with_cancellable.begin (key_path, cancellable, (obj, res) => {
+                    try {
+                        results[remaining_slots[index]] = get_key_info_with_cancellable.end (res);
+                    } catch (KeyMakerError e) {
+                        debug ("SSHMetadata: Could not inspect %s: %s", key_path.get_path (), e.message);
+                    }
+                    
+                    if (next < remaining.length) {
+                        start_next ();
+                    }
+                    
+                    pending--;
+                    if (pending == 0) {
+                        callback ();
+                    }
+                });
+            };
+            
+            for (int i = 0; i < int.min (MAX_CONCURRENT_INSPECTIONS, remaining.length); i++) {
+                start_next ();
+            }
+            
+            yield;
+            // Break the closure's reference to itself
+            start_next = null;
+            return results;
         }
         
-        /**
-         * Get key type (sync)
-         */
-        public static SSHKeyType get_key_type_sync (File key_path) throws KeyMakerError {
-            // For now, disable sync version - should be refactored later
-            throw new KeyMakerError.OPERATION_FAILED("Sync key type temporarily disabled - use async version");
+        // A public key waiting in a batched ssh-keygen run, and its slot in the results
+        private class BatchedKey {
+            public int slot;
+            public string target;
+            public FileInfo file_info;
+            
+            public BatchedKey (int slot, string target, FileInfo file_info) {
+                this.slot = slot;
+                this.target = target;
+                this.file_info = file_info;
+            }
         }
         
         /**
-         * Get key type with cancellation support
+         * Fingerprint several public keys with one `ssh-keygen -l -f -` run
+         *
+         * ssh-keygen prints one line per key it reads from stdin, in order. It
+         * skips keys it can't read, so unless every key produced a line the
+         * output can't be matched up and null is returned.
          */
-        public static async SSHKeyType get_key_type_with_cancellable (File key_path, Cancellable? cancellable) throws KeyMakerError {
-            // Use public key if available, otherwise private key
-            File target_path;
-            var public_path = File.new_for_path (key_path.get_path () + ".pub");
-            
-            if (public_path.query_exists ()) {
-                target_path = public_path;
-            } else {
-                target_path = key_path;
+        private static async SSHKeyInfo[]? fingerprint_batch (GenericArray<BatchedKey> batch, string input, Cancellable? cancellable) {
+            string[] cmd = {"ssh-keygen", "-l", "-f", "-"};
+            KeyMaker.Command.Result result;
+            try {
+                result = yield KeyMaker.Command.run_capture_input (cmd, input, cancellable);
+            } catch (KeyMakerError e) {
+                debug ("SSHMetadata: Batched fingerprinting failed: %s", e.message);
+                return null;
             }
             
-            if (!target_path.query_exists ()) {
-                throw new KeyMakerError.KEY_NOT_FOUND ("Key file not found: %s", target_path.get_path ());
+            var lines = result.stdout.strip ().split ("\n");
+            if (result.status != 0 || lines.length != batch.length) {
+                debug ("SSHMetadata: Batched fingerprinting returned %d lines for %d keys", lines.length, batch.length);
+                return null;
             }
             
-            string[] cmd = {"ssh-keygen", "-lf", target_path.get_path ()};
-            
-            try {
-                var result = yield KeyMaker.Command.run_capture(cmd, cancellable);
-                
-                if (result.status != 0) {
-                    throw new KeyMakerError.SUBPROCESS_FAILED ("Failed to get key type: %s", result.stderr);
+            var infos = new SSHKeyInfo[batch.length];
+            for (int i = 0; i < batch.length; i++) {
+                var info = parse_keygen_output_line (lines[i]);
+                if (info == null) {
+                    return null;
                 }
-                
-                // Parse key type from output  
-                if (result.stdout != null && result.stdout.length > 0) {
-                    var lines = result.stdout.split("\n");
-                    if (lines.length > 0) {
-                        var line = lines[0].strip();
-                        
-                        // Check most specific patterns first, then broader ones
-                        if (line.contains("sk-ssh-ed25519@openssh.com") || line.contains("ED25519-SK")) {
-                            return SSHKeyType.ED25519_SK;
-                        } else if (line.contains("(ED25519)") || line.contains(" ED25519 ") || line.contains("ssh-ed25519")) {
-                            return SSHKeyType.ED25519;
-                        } else if (line.contains("(ECDSA)") || line.contains(" ECDSA ") || line.contains("ecdsa-sha2")) {
-                            return SSHKeyType.ECDSA;
-                        } else if (line.contains("(RSA)") || line.contains(" RSA ") || line.contains("ssh-rsa")) {
-                            return SSHKeyType.RSA;
-                        }
-                    }
+                infos[i] = info;
+            }
+            for (int i = 0; i < batch.length; i++) {
+                cache_key_info (batch[i].target, batch[i].file_info, infos[i]);
+            }
+            return infos;
+        }
+        
+        /**
+         * Resolve the file to inspect (public key if available, otherwise private
+         * key) and stat it; the mtime and size validate a cached result
+         */
+        private static FileInfo query_key_target (File key_path, Cancellable? cancellable, out string target) throws KeyMakerError {
+            File target_path = File.new_for_path (key_path.get_path () + ".pub");
+            var attributes = FileAttribute.TIME_MODIFIED + "," + FileAttribute.TIME_MODIFIED_USEC + "," + FileAttribute.STANDARD_SIZE;
+            FileInfo file_info;
+            try {
+                try {
+                    file_info = target_path.query_info (attributes, FileQueryInfoFlags.NONE, cancellable);
+                } catch (IOError.NOT_FOUND e) {
+                    target_path = key_path;
+                    file_info = target_path.query_info (attributes, FileQueryInfoFlags.NONE, cancellable);
                 }
-                
-                // Default fallback
-                return SSHKeyType.RSA; // Default assumption
-                
+            } catch (IOError.NOT_FOUND e) {
+                throw new KeyMakerError.KEY_NOT_FOUND ("Key file not found: %s", target_path.get_path ());
             } catch (IOError.CANCELLED e) {
                 throw new KeyMakerError.OPERATION_CANCELLED ("Operation was cancelled");
-            } catch (KeyMakerError.OPERATION_CANCELLED e) {
-                throw e;
-            } catch (KeyMakerError e) {
-                throw e;
             } catch (Error e) {
-                throw new KeyMakerError.OPERATION_FAILED ("Failed to get key type: %s", e.message);
+                throw new KeyMakerError.OPERATION_FAILED ("Failed to read key metadata: %s", e.message);
+            }
+            
+            target = target_path.get_path ();
+            return file_info;
+        }
+        
+        private static SSHKeyInfo? lookup_cached_key_info (string target, FileInfo file_info) {
+            var cached = key_info_cache.lookup (target);
+            if (cached != null &&
+                cached.mtime == file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED) &&
+                cached.mtime_usec == file_info.get_attribute_uint32 (FileAttribute.TIME_MODIFIED_USEC) &&
+                cached.size == file_info.get_attribute_uint64 (FileAttribute.STANDARD_SIZE)) {
+                return cached.info;
+            }
+            return null;
+        }
+        
+        private static SSHKeyInfo parse_and_cache_key_info (string target, FileInfo file_info, KeyMaker.Command.Result result) throws KeyMakerError {
+            if (result.status != 0) {
+                throw new KeyMakerError.SUBPROCESS_FAILED ("Failed to read key metadata: %s", result.stderr);
             }
+            
+            // Format: "2048 SHA256:... user@host (RSA)"
+            var line = result.stdout;
+            var newline = line.index_of_char ('\n');
+            if (newline >= 0) {
+                line = line.substring (0, newline);
+            }
+            
+            var info = parse_keygen_output_line (line);
+            if (info == null) {
+                throw new KeyMakerError.OPERATION_FAILED ("Unable to parse key metadata from output: %s", result.stdout);
+            }
+            
+            cache_key_info (target, file_info, info);
+            return info;
+        }
+        
+        private static void cache_key_info (string target, FileInfo file_info, SSHKeyInfo info) {
+            key_info_cache.replace (target, new CachedKeyInfo (
+                file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED),
+                file_info.get_attribute_uint32 (FileAttribute.TIME_MODIFIED_USEC),
+                file_info.get_attribute_uint64 (FileAttribute.STANDARD_SIZE),
+                info
+            ));
         }
         
         /**
-         * Extract bit size (async)
+         * Get key type (async)
          */
-        public static async int? extract_bit_size (File key_path) throws KeyMakerError {
-            return yield extract_bit_size_with_cancellable (key_path, null);
+        public static async SSHKeyType get_key_type (File key_path) throws KeyMakerError {
+            return yield get_key_type_with_cancellable (key_path, null);
         }
         
         /**
-         * Extract bit size (sync)
+         * Get key type with cancellation support
          */
-        public static int? extract_bit_size_sync (File key_path) throws KeyMakerError {
-            // For now, disable sync version - should be refactored later
-            throw new KeyMakerError.OPERATION_FAILED("Sync bit size extraction temporarily disabled - use async version");
+        public static async SSHKeyType get_key_type_with_cancellable (File key_path, Cancellable? cancellable) throws KeyMakerError {
+            var info = yield get_key_info_with_cancellable (key_path, cancellable);
+            return info.key_type;
+        }
+        
+        /**
+         * Extract bit size (async)
+         */
+        public static async int? extract_bit_size (File key_path) throws KeyMakerError {
+            return yield extract_bit_size_with_cancellable (key_path, null);
         }
         
         /**
          * Extract bit size with cancellation support
          */
         public static async int? extract_bit_size_with_cancellable (File key_path, Cancellable? cancellable) throws KeyMakerError {
-            // Use public key if available, otherwise private key
-            File target_path;
-            var public_path = File.new_for_path (key_path.get_path () + ".pub");
-            
-            if (public_path.query_exists ()) {
-                target_path = public_path;
-            } else {
-                target_path = key_path;
-            }
-            
-            if (!target_path.query_exists ()) {
-                throw new KeyMakerError.KEY_NOT_FOUND ("Key file not found: %s", target_path.get_path ());
-            }
-            
-            string[] cmd = {"ssh-keygen", "-lf", target_path.get_path ()};
-            
-            try {
-                var result = yield KeyMaker.Command.run_capture(cmd, cancellable);
-                
-                if (result.status != 0) {
-                    throw new KeyMakerError.SUBPROCESS_FAILED ("Failed to get bit size: %s", result.stderr);
-                }
-                
-                // Parse bit size from output  
-                if (result.stdout != null && result.stdout.length > 0) {
-                    var lines = result.stdout.split("\n");
-                    if (lines.length > 0) {
-                        var parts = lines[0].split (" ");
-                        if (parts.length >= 1) {
-                            return int.parse(parts[0]);
-                        }
-                    }
-                }
-                
-                // Handle bit size for security keys which always report 256
-                if (result.stdout != null && (result.stdout.contains("sk-ssh-ed25519") || result.stdout.contains("ED25519-SK"))) {
-                    return 256;
-                }
-
-                return null;
-                
-            } catch (KeyMakerError.OPERATION_CANCELLED e) {
-                throw e;
-            } catch (KeyMakerError e) {
-                throw e;
-            } catch (Error e) {
-                throw new KeyMakerError.OPERATION_FAILED ("Failed to extract bit size: %s", e.message);
+            // get_key_info reads the size from the .pub blob and caches it with the rest
+            var info = yield get_key_info_with_cancellable (key_path, cancellable);
+            if (info.bit_size > 0) {
+                return info.bit_size;
             }
+            return null;
         }
         
         /**
@@ -251,27 +558,30 @@ namespace KeyMaker {
          * it requires stdin interaction (sending empty passphrase to ssh-keygen).
          * This is an approved exception until Command utility supports stdin.
          */
-        public static async bool has_passphrase (SSHKey ssh_key) throws KeyMakerError {
+        public static async bool has_passphrase (SSHKey ssh_key, Cancellable? cancellable = null) throws KeyMakerError {
             try {
-                string[] cmd = {"ssh-keygen", "-y", "-f", ssh_key.private_path.get_path()};
+                string[] cmd = {KeyMaker.Command.find_program ("ssh-keygen"), "-y", "-f", ssh_key.private_path_str};
 
                 var subprocess = new Subprocess.newv (
                     cmd,
-                    SubprocessFlags.STDIN_PIPE | SubprocessFlags.STDOUT_PIPE | SubprocessFlags.STDERR_PIPE
+                    SubprocessFlags.STDIN_PIPE | SubprocessFlags.STDOUT_SILENCE | SubprocessFlags.STDERR_SILENCE
                 );
 
+                // Only the exit status matters, so the derived public key and errors are discarded
                 // Send empty passphrase
                 var stdin_stream = subprocess.get_stdin_pipe ();
                 var stdin_writer = new DataOutputStream (stdin_stream);
-                yield stdin_writer.write_async ("\n".data);
-                yield stdin_writer.close_async ();
+                yield stdin_writer.write_async ("\n".data, Priority.DEFAULT, cancellable);
+                yield stdin_writer.close_async (Priority.DEFAULT, cancellable);
 
-                yield subprocess.wait_async ();
+                yield subprocess.wait_async (cancellable);
 
                 // If exit status is 0, key has no passphrase
                 // If exit status != 0, key likely has a passphrase
                 return subprocess.get_exit_status () != 0;
 
+            } catch (IOError.CANCELLED e) {
+                throw new KeyMakerError.OPERATION_CANCELLED ("Passphrase check was cancelled");
             } catch (Error e) {
                 // If there's an error running ssh-keygen, assume key has passphrase for safety
                 return true;
@@ -280,23 +590,265 @@ namespace KeyMaker {
         
         /**
          * Get public key content as string
+         *
+         * Copy and share actions tend to re-read the same few keys, so recent
+         * contents are kept while the file's mtime and size are unchanged.
          */
         public static string get_public_key_content (SSHKey ssh_key) throws KeyMakerError {
+            var path = ssh_key.public_path_str;
             try {
-                uint8[] content;
-                ssh_key.public_path.load_contents (null, out content, null);
-                return (string) content;
+                var file_info = ssh_key.public_path.query_info (PUBLIC_KEY_CACHE_ATTRIBUTES, FileQueryInfoFlags.NONE);
+                var cached = lookup_public_key (path, file_info);
+                if (cached != null) {
+                    return cached;
+                }
+                
+                // Plain read into one buffer, without GIO's stream machinery
+                string content;
+                FileUtils.get_contents (path, out content);
+                
+                store_public_key (path, file_info, content);
+                return content;
             } catch (Error e) {
                 throw new KeyMakerError.OPERATION_FAILED ("Failed to read public key content: %s", e.message);
             }
         }
         
+        /**
+         * Get public key content as string without blocking the main loop
+         *
+         * Same cache as get_public_key_content; only the stat and the read
+         * of an uncached file go through GIO's async calls.
+         */
+        public static async string get_public_key_content_async (SSHKey ssh_key, Cancellable? cancellable = null) throws KeyMakerError {
+            var path = ssh_key.public_path_str;
+            try {
+                var file_info = yield ssh_key.public_path.query_info_async (PUBLIC_KEY_CACHE_ATTRIBUTES, FileQueryInfoFlags.NONE, Priority.DEFAULT, cancellable);
+                var cached = lookup_public_key (path, file_info);
+                if (cached != null) {
+                    return cached;
+                }
+                
+                uint8[] data;
+                yield ssh_key.public_path.load_contents_async (cancellable, out data, null);
+                // load_contents NUL-terminates the buffer
+                var content = (string) data;
+                
+                store_public_key (path, file_info, content);
+                return content;
+            } catch (IOError.CANCELLED e) {
+                throw new KeyMakerError.OPERATION_CANCELLED ("Reading the public key was cancelled");
+            } catch (Error e) {
+                throw new KeyMakerError.OPERATION_FAILED ("Failed to read public key content: %s", e.message);
+            }
+        }
+        
+        /**
+         * Seed the public key cache with contents just read elsewhere
+         *
+         * public_info must carry the mtime, usec and size attributes; the
+         * entry is used only while the file still matches them.
+         */
+        public static void remember_public_key_content (File public_path, FileInfo public_info, string content) {
+            store_public_key (public_path.get_path (), public_info, content);
+        }
+        
+        /**
+         * Cached content for path if the file is unchanged since it was read
+         */
+        private static string? lookup_public_key (string path, FileInfo file_info) {
+            var cached = public_key_cache.lookup (path);
+            if (cached == null ||
+                cached.mtime != file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED) ||
+                cached.mtime_usec != file_info.get_attribute_uint32 (FileAttribute.TIME_MODIFIED_USEC) ||
+                cached.size != file_info.get_attribute_uint64 (FileAttribute.STANDARD_SIZE)) {
+                return null;
+            }
+            
+            // Mark as most recently used
+            int index;
+            if (public_key_cache_order.find_with_equal_func (path, str_equal, out index)) {
+                public_key_cache_order.remove_index (index);
+            }
+            public_key_cache_order.add (path);
+            return cached.content;
+        }
+        
+        private static void store_public_key (string path, FileInfo file_info, string content) {
+            int index;
+            if (public_key_cache_order.find_with_equal_func (path, str_equal, out index)) {
+                public_key_cache_order.remove_index (index);
+            } else if (public_key_cache_order.length >= PUBLIC_KEY_CACHE_SIZE) {
+                public_key_cache.remove (public_key_cache_order[0]);
+                public_key_cache_order.remove_index (0);
+            }
+            public_key_cache.replace (path, new CachedPublicKey (
+                file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED),
+                file_info.get_attribute_uint32 (FileAttribute.TIME_MODIFIED_USEC),
+                file_info.get_attribute_uint64 (FileAttribute.STANDARD_SIZE),
+                content
+            ));
+            public_key_cache_order.add (path);
+        }
+        
+        // What the public key cache compares; infos passed to remember_public_key_content need these
+        public const string PUBLIC_KEY_CACHE_ATTRIBUTES = FileAttribute.TIME_MODIFIED + "," + FileAttribute.TIME_MODIFIED_USEC + "," + FileAttribute.STANDARD_SIZE;
+        
+        // Scans seed the cache with every key they read, so it holds a typical ~/.ssh
+        private const uint PUBLIC_KEY_CACHE_SIZE = 64;
+        
+        private class CachedPublicKey {
+            public uint64 mtime;
+            public uint32 mtime_usec;
+            public uint64 size;
+            public string content;
+            
+            public CachedPublicKey (uint64 mtime, uint32 mtime_usec, uint64 size, string content) {
+                this.mtime = mtime;
+                this.mtime_usec = mtime_usec;
+                this.size = size;
+                this.content = content;
+            }
+        }
+        
+        private static HashTable<string, CachedPublicKey>? _public_key_cache = null;
+        // Cached paths, least recently used first
+        private static GenericArray<string>? _public_key_cache_order = null;
+        
+        private static HashTable<string, CachedPublicKey> public_key_cache {
+            get {
+                if (_public_key_cache == null) {
+                    _public_key_cache = new HashTable<string, CachedPublicKey> (str_hash, str_equal);
+                }
+                return _public_key_cache;
+            }
+        }
+        
+        private static GenericArray<string> public_key_cache_order {
+            get {
+                if (_public_key_cache_order == null) {
+                    _public_key_cache_order = new GenericArray<string> ();
+                }
+                return _public_key_cache_order;
+            }
+        }
+        
+        /**
+         * Read type, fingerprint and size straight from a public key line
+         * ("ssh-ed25519 AAAA... comment"), as ssh-keygen -lf would report them.
+         * The fingerprint is the unpadded Base64 SHA-256 of the decoded key blob.
+         * Returns null for key types this parser doesn't know.
+         */
+        public static SSHKeyInfo? parse_public_key_info (string public_key_line) {
+            var parts = public_key_line.strip ().split (" ", 3);
+            if (parts.length < 2) return null;
+            
+            var info = new SSHKeyInfo ();
+            switch (parts[0]) {
+                case "ssh-ed25519":
+                    info.key_type = SSHKeyType.ED25519;
+                    break;
+                case "sk-ssh-ed25519@openssh.com":
+                    info.key_type = SSHKeyType.ED25519_SK;
+                    break;
+                case "ecdsa-sha2-nistp256":
+                case "ecdsa-sha2-nistp384":
+                case "ecdsa-sha2-nistp521":
+                case "sk-ecdsa-sha2-nistp256@openssh.com":
+                    info.key_type = SSHKeyType.ECDSA;
+                    break;
+                case "ssh-rsa":
+                    info.key_type = SSHKeyType.RSA;
+                    break;
+                default:
+                    return null;
+            }
+            
+            uchar[] blob = Base64.decode (parts[1]);
+            info.bit_size = key_blob_bit_size (parts[0], blob);
+            if (info.bit_size <= 0) return null;
+            
+            var checksum = new Checksum (ChecksumType.SHA256);
+            checksum.update (blob, blob.length);
+            uint8[] digest = new uint8[32];
+            size_t digest_len = digest.length;
+            checksum.get_digest (digest, ref digest_len);
+            
+            var encoded = Base64.encode ((uchar[]) digest);
+            var end = encoded.length;
+            while (end > 0 && encoded[end - 1] == '=') {
+                end--;
+            }
+            info.fingerprint = "SHA256:" + encoded.substring (0, end);
+            return info;
+        }
+        
+        /**
+         * Read the key size straight from a public key line ("ssh-rsa AAAA... comment")
+         * Returns -1 when the size can't be determined without ssh-keygen
+         */
+        public static int parse_public_key_bit_size (string public_key_line) {
+            var parts = public_key_line.strip ().split (" ", 3);
+            if (parts.length < 2) return -1;
+            
+            return key_blob_bit_size (parts[0], Base64.decode (parts[1]));
+        }
+        
+        private static int key_blob_bit_size (string key_type, uchar[] blob) {
+            switch (key_type) {
+                case "ssh-ed25519":
+                case "sk-ssh-ed25519@openssh.com":
+                case "ecdsa-sha2-nistp256":
+                case "sk-ecdsa-sha2-nistp256@openssh.com":
+                    return blob.length > 0 ? 256 : -1;
+                case "ecdsa-sha2-nistp384":
+                    return blob.length > 0 ? 384 : -1;
+                case "ecdsa-sha2-nistp521":
+                    return blob.length > 0 ? 521 : -1;
+                case "ssh-rsa":
+                    break;
+                default:
+                    return -1;
+            }
+            
+            // RSA blob: string "ssh-rsa", mpint e, mpint n; each field is a 4-byte big-endian length plus data
+            int offset = 0;
+            for (int field = 0; field < 3; field++) {
+                if (offset + 4 > blob.length) return -1;
+                uint32 len = ((uint32) blob[offset] << 24) | ((uint32) blob[offset + 1] << 16) |
+                             ((uint32) blob[offset + 2] << 8) | (uint32) blob[offset + 3];
+                offset += 4;
+                if (len > blob.length - offset) return -1;
+                
+                if (field < 2) {
+                    offset += (int) len;
+                    continue;
+                }
+                
+                // Modulus: skip the sign padding, then count the bits of the leading byte
+                int remaining = (int) len;
+                while (remaining > 0 && blob[offset] == 0) {
+                    offset++;
+                    remaining--;
+                }
+                if (remaining == 0) return -1;
+                
+                int bits = (remaining - 1) * 8;
+                for (uchar top = blob[offset]; top != 0; top >>= 1) {
+                    bits++;
+                }
+                return bits;
+            }
+            return -1;
+        }
+        
         /**
          * Parse SSH key info from ssh-keygen output line
          * Returns a structured info object with fingerprint, type, and bit size
          */
         public static SSHKeyInfo? parse_keygen_output_line(string output_line) {
-            var parts = output_line.strip().split(" ");
+            var line = output_line.strip();
+            var parts = line.split(" ");
             if (parts.length < 2) return null;
             
             var info = new SSHKeyInfo();
@@ -307,20 +859,32 @@ namespace KeyMaker {
             // Second part is fingerprint  
             info.fingerprint = parts[1];
             
-            // Look for key type in the line - check most specific patterns first
-            var line = output_line.strip();
-            if (line.contains("sk-ssh-ed25519@openssh.com") || line.contains("ED25519-SK") || line.contains("sk-ssh-ed25519")) {
-                info.key_type = SSHKeyType.ED25519_SK;
-                info.bit_size = 256;
-            } else if (line.contains("(ED25519)") || line.contains(" ED25519 ") || line.contains("ssh-ed25519")) {
-                info.key_type = SSHKeyType.ED25519;
-                info.bit_size = 256;
-            } else if (line.contains("(ECDSA)") || line.contains(" ECDSA ") || line.contains("ecdsa-sha2")) {
-                info.key_type = SSHKeyType.ECDSA;
-            } else if (line.contains("(RSA)") || line.contains(" RSA ") || line.contains("ssh-rsa")) {
-                info.key_type = SSHKeyType.RSA;
-            } else {
-                info.key_type = SSHKeyType.RSA; // Default
+            // ssh-keygen ends the line with the type in parentheses, so read that
+            // token once instead of searching the whole line for each pattern
+            string type_token = "";
+            if (line.has_suffix(")")) {
+                var open = line.last_index_of_char('(');
+                if (open >= 0) {
+                    type_token = line.substring(open + 1, line.length - open - 2);
+                }
+            }
+            
+            switch (type_token) {
+                case "ED25519-SK":
+                    info.key_type = SSHKeyType.ED25519_SK;
+                    info.bit_size = 256;
+                    break;
+                case "ED25519":
+                    info.key_type = SSHKeyType.ED25519;
+                    info.bit_size = 256;
+                    break;
+                case "ECDSA":
+                case "ECDSA-SK":
+                    info.key_type = SSHKeyType.ECDSA;
+                    break;
+                default:
+                    info.key_type = SSHKeyType.RSA; // Default
+                    break;
             }
             
             return info;
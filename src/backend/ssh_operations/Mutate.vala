@@ -12,34 +12,22 @@ namespace KeyMaker {
          * Change passphrase of an SSH key
          */
         public static async void change_passphrase (PassphraseChangeRequest request) throws KeyMakerError {
+            // ssh-keygen prompts for the old and new passphrase; the askpass helper
+            // answers from the environment instead of -P/-N on the command line
+            string[] cmd = { "ssh-keygen", "-p", "-f", request.key_path };
+            string[] env = {};
+            
             try {
                 KeyMaker.Log.info(KeyMaker.Log.Categories.SSH_OPS, "Changing passphrase for key: %s", 
                                  request.key_path);
                 
-                // Build command with non-interactive flags
-                var cmd_list = new GenericArray<string> ();
-                cmd_list.add ("ssh-keygen");
-                cmd_list.add ("-p");
-                cmd_list.add ("-f");
-                cmd_list.add (request.key_path);
-                
-                // Add old passphrase (-P flag)
-                cmd_list.add ("-P");
-                cmd_list.add (request.old_passphrase ?? "");
-                
-                // Add new passphrase (-N flag)
-                cmd_list.add ("-N");
-                cmd_list.add (request.new_passphrase ?? "");
-                
-                // Convert to array for subprocess
-                string[] cmd = new string[cmd_list.length];
-                for (int i = 0; i < cmd_list.length; i++) {
-                    cmd[i] = cmd_list[i];
-                }
-                
-                var result = yield KeyMaker.Command.run_capture(cmd);
+                env = Askpass.environment (request.old_passphrase, request.new_passphrase);
+                var result = yield KeyMaker.Command.run_status_with_env(cmd, env);
                 
                 if (result.status != 0) {
+                    if (bad_passphrase_regex.match (result.stderr)) {
+                        throw new KeyMakerError.ACCESS_DENIED ("The current passphrase is incorrect");
+                    }
                     throw new KeyMakerError.SUBPROCESS_FAILED ("Failed to change passphrase: %s", result.stderr);
                 }
                 
@@ -51,6 +39,42 @@ namespace KeyMaker {
                 throw e;
             } catch (Error e) {
                 throw new KeyMakerError.OPERATION_FAILED ("Failed to change passphrase: %s", e.message);
+            } finally {
+                Askpass.wipe (env);
+            }
+        }
+        
+        // ssh-keygen's wrong-passphrase messages, matched caselessly in place
+        // instead of lowercasing a copy of stderr
+        private static Regex? _bad_passphrase_regex = null;
+        
+        private static Regex bad_passphrase_regex {
+            get {
+                if (_bad_passphrase_regex == null) {
+                    try {
+                        _bad_passphrase_regex = new Regex ("bad passphrase|incorrect passphrase", RegexCompileFlags.CASELESS | RegexCompileFlags.OPTIMIZE);
+                    } catch (RegexError e) {
+                        error ("Invalid passphrase error pattern: %s", e.message);
+                    }
+                }
+                return _bad_passphrase_regex;
+            }
+        }
+        
+        /**
+         * Delete one key file, recording a failure in errors.
+         * Returns true if the file is gone, including when it never existed.
+         */
+        private static async bool delete_key_file (File path, string kind, GenericArray<string> errors) {
+            try {
+                yield path.delete_async ();
+                KeyMaker.Log.debug(KeyMaker.Log.Categories.SSH_OPS, "Deleted %s key: %s", kind, path.get_path ());
+                return true;
+            } catch (IOError.NOT_FOUND e) {
+                return true; // Consider it "deleted" if it didn't exist
+            } catch (Error e) {
+                errors.add (@"Failed to delete $kind key: $(e.message)");
+                return false;
             }
         }
         
@@ -66,33 +90,25 @@ namespace KeyMaker {
                 bool public_deleted = false;
                 var errors = new GenericArray<string>();
                 
-                // Delete private key
-                if (ssh_key.private_path.query_exists ()) {
-                    try {
-                        yield ssh_key.private_path.delete_async ();
-                        private_deleted = true;
-                        KeyMaker.Log.debug(KeyMaker.Log.Categories.SSH_OPS, "Deleted private key: %s", 
-                                          ssh_key.private_path.get_path());
-                    } catch (Error e) {
-                        errors.add (@"Failed to delete private key: $(e.message)");
-                    }
-                } else {
-                    private_deleted = true; // Consider it "deleted" if it didn't exist
-                }
+                // Delete both files at once; a missing file counts as deleted, no existence check needed
+                int pending = 2;
+                SourceFunc callback = delete_key_pair.callback;
                 
-                // Delete public key
-                if (ssh_key.public_path.query_exists ()) {
-                    try {
-                        yield ssh_key.public_path.delete_async ();
-                        public_deleted = true;
-                        KeyMaker.Log.debug(KeyMaker.Log.Categories.SSH_OPS, "Deleted public key: %s", 
-                                          ssh_key.public_path.get_path());
-                    } catch (Error e) {
-                        errors.add (@"Failed to delete public key: $(e.message)");
+                delete_key_file.begin (ssh_key.private_path, "private", errors, (obj, res) => {
+                    private_deleted = delete_key_file.end (res);
+                    if (--pending == 0) {
+                        callback ();
                     }
-                } else {
-                    public_deleted = true; // Consider it "deleted" if it didn't exist
-                }
+                });
+                delete_key_file.begin (ssh_key.public_path, "public", errors, (obj, res) => {
+                    public_deleted = delete_key_file.end (res);
+                    if (--pending == 0) {
+                        callback ();
+                    }
+                });
+                yield;
+                
+                SSHMetadata.forget_key_info (ssh_key.private_path);
                 
                 // Check if operation was successful
                 if (!private_deleted || !public_deleted) {
@@ -120,13 +136,9 @@ namespace KeyMaker {
          */
         public static void secure_key_permissions(SSHKey ssh_key) throws KeyMakerError {
             try {
-                if (ssh_key.private_path.query_exists()) {
-                    KeyMaker.Filesystem.chmod_private(ssh_key.private_path);
-                }
-                
-                if (ssh_key.public_path.query_exists()) {
-                    KeyMaker.Filesystem.chmod_public(ssh_key.public_path);
-                }
+                // chmod on a missing file just fails, so no existence check first
+                KeyMaker.Filesystem.chmod_private(ssh_key.private_path);
+                KeyMaker.Filesystem.chmod_public(ssh_key.public_path);
                 
                 KeyMaker.Log.debug(KeyMaker.Log.Categories.SSH_OPS, "Secured permissions for key: %s", 
                                   ssh_key.get_display_name());
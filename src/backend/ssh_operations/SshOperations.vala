@@ -16,8 +16,8 @@ namespace KeyMaker {
     public class SSHOperations {
         
         // Generation operations (delegate to SSHGeneration)
-        public static async SSHKey generate_key (KeyGenerationRequest request) throws KeyMakerError {
-            return yield SSHGeneration.generate_key(request);
+        public static async SSHKey generate_key (KeyGenerationRequest request, Cancellable? cancellable = null) throws KeyMakerError {
+            return yield SSHGeneration.generate_key(request, cancellable);
         }
         
         // Metadata operations (delegate to SSHMetadata)
@@ -25,10 +25,6 @@ namespace KeyMaker {
             return yield SSHMetadata.get_fingerprint(key_path);
         }
         
-        public static string get_fingerprint_sync (File key_path) throws KeyMakerError {
-            return SSHMetadata.get_fingerprint_sync(key_path);
-        }
-        
         public static async string get_fingerprint_with_cancellable (File key_path, Cancellable? cancellable) throws KeyMakerError {
             try {
                 return yield SSHMetadata.get_fingerprint_with_cancellable(key_path, cancellable);
@@ -37,12 +33,24 @@ namespace KeyMaker {
             }
         }
         
-        public static async SSHKeyType get_key_type (File key_path) throws KeyMakerError {
-            return yield SSHMetadata.get_key_type(key_path);
+        public static async SSHKeyInfo get_key_info (File key_path) throws KeyMakerError {
+            return yield SSHMetadata.get_key_info(key_path);
+        }
+        
+        public static async SSHKeyInfo?[] get_key_infos (GenericArray<File> key_paths, Cancellable? cancellable = null) {
+            return yield SSHMetadata.get_key_infos(key_paths, cancellable);
+        }
+        
+        public static async SSHKeyInfo get_key_info_with_cancellable (File key_path, Cancellable? cancellable) throws KeyMakerError {
+            try {
+                return yield SSHMetadata.get_key_info_with_cancellable(key_path, cancellable);
+            } catch (IOError.CANCELLED e) {
+                throw new KeyMakerError.OPERATION_CANCELLED ("Operation was cancelled");
+            }
         }
         
-        public static SSHKeyType get_key_type_sync (File key_path) throws KeyMakerError {
-            return SSHMetadata.get_key_type_sync(key_path);
+        public static async SSHKeyType get_key_type (File key_path) throws KeyMakerError {
+            return yield SSHMetadata.get_key_type(key_path);
         }
         
         public static async SSHKeyType get_key_type_with_cancellable (File key_path, Cancellable? cancellable) throws KeyMakerError {
@@ -57,10 +65,6 @@ namespace KeyMaker {
             return yield SSHMetadata.extract_bit_size(key_path);
         }
         
-        public static int? extract_bit_size_sync (File key_path) throws KeyMakerError {
-            return SSHMetadata.extract_bit_size_sync(key_path);
-        }
-        
         public static async int? extract_bit_size_with_cancellable (File key_path, Cancellable? cancellable) throws KeyMakerError {
             return yield SSHMetadata.extract_bit_size_with_cancellable(key_path, cancellable);
         }
@@ -69,6 +73,10 @@ namespace KeyMaker {
             return SSHMetadata.get_public_key_content(ssh_key);
         }
         
+        public static async string get_public_key_content_async (SSHKey ssh_key, Cancellable? cancellable = null) throws KeyMakerError {
+            return yield SSHMetadata.get_public_key_content_async(ssh_key, cancellable);
+        }
+        
         // Mutation operations (delegate to SSHMutate)
         public static async void change_passphrase (PassphraseChangeRequest request) throws KeyMakerError {
             yield SSHMutate.change_passphrase(request);
@@ -353,12 +353,15 @@ namespace KeyMaker {
             access_attempt_logged (backup, true, "Delete");
             
             try {
-                // Delete backup files
-                if (backup.backup_file.query_exists ()) {
-                    if (backup.backup_file.query_file_type (FileQueryInfoFlags.NONE) == FileType.DIRECTORY) {
-                        yield delete_directory_recursive (backup.backup_file);
-                    } else {
+                // Delete backup files; a file that is already gone counts as deleted,
+                // any other failure keeps the backup listed
+                if (backup.backup_file.query_file_type (FileQueryInfoFlags.NONE) == FileType.DIRECTORY) {
+                    yield delete_directory_recursive (backup.backup_file);
+                } else {
+                    try {
                         backup.backup_file.delete ();
+                    } catch (IOError.NOT_FOUND e) {
+                        debug ("EmergencyVault: Backup file already removed: %s", backup.backup_file.get_path ());
                     }
                 }
                 
@@ -942,14 +945,15 @@ namespace KeyMaker {
                         );
                         var last_modified = private_file_info.get_modification_date_time ();
                         
-                        var key_type = SSHOperations.get_key_type_sync (key_file);
-                        var fingerprint = SSHOperations.get_fingerprint_sync (key_file);
-                        var bit_size = SSHOperations.extract_bit_size_sync (key_file);
+                        var key_info = yield SSHOperations.get_key_info (key_file);
+                        var key_type = key_info.key_type;
+                        var fingerprint = key_info.fingerprint;
+                        var bit_size = key_info.bit_size;
                         
                         uint8[] public_content;
                         public_key_file.load_contents (null, out public_content, null);
                         var public_key_content = (string) public_content;
-                        var parts = public_key_content.strip ().split (" ");
+                        var parts = public_key_content.strip ().split (" ", 3);
                         string? comment = null;
                         if (parts.length >= 3) {
                             comment = parts[2];
@@ -962,7 +966,7 @@ namespace KeyMaker {
                             fingerprint,
                             comment,
                             last_modified,
-                            bit_size ?? -1
+                            bit_size
                         );
                     } catch (Error e) {
                         warning ("EmergencyVault: Could not create SSHKey object for %s: %s", safe_name, e.message);
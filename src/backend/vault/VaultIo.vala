@@ -120,16 +120,12 @@ namespace KeyMaker {
             try {
                 var temp_dir = private_file.get_parent();
                 
-                if (private_file.query_exists()) {
-                    private_file.delete();
-                }
-                
-                if (public_file.query_exists()) {
-                    public_file.delete();
-                }
+                // Delete straight away; a file that is already gone is not an error
+                delete_if_present(private_file);
+                delete_if_present(public_file);
                 
-                if (temp_dir != null && temp_dir.query_exists()) {
-                    temp_dir.delete();
+                if (temp_dir != null) {
+                    delete_if_present(temp_dir);
                 }
                 
             } catch (Error e) {
@@ -137,6 +133,14 @@ namespace KeyMaker {
             }
         }
         
+        private static void delete_if_present(File file) throws Error {
+            try {
+                file.delete();
+            } catch (IOError.NOT_FOUND e) {
+                // Nothing to clean up
+            }
+        }
+        
         /**
          * Calculate file checksum using SHA256
          */
@@ -26,6 +26,17 @@ namespace KeyMaker {
         public DateTime last_modified { get; construct; }
         public int bit_size { get; construct; } // Only for RSA keys, -1 for non-RSA
         
+        // Filesystem paths of the key files, resolved once instead of on every get_path () call
+        public string private_path_str { get; private set; }
+        public string public_path_str { get; private set; }
+        // Private key file name, shown in rows, dialogs and toasts
+        private string display_name;
+        
+        // Row subtitles, built on first use; scans hand back the same object for
+        // an unchanged key, so rebuilt rows reuse them
+        private string? subtitle_with_fingerprint = null;
+        private string? subtitle_without_fingerprint = null;
+        
         public SSHKey (File private_path, File public_path, SSHKeyType key_type,
                       string fingerprint, string? comment, DateTime last_modified, int bit_size = -1) {
             Object (
@@ -40,28 +51,37 @@ namespace KeyMaker {
         }
         
         construct {
-            debug ("SSHKey: construct start for %s", private_path.get_path ());
-            validate_permissions ();
-            debug ("SSHKey: construct done for %s", private_path.get_path ());
+            private_path_str = private_path.get_path ();
+            public_path_str = public_path.get_path ();
+            display_name = private_path.get_basename ();
         }
         
         /**
          * Validate that private key has secure permissions
+         *
+         * Not run on construction: keys are built in bulk during scans, and
+         * callers that just wrote the file already know its mode.
          */
-        private void validate_permissions () {
-            debug ("SSHKey: validating permissions for %s", private_path.get_path ());
+        public void validate_permissions () {
+            debug ("SSHKey: validating permissions for %s", private_path_str);
             try {
                 var file_info = private_path.query_info (FileAttribute.UNIX_MODE, FileQueryInfoFlags.NONE);
-                var mode = file_info.get_attribute_uint32 (FileAttribute.UNIX_MODE);
-                var permissions = mode & 0x1FF; // Last 9 bits (permissions)
-                
-                // Check if permissions are not 0600 (owner read/write only)
-                if (permissions != KeyMaker.Filesystem.PERM_FILE_PRIVATE) {
-                    warning ("Private key %s does not have secure permissions (should be 0600)", 
-                            private_path.get_path ());
-                }
+                check_permission_mode (file_info.get_attribute_uint32 (FileAttribute.UNIX_MODE));
             } catch (Error e) {
-                warning ("Failed to check permissions for %s: %s", private_path.get_path (), e.message);
+                warning ("Failed to check permissions for %s: %s", private_path_str, e.message);
+            }
+        }
+        
+        /**
+         * Validate permissions from an already queried unix mode
+         */
+        public void check_permission_mode (uint32 mode) {
+            var permissions = mode & 0x1FF; // Last 9 bits (permissions)
+            
+            // Check if permissions are not 0600 (owner read/write only)
+            if (permissions != KeyMaker.Filesystem.PERM_FILE_PRIVATE) {
+                warning ("Private key %s does not have secure permissions (should be 0600)", 
+                        private_path_str);
             }
         }
         
@@ -69,7 +89,19 @@ namespace KeyMaker {
          * Get the display name for this key (filename without path)
          */
         public string get_display_name () {
-            return private_path.get_basename ();
+            return display_name;
+        }
+        
+        /**
+         * Get the list row subtitle: fingerprint and/or comment, joined by " • "
+         */
+        public unowned string get_subtitle (bool show_fingerprint) {
+            if (subtitle_without_fingerprint == null) {
+                var stripped_comment = comment != null ? comment.strip () : "";
+                subtitle_without_fingerprint = stripped_comment;
+                subtitle_with_fingerprint = stripped_comment != "" ? "%s • %s".printf (fingerprint, stripped_comment) : fingerprint;
+            }
+            return show_fingerprint ? subtitle_with_fingerprint : subtitle_without_fingerprint;
         }
         
         /**
@@ -140,25 +172,8 @@ namespace KeyMaker {
          */
         public void validate () throws KeyMakerError {
             // Validate filename
-            if (filename == null || filename.strip () == "") {
-                throw new KeyMakerError.VALIDATION_FAILED ("Filename cannot be empty");
-            }
-            
-            // Check for safe filename characters
-            if (!is_safe_filename (filename)) {
-                throw new KeyMakerError.VALIDATION_FAILED (
-                    "Filename contains invalid characters. Use only letters, numbers, dots, hyphens, and underscores"
-                );
-            }
-            
-            // Filename cannot start with . or -
-            if (filename.has_prefix (".") || filename.has_prefix ("-")) {
-                throw new KeyMakerError.VALIDATION_FAILED ("Filename cannot start with '.' or '-'");
-            }
-            
-            // Check filename length
-            if (filename.length > 255) {
-                throw new KeyMakerError.VALIDATION_FAILED ("Filename too long (maximum 255 characters)");
+            if (filename == null || !safe_filename_regex.match (filename)) {
+                explain_invalid_filename ();
             }
             
             // Validate RSA bits if RSA key
@@ -176,15 +191,43 @@ namespace KeyMaker {
             }
         }
         
-        private bool is_safe_filename (string name) {
-            // Allow only alphanumeric, dots, hyphens, and underscores
-            for (int i = 0; i < name.length; i++) {
-                unichar c = name.get_char (i);
-                if (!c.isalnum () && c != '.' && c != '-' && c != '_') {
-                    return false;
+        // Letters, numbers, dots, hyphens and underscores; no leading '.' or '-'; at most 255 chars
+        private static Regex? _safe_filename_regex = null;
+        
+        private static Regex safe_filename_regex {
+            get {
+                if (_safe_filename_regex == null) {
+                    try {
+                        _safe_filename_regex = new Regex ("^[A-Za-z0-9_][A-Za-z0-9._-]{0,254}$", RegexCompileFlags.OPTIMIZE | RegexCompileFlags.DOLLAR_ENDONLY);
+                    } catch (RegexError e) {
+                        error ("Invalid filename pattern: %s", e.message);
+                    }
                 }
+                return _safe_filename_regex;
             }
-            return true;
+        }
+        
+        /**
+         * Throw the specific error for a filename rejected by safe_filename_regex
+         */
+        private void explain_invalid_filename () throws KeyMakerError {
+            if (filename == null || filename.strip () == "") {
+                throw new KeyMakerError.VALIDATION_FAILED ("Filename cannot be empty");
+            }
+            
+            // Filename cannot start with . or -
+            if (filename.has_prefix (".") || filename.has_prefix ("-")) {
+                throw new KeyMakerError.VALIDATION_FAILED ("Filename cannot start with '.' or '-'");
+            }
+            
+            // Check filename length
+            if (filename.length > 255) {
+                throw new KeyMakerError.VALIDATION_FAILED ("Filename too long (maximum 255 characters)");
+            }
+            
+            throw new KeyMakerError.VALIDATION_FAILED (
+                "Filename contains invalid characters. Use only letters, numbers, dots, hyphens, and underscores"
+            );
         }
         
         /**
@@ -221,7 +264,7 @@ namespace KeyMaker {
         public string? current_passphrase { get; set; default = null; }
         public string? new_passphrase { get; set; default = null; }
         // Compatibility aliases
-        public string key_path { owned get { return ssh_key.private_path.get_path(); } }
+        public string key_path { get { return ssh_key.private_path_str; } }
         public string? old_passphrase { get { return current_passphrase; } set { current_passphrase = value; } }
         public string? passphrase { get { return new_passphrase; } set { new_passphrase = value; } }
         
@@ -256,6 +299,11 @@ namespace KeyMaker {
                 throw new KeyMakerError.VALIDATION_FAILED ("Username cannot be empty");
             }
             
+            // Quoting keeps the shell out, but ssh-copy-id would still read these as options
+            if (hostname.has_prefix ("-") || username.has_prefix ("-")) {
+                throw new KeyMakerError.VALIDATION_FAILED ("Hostname and username cannot start with '-'");
+            }
+            
             if (port < 1 || port > 65535) {
                 throw new KeyMakerError.VALIDATION_FAILED ("Port must be between 1 and 65535");
             }
@@ -265,17 +313,27 @@ namespace KeyMaker {
          * Generate the ssh-copy-id command string
          */
         public string get_command () {
-            var cmd = new StringBuilder ();
-            cmd.append ("ssh-copy-id -i ");
-            cmd.append (Shell.quote (ssh_key.public_path.get_path ()));
+            var port_arg = port != 22 ? " -p %d".printf (port) : "";
             
-            if (port != 22) {
-                cmd.append_printf (" -p %d", port);
+            return "ssh-copy-id -i %s%s %s".printf (
+                quote_arg (ssh_key.public_path_str),
+                port_arg,
+                quote_arg ("%s@%s".printf (username, hostname))
+            );
+        }
+        
+        /**
+         * Quote an argument for the shell only when it needs it, so the same
+         * input always gives the same, shortest command
+         */
+        private static string quote_arg (string arg) {
+            for (int i = 0; i < arg.length; i++) {
+                var c = arg[i];
+                if (!(c.isalnum () || "@%+=:,./_-".index_of_char (c) >= 0)) {
+                    return Shell.quote (arg);
+                }
             }
-            
-            cmd.append_printf (" %s@%s", Shell.quote (username), Shell.quote (hostname));
-            
-            return cmd.str;
+            return arg;
         }
     }
 }
@@ -51,6 +51,7 @@ public class KeyMaker.KeyRowWidget : Adw.ActionRow {
     public signal void passphrase_change_requested (SSHKey ssh_key);
     public signal void copy_id_requested (SSHKey ssh_key);
     
+    private ulong settings_handler_id = 0;
     
     public KeyRowWidget (SSHKey ssh_key) {
         Object (ssh_key: ssh_key);
@@ -58,7 +59,7 @@ public class KeyMaker.KeyRowWidget : Adw.ActionRow {
     
     construct {
         // Listen for settings changes
-        SettingsManager.app.changed["show-fingerprints"].connect (() => {
+        settings_handler_id = SettingsManager.app.changed["show-fingerprints"].connect (() => {
             update_display ();
         });
         
@@ -72,6 +73,9 @@ public class KeyMaker.KeyRowWidget : Adw.ActionRow {
         // Connect mobile menu button
         mobile_menu_button.clicked.connect (show_mobile_menu);
         
+        // The key type never changes for a row, so its colour is set once here
+        apply_key_type_styling ();
+        
         // Update display
         update_display ();
         
@@ -79,6 +83,15 @@ public class KeyMaker.KeyRowWidget : Adw.ActionRow {
         update_passphrase_button.begin ();
     }
     
+    public override void dispose () {
+        // The settings object outlives every row, and its handler holds a reference to this one
+        if (settings_handler_id != 0) {
+            SettingsManager.app.disconnect (settings_handler_id);
+            settings_handler_id = 0;
+        }
+        base.dispose ();
+    }
+    
     private void show_mobile_menu () {
         var sheet = new Adw.Dialog ();
         sheet.title = _("Actions"); // Good practice to set title for dialogs
@@ -174,46 +187,13 @@ public class KeyMaker.KeyRowWidget : Adw.ActionRow {
         // Set title and subtitle using ActionRow properties
         set_title (ssh_key.get_display_name ());
         
-        // Build subtitle based on settings
-        var show_fingerprints = SettingsManager.show_fingerprints;
-        var subtitle_parts = new GenericArray<string> ();
-        
-        if (show_fingerprints) {
-            subtitle_parts.add (ssh_key.fingerprint);
-        }
-        
-        if (ssh_key.comment != null && ssh_key.comment.strip () != "") {
-            subtitle_parts.add (ssh_key.comment.strip ());
-        }
-        
-        if (subtitle_parts.length > 0) {
-            var parts_array = new string[subtitle_parts.length + 1];
-            for (int i = 0; i < subtitle_parts.length; i++) {
-                parts_array[i] = subtitle_parts[i];
-            }
-            parts_array[subtitle_parts.length] = null;
-            var subtitle = string.joinv (" • ", parts_array);
-            set_subtitle (subtitle);
-        } else {
-            set_subtitle ("");
-        }
+        // Subtitle depends on settings; both variants are kept on the key
+        set_subtitle (ssh_key.get_subtitle (SettingsManager.show_fingerprints));
         
-        // Set key type label with color coding
         key_type_label.set_text (ssh_key.get_type_description ());
-        update_key_type_styling ();
     }
     
-    private void update_key_type_styling () {
-        // Remove existing style classes
-        key_type_label.remove_css_class ("success");
-        key_type_label.remove_css_class ("accent");
-        key_type_label.remove_css_class ("warning");
-        key_type_label.remove_css_class ("error");
-        key_icon.remove_css_class ("success");
-        key_icon.remove_css_class ("accent");
-        key_icon.remove_css_class ("warning");
-        key_icon.remove_css_class ("error");
-        
+    private void apply_key_type_styling () {
         // Apply color coding and icons based on key type
         switch (ssh_key.key_type) {
             case SSHKeyType.ED25519:
@@ -15,23 +15,9 @@
 [GtkTemplate (ui = "/io/github/tobagin/keysmith/window.ui")]
 #endif
 public class KeyMaker.Window : Adw.ApplicationWindow {
-    [GtkChild]
-    private unowned Adw.HeaderBar header_bar;
-
-
-
-    [GtkChild]
-    private unowned Gtk.MenuButton menu_button;
-    
     [GtkChild]
     private unowned Adw.ToastOverlay toast_overlay;
     
-    [GtkChild]
-    private unowned Adw.ViewStack main_stack;
-    
-    [GtkChild]
-    private unowned Adw.ViewSwitcherBar view_switcher_bar;
-    
     [GtkChild]
     private unowned KeyMaker.KeysPage keys_page;
     
@@ -46,6 +32,9 @@ public class KeyMaker.Window : Adw.ApplicationWindow {
     [GtkChild]
     private unowned KeyMaker.BackupPage backup_page;
     
+    // Looked up once; copy actions and the dialogs opened from here all use it
+    public Gdk.Clipboard clipboard { get; private set; }
+    
 
 
 
@@ -53,6 +42,8 @@ public class KeyMaker.Window : Adw.ApplicationWindow {
         // Setup actions and signals
         setup_actions ();
         setup_page_signals ();
+        
+        clipboard = get_clipboard ();
 
 
 
@@ -68,82 +59,33 @@ public class KeyMaker.Window : Adw.ApplicationWindow {
     }
     
     private void setup_actions () {
-        // Generate key action
-        var generate_action = new SimpleAction ("generate-key", null);
-        generate_action.activate.connect (on_generate_key_action);
-        add_action (generate_action);
-
-        // Add existing key action
-        var add_existing_action = new SimpleAction ("add-existing-key", null);
-        add_existing_action.activate.connect (on_add_existing_key_action);
-        add_action (add_existing_action);
-
-
-
-        // Refresh action
-        var refresh_action = new SimpleAction ("refresh", null);
-        refresh_action.activate.connect (on_refresh_action);
-        add_action (refresh_action);
-
-        // Help action
-        var help_action = new SimpleAction ("help", null);
-        help_action.activate.connect (on_help_action);
-        add_action (help_action);
-
-        // Hosts actions
-        var hosts_add_action = new SimpleAction ("hosts-add", null);
-        hosts_add_action.activate.connect (on_hosts_add_action);
-        add_action (hosts_add_action);
-
-        var hosts_reload_action = new SimpleAction ("hosts-reload", null);
-        hosts_reload_action.activate.connect (on_hosts_reload_action);
-        add_action (hosts_reload_action);
-
-        var hosts_remove_all_action = new SimpleAction ("hosts-remove-all", null);
-        hosts_remove_all_action.activate.connect (on_hosts_remove_all_action);
-        add_action (hosts_remove_all_action);
-
-        // Known Hosts actions
-        var known_hosts_import_action = new SimpleAction ("known-hosts-import", null);
-        known_hosts_import_action.activate.connect (on_known_hosts_import_action);
-        add_action (known_hosts_import_action);
-
-        var known_hosts_export_action = new SimpleAction ("known-hosts-export", null);
-        known_hosts_export_action.activate.connect (on_known_hosts_export_action);
-        add_action (known_hosts_export_action);
-
-        var known_hosts_refresh_action = new SimpleAction ("known-hosts-refresh", null);
-        known_hosts_refresh_action.activate.connect (on_known_hosts_refresh_action);
-        add_action (known_hosts_refresh_action);
-
-        var known_hosts_remove_stale_action = new SimpleAction ("known-hosts-remove-stale", null);
-        known_hosts_remove_stale_action.activate.connect (on_known_hosts_remove_stale_action);
-        add_action (known_hosts_remove_stale_action);
-
-        // Backup actions
-        var backup_create_regular_action = new SimpleAction ("backup-create-regular", null);
-        backup_create_regular_action.activate.connect (on_backup_create_regular_action);
-        add_action (backup_create_regular_action);
-
-        var backup_refresh_regular_action = new SimpleAction ("backup-refresh-regular", null);
-        backup_refresh_regular_action.activate.connect (on_backup_refresh_regular_action);
-        add_action (backup_refresh_regular_action);
-
-        var backup_remove_all_regular_action = new SimpleAction ("backup-remove-all-regular", null);
-        backup_remove_all_regular_action.activate.connect (on_backup_remove_all_regular_action);
-        add_action (backup_remove_all_regular_action);
-
-        var backup_create_emergency_action = new SimpleAction ("backup-create-emergency", null);
-        backup_create_emergency_action.activate.connect (on_backup_create_emergency_action);
-        add_action (backup_create_emergency_action);
-
-        var backup_refresh_emergency_action = new SimpleAction ("backup-refresh-emergency", null);
-        backup_refresh_emergency_action.activate.connect (on_backup_refresh_emergency_action);
-        add_action (backup_refresh_emergency_action);
-
-        var backup_remove_all_emergency_action = new SimpleAction ("backup-remove-all-emergency", null);
-        backup_remove_all_emergency_action.activate.connect (on_backup_remove_all_emergency_action);
-        add_action (backup_remove_all_emergency_action);
+        ActionEntry[] action_entries = {
+            // Key actions
+            { "generate-key", on_generate_key_action },
+            { "add-existing-key", on_add_existing_key_action },
+            { "refresh", on_refresh_action },
+            { "help", on_help_action },
+
+            // Hosts actions
+            { "hosts-add", on_hosts_add_action },
+            { "hosts-reload", on_hosts_reload_action },
+            { "hosts-remove-all", on_hosts_remove_all_action },
+
+            // Known Hosts actions
+            { "known-hosts-import", on_known_hosts_import_action },
+            { "known-hosts-export", on_known_hosts_export_action },
+            { "known-hosts-refresh", on_known_hosts_refresh_action },
+            { "known-hosts-remove-stale", on_known_hosts_remove_stale_action },
+
+            // Backup actions
+            { "backup-create-regular", on_backup_create_regular_action },
+            { "backup-refresh-regular", on_backup_refresh_regular_action },
+            { "backup-remove-all-regular", on_backup_remove_all_regular_action },
+            { "backup-create-emergency", on_backup_create_emergency_action },
+            { "backup-refresh-emergency", on_backup_refresh_emergency_action },
+            { "backup-remove-all-emergency", on_backup_remove_all_emergency_action }
+        };
+        add_action_entries (action_entries, this);
     }
     
     private void setup_page_signals () {
@@ -256,7 +198,7 @@ public class KeyMaker.Window : Adw.ApplicationWindow {
     }
 
     private void on_backup_remove_all_regular_action () {
-        backup_page.remove_all_regular_backups_ui ();
+        backup_page.remove_all_regular_backups_ui.begin ();
     }
 
     private void on_backup_create_emergency_action () {
@@ -268,13 +210,13 @@ public class KeyMaker.Window : Adw.ApplicationWindow {
     }
 
     private void on_backup_remove_all_emergency_action () {
-        backup_page.remove_all_emergency_backups_ui ();
+        backup_page.remove_all_emergency_backups_ui.begin ();
     }
 
 
     
     private void on_key_copy_requested (SSHKey ssh_key) {
-        copy_public_key_to_clipboard (ssh_key);
+        copy_public_key_to_clipboard.begin (ssh_key);
     }
     
     private void on_key_delete_requested (SSHKey ssh_key) {
@@ -292,7 +234,7 @@ public class KeyMaker.Window : Adw.ApplicationWindow {
     }
     
     private void on_key_details_requested (SSHKey ssh_key) {
-        var dialog = new KeyMaker.KeyDetailsDialog (this, ssh_key);
+        var dialog = new KeyMaker.KeyDetailsDialog (this, ssh_key, clipboard);
         dialog.present (this);
     }
     
@@ -303,7 +245,10 @@ public class KeyMaker.Window : Adw.ApplicationWindow {
     }
     
     private void on_key_copy_id_requested (SSHKey ssh_key) {
-        var dialog = new KeyMaker.CopyIdDialog (this, ssh_key);
+        var dialog = new KeyMaker.CopyIdDialog (this, ssh_key, clipboard);
+        dialog.command_copied.connect (() => {
+            show_toast (_("ssh-copy-id command copied to clipboard"));
+        });
         dialog.present (this);
     }
     
@@ -348,15 +293,19 @@ public class KeyMaker.Window : Adw.ApplicationWindow {
         show_toast (_("Passphrase changed for key '%s'").printf (updated_key.get_display_name ()));
     }
     
-    private void copy_public_key_to_clipboard (SSHKey ssh_key) {
+    private async void copy_public_key_to_clipboard (SSHKey ssh_key) {
         try {
-            var content = SSHOperations.get_public_key_content (ssh_key);
-            
-            var clipboard = get_clipboard ();
-            clipboard.set_text (content);
+            // Keys not read at scan time are loaded off the main loop
+            var content = yield SSHOperations.get_public_key_content_async (ssh_key);
             
+            // Feedback first; the clipboard is claimed once the toast is queued
             show_toast (_("Public key copied to clipboard"));
             
+            Idle.add (() => {
+                clipboard.set_text (content);
+                return false;
+            });
+            
         } catch (KeyMakerError e) {
             show_toast (_("Failed to copy public key: %s").printf (e.message));
             warning ("Failed to copy public key: %s", e.message);
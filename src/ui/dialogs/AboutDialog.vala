@@ -72,55 +72,88 @@ public class KeyMaker.AboutDialog : GLib.Object {
     }
     
     
+    // Release notes resolved from metainfo, memoized for the process lifetime
+    private static string? cached_release_notes = null;
+    private static bool release_notes_resolved = false;
+
     private static void load_release_notes(Adw.AboutDialog about) {
-        // Load and set release notes from appdata
-        try {
-            var appdata_path = Path.build_filename(Config.DATADIR, "metainfo", "%s.metainfo.xml".printf(Config.APP_ID));
+        if (!release_notes_resolved) {
+            cached_release_notes = read_release_notes();
+            release_notes_resolved = true;
+        }
+
+        if (cached_release_notes != null) {
+            about.set_release_notes(cached_release_notes);
+            about.set_release_notes_version(Config.VERSION);
+        }
+    }
+
+    private static string? read_metainfo() {
+        var metainfo_name = "%s.metainfo.xml".printf(Config.APP_ID);
+
+        // KEYMAKER_METAINFO lets packaging point straight at the file and skip probing
+        var override_path = Environment.get_variable("KEYMAKER_METAINFO");
+        string[] candidates = override_path != null ? new string[] { override_path } : new string[] {
+            Path.build_filename(Config.DATADIR, "metainfo", metainfo_name),
             // Fallback for flatpak dev environment where prefix might be /app
-            if (!FileUtils.test(appdata_path, FileTest.EXISTS)) {
-               appdata_path = Path.build_filename("/app/share/metainfo", "%s.metainfo.xml".printf(Config.APP_ID));
-            }
+            Path.build_filename("/app/share/metainfo", metainfo_name)
+        };
 
-            var file = File.new_for_path(appdata_path);
-            
-            if (file.query_exists()) {
+        foreach (var candidate in candidates) {
+            // load_contents already fails on a missing file, no separate exists probe needed
+            try {
                 uint8[] contents;
-                file.load_contents(null, out contents, null);
-                string xml_content = (string) contents;
-                
-                // Parse the XML to find the release matching Config.VERSION
-                var parser = new Regex("<release version=\"%s\"[^>]*>(.*?)</release>".printf(Regex.escape_string(Config.VERSION)), 
-                                       RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
-                MatchInfo match_info;
-                
-                if (parser.match(xml_content, 0, out match_info)) {
-                    string release_section = match_info.fetch(1);
-                    
-                    // Extract description content
-                    var desc_parser = new Regex("<description>(.*?)</description>", 
-                                                RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
-                    MatchInfo desc_match;
-                    
-                    if (desc_parser.match(release_section, 0, out desc_match)) {
-                        string release_notes = desc_match.fetch(1).strip();
-                        
-                        // Strip <a> tags as Adw.AboutDialog's parser doesn't support them
-                        // We keep the text content inside the tag
-                        try {
-                            var link_regex = new Regex("<a[^>]*>(.*?)</a>", RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
-                            release_notes = link_regex.replace(release_notes, -1, 0, "\\1");
-                        } catch (Error e) {
-                            warning("Failed to strip link tags: %s", e.message);
-                        }
+                File.new_for_path(candidate).load_contents(null, out contents, null);
+                return (string) contents;
+            } catch (Error e) {
+                continue;
+            }
+        }
+        return null;
+    }
 
-                        about.set_release_notes(release_notes);
-                        about.set_release_notes_version(Config.VERSION);
-                    }
-                }
+    private static string? read_release_notes() {
+        // Load and set release notes from appdata
+        var xml_content = read_metainfo();
+        if (xml_content == null) {
+            return null;
+        }
+
+        try {
+            // Parse the XML to find the release matching Config.VERSION
+            var parser = new Regex("<release version=\"%s\"[^>]*>(.*?)</release>".printf(Regex.escape_string(Config.VERSION)), 
+                                   RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
+            MatchInfo match_info;
+            
+            if (!parser.match(xml_content, 0, out match_info)) {
+                return null;
             }
+            string release_section = match_info.fetch(1);
+            
+            // Extract description content
+            var desc_parser = new Regex("<description>(.*?)</description>", 
+                                        RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
+            MatchInfo desc_match;
+            
+            if (!desc_parser.match(release_section, 0, out desc_match)) {
+                return null;
+            }
+            string release_notes = desc_match.fetch(1).strip();
+            
+            // Strip <a> tags as Adw.AboutDialog's parser doesn't support them
+            // We keep the text content inside the tag
+            try {
+                var link_regex = new Regex("<a[^>]*>(.*?)</a>", RegexCompileFlags.DOTALL | RegexCompileFlags.MULTILINE);
+                release_notes = link_regex.replace(release_notes, -1, 0, "\\1");
+            } catch (Error e) {
+                warning("Failed to strip link tags: %s", e.message);
+            }
+
+            return release_notes;
         } catch (Error e) {
             // If we can't load release notes from appdata, that's okay
             warning("Could not load release notes from appdata: %s", e.message);
+            return null;
         }
     }
 }
\ No newline at end of file
@@ -42,7 +42,7 @@ public class KeyMaker.AddKeyToAgentDialog : Adw.Dialog {
     construct {
         selected_key = null;
         setup_signals ();
-        populate_keys_list ();
+        populate_keys_list.begin ();
         update_ui_state ();
     }
     
@@ -53,7 +53,7 @@ public class KeyMaker.AddKeyToAgentDialog : Adw.Dialog {
         enable_timeout_row.notify["active"].connect (on_timeout_toggled);
     }
     
-    private void populate_keys_list () {
+    private async void populate_keys_list () {
         debug ("AddKeyToAgentDialog: Starting to populate keys list directly");
         
         // Initialize the array if it's null
@@ -66,17 +66,20 @@ public class KeyMaker.AddKeyToAgentDialog : Adw.Dialog {
         }
         
         // Load keys directly using the same approach as main window
-        load_keys_directly ();
+        yield load_keys_directly ();
         
         debug ("AddKeyToAgentDialog: Loaded %u keys directly", available_keys.length);
         
+        // One agent listing for all keys, read without blocking the dialog
+        var loaded_fingerprints = yield list_agent_fingerprints ();
+        
         // Now populate the UI with loaded keys
         for (int i = 0; i < available_keys.length; i++) {
             var key = available_keys[i];
             debug ("AddKeyToAgentDialog: Processing key: %s", key.get_display_name ());
             
-            // Skip if key is already loaded in agent (using synchronous check)
-            bool is_loaded = is_key_loaded_in_agent_sync (key.fingerprint);
+            // Skip if key is already loaded in agent
+            bool is_loaded = loaded_fingerprints.contains (key.fingerprint);
             debug ("AddKeyToAgentDialog: Key %s is loaded in agent: %s", key.get_display_name (), is_loaded.to_string ());
             if (is_loaded) {
                 continue;
@@ -90,82 +93,100 @@ public class KeyMaker.AddKeyToAgentDialog : Adw.Dialog {
         debug ("AddKeyToAgentDialog: Finished populating keys list");
     }
     
-    private void load_keys_directly () {
+    private const string LISTING_ATTRIBUTES = FileAttribute.STANDARD_NAME + "," + FileAttribute.STANDARD_TYPE + "," + FileAttribute.TIME_MODIFIED;
+    
+    private async void load_keys_directly () {
         debug ("AddKeyToAgentDialog: Starting direct key loading");
         
         try {
             // Simple file-based SSH key detection - same as main window
-            var ssh_dir = File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+            var ssh_dir = KeyMaker.Filesystem.ssh_dir ();
             
-            if (!ssh_dir.query_exists ()) {
+            debug ("AddKeyToAgentDialog: Scanning SSH directory: %s", ssh_dir.get_path ());
+            
+            // Type and mtime come with the listing, so pairs are matched without a stat per file
+            FileEnumerator enumerator;
+            try {
+                enumerator = yield ssh_dir.enumerate_children_async (LISTING_ATTRIBUTES, FileQueryInfoFlags.NONE);
+            } catch (IOError.NOT_FOUND e) {
                 debug ("AddKeyToAgentDialog: SSH directory does not exist");
                 return;
             }
+            var key_count = 0;
             
-            debug ("AddKeyToAgentDialog: Scanning SSH directory: %s", ssh_dir.get_path ());
+            var names = new GenericSet<string> (str_hash, str_equal);
+            var candidates = new GenericArray<FileInfo> ();
+            var files = yield enumerator.next_files_async (100);
+            while (files.length () > 0) {
+                foreach (var info in files) {
+                    var name = info.get_name ();
+                    names.add (name);
+                    
+                    // Look for private key files (no .pub extension)
+                    if (info.get_file_type () == FileType.REGULAR && name.has_prefix ("id_") && !name.has_suffix (".pub")) {
+                        candidates.add (info);
+                    }
+                }
+                files = yield enumerator.next_files_async (100);
+            }
             
-            var enumerator = ssh_dir.enumerate_children (FileAttribute.STANDARD_NAME, FileQueryInfoFlags.NONE);
-            var key_count = 0;
+            // Keep only private keys whose public key was listed too
+            var private_paths = new GenericArray<File> ();
+            var private_infos = new GenericArray<FileInfo> ();
+            foreach (var candidate in candidates) {
+                if (names.contains (candidate.get_name () + ".pub")) {
+                    debug ("AddKeyToAgentDialog: Found SSH key pair: %s", candidate.get_name ());
+                    private_paths.add (ssh_dir.get_child (candidate.get_name ()));
+                    private_infos.add (candidate);
+                }
+            }
             
-            FileInfo? info;
-            while ((info = enumerator.next_file ()) != null) {
-                var filename = info.get_name ();
+            // Inspect all pairs at once instead of one ssh-keygen run after another
+            var key_infos = yield SSHOperations.get_key_infos (private_paths);
+            
+            for (int i = 0; i < private_paths.length; i++) {
+                var private_path = private_paths[i];
+                var filename = private_infos[i].get_name ();
+                var public_path = ssh_dir.get_child (filename + ".pub");
+                var key_info = key_infos[i];
                 
-                // Look for private key files (no .pub extension)
-                if (filename.has_prefix ("id_") && !filename.has_suffix (".pub")) {
-                    var private_path = ssh_dir.get_child (filename);
-                    var public_path = File.new_for_path (private_path.get_path () + ".pub");
-                    
-                    // Check if both private and public key exist
-                    if (private_path.query_exists () && public_path.query_exists ()) {
-                        debug ("AddKeyToAgentDialog: Found SSH key pair: %s", filename);
-                        
-                        try {
-                            // Get file modification time
-                            var file_info = private_path.query_info (FileAttribute.TIME_MODIFIED, FileQueryInfoFlags.NONE);
-                            var timestamp = file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
-                            var last_modified = new DateTime.from_unix_local ((int64) timestamp);
-                            
-                            // Detect key type and other properties
-                            var key_type = SSHOperations.get_key_type_sync (private_path);
-                            var fingerprint = SSHOperations.get_fingerprint_sync (private_path);
-                            var bit_size = SSHOperations.extract_bit_size_sync (private_path);
-                            
-                            // Extract comment from public key file
-                            string? comment = null;
-                            try {
-                                uint8[] contents;
-                                public_path.load_contents (null, out contents, null);
-                                var public_key_content = ((string) contents).strip ();
-                                var parts = public_key_content.split (" ");
-                                if (parts.length >= 3) {
-                                    comment = parts[2]; // Third part is usually the comment
-                                }
-                            } catch (Error e) {
-                                debug ("AddKeyToAgentDialog: Error reading comment: %s", e.message);
-                            }
-                            
-                            // Create SSH key object
-                            var ssh_key = new SSHKey (
-                                private_path,
-                                public_path,
-                                key_type,
-                                fingerprint,
-                                comment,
-                                last_modified,
-                                bit_size
-                            );
-                            
-                            available_keys.add (ssh_key);
-                            key_count++;
-                            
-                            debug ("AddKeyToAgentDialog: Successfully loaded key: %s", filename);
-                            
-                        } catch (Error e) {
-                            debug ("AddKeyToAgentDialog: Error loading key %s: %s", filename, e.message);
-                        }
+                if (key_info == null) {
+                    debug ("AddKeyToAgentDialog: Could not read key properties for %s", filename);
+                    continue;
+                }
+                
+                var timestamp = private_infos[i].get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
+                var last_modified = new DateTime.from_unix_local ((int64) timestamp);
+                
+                // Extract comment from public key file
+                string? comment = null;
+                try {
+                    uint8[] contents;
+                    yield public_path.load_contents_async (null, out contents, null);
+                    var public_key_content = ((string) contents).strip ();
+                    var parts = public_key_content.split (" ", 3);
+                    if (parts.length >= 3) {
+                        comment = parts[2]; // Third part is usually the comment
                     }
+                } catch (Error e) {
+                    debug ("AddKeyToAgentDialog: Error reading comment: %s", e.message);
                 }
+                
+                // Create SSH key object
+                var ssh_key = new SSHKey (
+                    private_path,
+                    public_path,
+                    key_info.key_type,
+                    key_info.fingerprint,
+                    comment,
+                    last_modified,
+                    key_info.bit_size
+                );
+                
+                available_keys.add (ssh_key);
+                key_count++;
+                
+                debug ("AddKeyToAgentDialog: Successfully loaded key: %s", filename);
             }
             
             debug ("AddKeyToAgentDialog: Successfully loaded %d SSH key pairs", key_count);
@@ -241,8 +262,8 @@ public class KeyMaker.AddKeyToAgentDialog : Adw.Dialog {
                 timeout = (int) timeout_row.value * 60; // Convert minutes to seconds
             }
             
-            // Use synchronous version to avoid async subprocess crashes
-            add_key_to_agent_sync (selected_key.private_path, timeout);
+            // ssh-add runs asynchronously, so the spinner keeps animating while it waits
+            yield ssh_agent.add_key_to_agent (selected_key.private_path, timeout);
             
             close ();
             
@@ -256,86 +277,22 @@ public class KeyMaker.AddKeyToAgentDialog : Adw.Dialog {
         }
     }
     
-    // Synchronous version to avoid async subprocess crashes
-    private void add_key_to_agent_sync (File private_key_path, int? timeout_seconds = null) throws Error {
-        debug ("AddKeyToAgentDialog: Adding key to agent synchronously: %s", private_key_path.get_path ());
-        
-        var cmd_list = new GenericArray<string> ();
-        cmd_list.add ("ssh-add");
-        
-        if (timeout_seconds != null && timeout_seconds > 0) {
-            cmd_list.add ("-t");
-            cmd_list.add (timeout_seconds.to_string ());
-        }
-        
-        cmd_list.add (private_key_path.get_path ());
-        
-        string[] cmd = new string[cmd_list.length + 1];
-        for (int i = 0; i < cmd_list.length; i++) {
-            cmd[i] = cmd_list[i];
-        }
-        cmd[cmd_list.length] = null;
-        
-        debug ("AddKeyToAgentDialog: Executing command: %s", string.joinv (" ", cmd));
-        
-        // Use synchronous subprocess to avoid crashes
-        string stdout_output, stderr_output;
-        int exit_status;
-        
-        bool success = Process.spawn_sync (
-            null, // working_directory
-            cmd,
-            null, // envp
-            SpawnFlags.SEARCH_PATH,
-            null, // child_setup
-            out stdout_output,
-            out stderr_output,
-            out exit_status
-        );
-        
-        if (!success) {
-            throw new IOError.FAILED ("Failed to execute ssh-add command");
-        }
-        
-        if (exit_status != 0) {
-            debug ("AddKeyToAgentDialog: ssh-add failed with exit status %d", exit_status);
-            debug ("AddKeyToAgentDialog: stderr: %s", stderr_output);
-            throw new IOError.FAILED ("ssh-add failed: %s".printf (stderr_output.strip ()));
-        }
-        
-        debug ("AddKeyToAgentDialog: Successfully added key to SSH agent");
-    }
-    
-    // Synchronous method to check if a key is already loaded in SSH agent
-    private bool is_key_loaded_in_agent_sync (string fingerprint) {
+    // Output of ssh-add -l, which lists the fingerprint of every key the agent holds
+    private async string list_agent_fingerprints () {
         try {
-            string stdout_output, stderr_output;
-            int exit_status;
-            
-            string[] cmd = {"ssh-add", "-l", null};
+            string[] cmd = {"ssh-add", "-l"};
+            var result = yield KeyMaker.Command.run_capture (cmd);
             
-            bool success = Process.spawn_sync (
-                null, // working_directory
-                cmd,
-                null, // envp
-                SpawnFlags.SEARCH_PATH,
-                null, // child_setup
-                out stdout_output,
-                out stderr_output,
-                out exit_status
-            );
-            
-            if (!success || exit_status != 0) {
+            if (result.status != 0) {
                 // Agent not available or no keys loaded
-                return false;
+                return "";
             }
             
-            // Check if our fingerprint is in the output
-            return stdout_output.contains (fingerprint);
+            return result.stdout;
             
-        } catch (Error e) {
-            debug ("AddKeyToAgentDialog: Error checking if key is loaded: %s", e.message);
-            return false;
+        } catch (KeyMakerError e) {
+            debug ("AddKeyToAgentDialog: Error checking loaded keys: %s", e.message);
+            return "";
         }
     }
     
@@ -117,7 +117,7 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
         }
         
         if (remove_all_regular_backups_button != null) {
-            remove_all_regular_backups_button.clicked.connect (on_remove_all_regular_backups);
+            remove_all_regular_backups_button.clicked.connect (() => on_remove_all_regular_backups.begin ());
         }
         
         // Emergency vault page signals
@@ -130,7 +130,7 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
         }
         
         if (remove_all_emergency_backups_button != null) {
-            remove_all_emergency_backups_button.clicked.connect (on_remove_all_emergency_backups);
+            remove_all_emergency_backups_button.clicked.connect (() => on_remove_all_emergency_backups.begin ());
         }
         
         // Backend signals
@@ -302,7 +302,7 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
         delete_button.tooltip_text = "Delete Backup";
         delete_button.add_css_class ("flat");
         delete_button.add_css_class ("destructive-action");
-        delete_button.clicked.connect (() => delete_regular_backup (backup));
+        delete_button.clicked.connect (() => delete_regular_backup.begin (backup));
         button_box.append (delete_button);
         
         row.add_suffix (button_box);
@@ -383,7 +383,7 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
                 delete_button.tooltip_text = "Cannot delete time-locked backup until unlock time";
             }
         }
-        delete_button.clicked.connect (() => delete_emergency_backup (backup));
+        delete_button.clicked.connect (() => delete_emergency_backup.begin (backup));
         button_box.append (delete_button);
         
         row.add_suffix (button_box);
@@ -393,12 +393,7 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
     }
     
     private void clear_list_box (Gtk.ListBox list_box) {
-        Gtk.Widget? child = list_box.get_first_child ();
-        while (child != null) {
-            var next = child.get_next_sibling ();
-            list_box.remove (child);
-            child = next;
-        }
+        list_box.remove_all ();
     }
     
     // Signal handlers
@@ -423,38 +418,32 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
         update_vault_health_indicator ();
     }
     
-    private void on_remove_all_regular_backups () {
-        var alert = new Adw.AlertDialog ("Remove All Regular Backups?", 
-                                          "Are you sure you want to remove all regular backups? This action cannot be undone.");
-        alert.add_response ("cancel", "Cancel");
-        alert.add_response ("remove", "Remove All");
-        alert.set_response_appearance ("remove", Adw.ResponseAppearance.DESTRUCTIVE);
-        alert.set_default_response ("cancel");
-        
-        alert.response.connect ((response) => {
-            if (response == "remove") {
-                remove_all_regular_backups.begin ();
-            }
-        });
+    private async void on_remove_all_regular_backups () {
+        var confirmed = yield DialogHelpers.confirm_destructive (
+            this,
+            "Remove All Regular Backups?",
+            "Are you sure you want to remove all regular backups? This action cannot be undone.",
+            "remove", "Remove All"
+        );
+        if (!confirmed) {
+            return;
+        }
         
-        alert.present (this);
+        yield remove_all_regular_backups ();
     }
     
-    private void on_remove_all_emergency_backups () {
-        var alert = new Adw.AlertDialog ("Remove All Emergency Backups?", 
-                                          "Are you sure you want to remove all emergency backups? This will require authentication and cannot be undone.");
-        alert.add_response ("cancel", "Cancel");
-        alert.add_response ("remove", "Remove All");
-        alert.set_response_appearance ("remove", Adw.ResponseAppearance.DESTRUCTIVE);
-        alert.set_default_response ("cancel");
-        
-        alert.response.connect ((response) => {
-            if (response == "remove") {
-                show_emergency_auth_and_delete_all ();
-            }
-        });
+    private async void on_remove_all_emergency_backups () {
+        var confirmed = yield DialogHelpers.confirm_destructive (
+            this,
+            "Remove All Emergency Backups?",
+            "Are you sure you want to remove all emergency backups? This will require authentication and cannot be undone.",
+            "remove", "Remove All"
+        );
+        if (!confirmed) {
+            return;
+        }
         
-        alert.present (this);
+        show_emergency_auth_and_delete_all ();
     }
     
     private void on_regular_backup_created (RegularBackupEntry backup) {
@@ -480,7 +469,7 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
         });
 
         dialog.delete_requested.connect ((b) => {
-            delete_regular_backup (b);
+            delete_regular_backup.begin (b);
         });
 
         dialog.present (this);
@@ -491,27 +480,24 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
         dialog.present (this);
     }
     
-    private void delete_regular_backup (RegularBackupEntry backup) {
-        var alert = new Adw.AlertDialog ("Delete Backup?", 
-                                          @"Are you sure you want to delete the backup \"$(backup.name)\"?");
-        alert.add_response ("cancel", "Cancel");
-        alert.add_response ("delete", "Delete");
-        alert.set_response_appearance ("delete", Adw.ResponseAppearance.DESTRUCTIVE);
-        alert.set_default_response ("cancel");
-        
-        alert.response.connect ((response) => {
-            if (response == "delete") {
-                bool success = backup_manager.remove_backup (backup);
-                if (success) {
-                    refresh_overview_stats ();
-                    populate_regular_backups_list ();
-                } else {
-                    show_error ("Delete Failed", "Could not delete backup");
-                }
-            }
-        });
+    private async void delete_regular_backup (RegularBackupEntry backup) {
+        var confirmed = yield DialogHelpers.confirm_destructive (
+            this,
+            "Delete Backup?",
+            @"Are you sure you want to delete the backup \"$(backup.name)\"?",
+            "delete", "Delete"
+        );
+        if (!confirmed) {
+            return;
+        }
         
-        alert.present (this);
+        bool success = backup_manager.remove_backup (backup);
+        if (success) {
+            refresh_overview_stats ();
+            populate_regular_backups_list ();
+        } else {
+            show_error ("Delete Failed", "Could not delete backup");
+        }
     }
     
     private void show_emergency_backup_details (BackupEntry backup) {
@@ -525,7 +511,7 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
         });
 
         dialog.delete_requested.connect ((b) => {
-            delete_emergency_backup (backup);
+            delete_emergency_backup.begin (backup);
         });
 
         dialog.present (this);
@@ -549,22 +535,19 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
         dialog.present (this);
     }
     
-    private void delete_emergency_backup (BackupEntry backup) {
+    private async void delete_emergency_backup (BackupEntry backup) {
         // For emergency backups, use the same authentication as restore
-        var alert = new Adw.AlertDialog ("Delete Emergency Backup?", 
-                                          @"Deleting \"$(backup.name)\" requires the same authentication as restoring it. Continue?");
-        alert.add_response ("cancel", "Cancel");
-        alert.add_response ("continue", "Continue");
-        alert.set_response_appearance ("continue", Adw.ResponseAppearance.DESTRUCTIVE);
-        alert.set_default_response ("cancel");
-        
-        alert.response.connect ((response) => {
-            if (response == "continue") {
-                show_emergency_auth_and_delete_single (backup);
-            }
-        });
+        var confirmed = yield DialogHelpers.confirm_destructive (
+            this,
+            "Delete Emergency Backup?",
+            @"Deleting \"$(backup.name)\" requires the same authentication as restoring it. Continue?",
+            "continue", "Continue"
+        );
+        if (!confirmed) {
+            return;
+        }
         
-        alert.present (this);
+        show_emergency_auth_and_delete_single (backup);
     }
     
     private void migrate_legacy_backups () {
@@ -630,10 +613,7 @@ public class KeyMaker.BackupCenterDialog : Adw.Dialog {
     }
     
     private void show_error (string title, string message) {
-        var error_dialog = new Adw.AlertDialog (title, message);
-        error_dialog.add_response ("ok", "OK");
-        error_dialog.set_default_response ("ok");
-        error_dialog.present (this);
+        DialogHelpers.show_error (this, title, message);
     }
 
     // New bulk deletion and helper methods
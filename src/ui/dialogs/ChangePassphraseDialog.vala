@@ -46,6 +46,12 @@ public class KeyMaker.ChangePassphraseDialog : Adw.Dialog {
     
     private bool key_has_passphrase = false;
     
+    // Result of the last new/confirm comparison, reused while only the current passphrase changes
+    private bool passphrases_match = true;
+    
+    // Cancels the passphrase probe if the dialog is closed before it finishes
+    private Cancellable cancellable = new Cancellable ();
+    
     
     public ChangePassphraseDialog (Gtk.Window parent, SSHKey ssh_key) {
         Object (
@@ -54,16 +60,20 @@ public class KeyMaker.ChangePassphraseDialog : Adw.Dialog {
     }
     
     construct {
-        // Connect validation signals
-        current_passphrase_row.notify["text"].connect (validate_form);
-        new_passphrase_row.notify["text"].connect (validate_form);
-        confirm_passphrase_row.notify["text"].connect (validate_form);
+        // Connect validation signals; only the new/confirm pair needs the comparison
+        current_passphrase_row.changed.connect (update_change_button);
+        new_passphrase_row.changed.connect (validate_form);
+        confirm_passphrase_row.changed.connect (validate_form);
         
         // Connect button signals
         change_button.clicked.connect (() => {
             change_passphrase_async.begin ();
         });
         
+        closed.connect (() => {
+            cancellable.cancel ();
+        });
+        
         // Initialize dialog based on key state
         initialize_dialog.begin ();
     }
@@ -71,7 +81,7 @@ public class KeyMaker.ChangePassphraseDialog : Adw.Dialog {
     private async void initialize_dialog () {
         try {
             // Check if key has passphrase
-            key_has_passphrase = yield SSHMetadata.has_passphrase (ssh_key);
+            key_has_passphrase = yield SSHMetadata.has_passphrase (ssh_key, cancellable);
             
             // Update UI based on key state
             if (key_has_passphrase) {
@@ -91,6 +101,9 @@ public class KeyMaker.ChangePassphraseDialog : Adw.Dialog {
             // Initial validation
             validate_form ();
             
+        } catch (KeyMakerError.OPERATION_CANCELLED e) {
+            // Dialog was closed while checking
+            return;
         } catch (KeyMakerError e) {
             warning ("Failed to check passphrase status: %s", e.message);
             // Default to assuming key has passphrase for safety
@@ -102,26 +115,30 @@ public class KeyMaker.ChangePassphraseDialog : Adw.Dialog {
     }
     
     private void validate_form () {
-        var current_passphrase = current_passphrase_row.get_text ();
-        var new_passphrase = new_passphrase_row.get_text ();
-        var confirm_passphrase = confirm_passphrase_row.get_text ();
-        
+        passphrases_match = new_passphrase_row.get_text () == confirm_passphrase_row.get_text ();
+        update_change_button ();
+    }
+    
+    private void update_change_button () {
         bool is_valid = false;
         
         // Check if new passphrase matches confirmation
-        if (new_passphrase != confirm_passphrase) {
+        if (!passphrases_match) {
             is_valid = false;
         } else {
             if (key_has_passphrase) {
                 // Key has passphrase - current passphrase is required
-                is_valid = current_passphrase.length > 0;
+                is_valid = current_passphrase_row.get_text ().length > 0;
             } else {
                 // Key has no passphrase - require non-empty new passphrase to add one
-                is_valid = new_passphrase.length > 0;
+                is_valid = new_passphrase_row.get_text ().length > 0;
             }
         }
         
-        change_button.set_sensitive (is_valid);
+        // Avoid a property notification and style update when nothing changed
+        if (change_button.sensitive != is_valid) {
+            change_button.set_sensitive (is_valid);
+        }
     }
     
     
@@ -132,6 +149,7 @@ public class KeyMaker.ChangePassphraseDialog : Adw.Dialog {
         // Disable the change button to prevent double-clicking
         change_button.set_sensitive (false);
         change_button.set_label (key_has_passphrase ? _("Changing...") : _("Adding..."));
+        current_passphrase_row.remove_css_class ("error");
         
         try {
             // Create request
@@ -153,6 +171,12 @@ public class KeyMaker.ChangePassphraseDialog : Adw.Dialog {
         } catch (KeyMakerError e) {
             warning ("Failed to change passphrase: %s", e.message);
             
+            if (e is KeyMakerError.ACCESS_DENIED) {
+                // Wrong current passphrase: point at the field to retype
+                current_passphrase_row.add_css_class ("error");
+                current_passphrase_row.grab_focus ();
+            }
+            
             // Re-enable the button with original label
             change_button.set_sensitive (true);
             change_button.set_label (original_label);
@@ -35,10 +35,20 @@ public class KeyMaker.CopyIdDialog : Adw.Dialog {
     
     public SSHKey ssh_key { get; construct; }
     
+    // Signals
+    public signal void command_copied ();
     
-    public CopyIdDialog (Gtk.Window parent, SSHKey ssh_key) {
+    // Pending validate_form run, so a burst of keystrokes is checked once
+    private uint validate_timeout_id = 0;
+    private const uint VALIDATE_DELAY_MS = 50;
+    
+    // Handed over by the window that opens the dialog
+    public Gdk.Clipboard clipboard { get; construct; }
+    
+    public CopyIdDialog (Gtk.Window parent, SSHKey ssh_key, Gdk.Clipboard clipboard) {
         Object (
-            ssh_key: ssh_key
+            ssh_key: ssh_key,
+            clipboard: clipboard
         );
     }
     
@@ -52,9 +62,18 @@ public class KeyMaker.CopyIdDialog : Adw.Dialog {
         // Note: set_increments is not available in this version of libadwaita
         
         // Connect signals for form validation
-        hostname_row.notify["text"].connect (validate_form);
-        username_row.notify["text"].connect (validate_form);
+        hostname_row.notify["text"].connect (schedule_validation);
+        username_row.notify["text"].connect (schedule_validation);
+        
+        // Connect button signals
+        copy_button.clicked.connect (on_copy_clicked);
         
+        closed.connect (() => {
+            if (validate_timeout_id != 0) {
+                Source.remove (validate_timeout_id);
+                validate_timeout_id = 0;
+            }
+        });
         
         // Set initial focus
         hostname_row.grab_focus ();
@@ -63,6 +82,17 @@ public class KeyMaker.CopyIdDialog : Adw.Dialog {
         validate_form ();
     }
     
+    private void schedule_validation () {
+        if (validate_timeout_id != 0) {
+            Source.remove (validate_timeout_id);
+        }
+        validate_timeout_id = Timeout.add (VALIDATE_DELAY_MS, () => {
+            validate_timeout_id = 0;
+            validate_form ();
+            return Source.REMOVE;
+        });
+    }
+    
     private void validate_form () {
         var hostname = hostname_row.get_text ().strip ();
         var username = username_row.get_text ().strip ();
@@ -71,5 +101,34 @@ public class KeyMaker.CopyIdDialog : Adw.Dialog {
         copy_button.set_sensitive (hostname != "" && username != "");
     }
     
+    private void on_copy_clicked () {
+        var request = new SSHCopyIDRequest (
+            ssh_key,
+            hostname_row.get_text ().strip (),
+            username_row.get_text ().strip ()
+        ) {
+            port = (int) port_row.get_value ()
+        };
+        
+        try {
+            request.validate ();
+        } catch (KeyMakerError e) {
+            warning ("Invalid copy-id request: %s", e.message);
+            DialogHelpers.show_error (this, _("Invalid Connection Details"), e.message);
+            return;
+        }
+        
+        // Hand the command over via the clipboard; no connection is made from here.
+        // The dialog closes first and the clipboard is claimed on the next idle,
+        // so selection ownership never delays the close
+        var command = request.get_command ();
+        command_copied ();
+        close ();
+        Idle.add (() => {
+            clipboard.set_text (command);
+            return false;
+        });
+    }
+    
     // Toast functionality removed - no overlay in this template
 }
\ No newline at end of file
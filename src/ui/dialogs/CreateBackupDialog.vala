@@ -37,14 +37,11 @@ public class KeyMaker.CreateBackupDialog : Adw.Dialog {
     private unowned Adw.ActionRow qr_warning_row;
     
     [GtkChild]
-    private unowned Adw.PreferencesGroup keys_group;
+    private unowned Gtk.Stack keys_stack;
     
     [GtkChild]
     private unowned Gtk.ListBox keys_list;
     
-    [GtkChild]
-    private unowned Adw.PreferencesGroup single_key_group;
-    
     [GtkChild]
     private unowned Adw.ComboRow single_key_combo;
     
@@ -115,84 +112,105 @@ public class KeyMaker.CreateBackupDialog : Adw.Dialog {
         });
     }
     
+    private const string KEY_LISTING_ATTRIBUTES = FileAttribute.STANDARD_NAME + "," + FileAttribute.STANDARD_TYPE + "," + FileAttribute.TIME_MODIFIED;
+    
     private async void load_ssh_keys_async () {
         
         try {
             key_manager.clear_available_keys ();
             
             // Simple file-based SSH key detection - same as main window
-            var ssh_dir = File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+            var ssh_dir = KeyMaker.Filesystem.ssh_dir ();
             
             if (!ssh_dir.query_exists ()) {
                 return;
             }
             
-            var enumerator = ssh_dir.enumerate_children (FileAttribute.STANDARD_NAME, FileQueryInfoFlags.NONE);
+            // Type and mtime come with the listing, so pairs are matched without a stat per file
+            var enumerator = ssh_dir.enumerate_children (KEY_LISTING_ATTRIBUTES, FileQueryInfoFlags.NONE);
             var key_count = 0;
+            var names = new GenericSet<string> (str_hash, str_equal);
+            var candidates = new GenericArray<FileInfo> ();
             
             FileInfo? info;
             while ((info = enumerator.next_file ()) != null) {
                 var filename = info.get_name ();
+                names.add (filename);
                 
                 // Look for private key files (no .pub extension) - same logic as main window
-                if (filename.has_prefix ("id_") && !filename.has_suffix (".pub")) {
-                    var private_path = ssh_dir.get_child (filename);
-                    var public_path = File.new_for_path (private_path.get_path () + ".pub");
+                if (info.get_file_type () == FileType.REGULAR && filename.has_prefix ("id_") && !filename.has_suffix (".pub")) {
+                    candidates.add (info);
+                }
+            }
+            
+            // Keep only private keys whose public key was listed too
+            var private_paths = new GenericArray<File> ();
+            var private_infos = new GenericArray<FileInfo> ();
+            foreach (var candidate in candidates) {
+                if (names.contains (candidate.get_name () + ".pub")) {
+                    print ("CreateBackupDialog: Found SSH key pair: %s\n", candidate.get_name ());
+                    private_paths.add (ssh_dir.get_child (candidate.get_name ()));
+                    private_infos.add (candidate);
+                }
+            }
+            
+            // Inspect all pairs at once instead of one ssh-keygen run after another
+            var key_infos = yield SSHOperations.get_key_infos (private_paths);
+            
+            for (int i = 0; i < private_paths.length; i++) {
+                var private_path = private_paths[i];
+                var filename = private_infos[i].get_name ();
+                var public_path = ssh_dir.get_child (filename + ".pub");
+                var key_info = key_infos[i];
+                
+                if (key_info == null) {
+                    debug ("CreateBackupDialog: Could not read key properties for %s", filename);
+                    continue;
+                }
+                
+                try {
+                    print ("CreateBackupDialog: Processing key %s\n", filename);
+                    var timestamp = private_infos[i].get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
+                    var last_modified = new DateTime.from_unix_local ((int64) timestamp);
                     
-                    // Check if both private and public key exist
-                    if (private_path.query_exists () && public_path.query_exists ()) {
-                        print ("CreateBackupDialog: Found SSH key pair: %s\n", filename);
-                        
-                        try {
-                            print ("CreateBackupDialog: Processing key %s\n", filename);
-                            // Get file modification time
-                            var file_info = private_path.query_info (FileAttribute.TIME_MODIFIED, FileQueryInfoFlags.NONE);
-                            var timestamp = file_info.get_attribute_uint64 (FileAttribute.TIME_MODIFIED);
-                            var last_modified = new DateTime.from_unix_local ((int64) timestamp);
-                            
-                            print ("CreateBackupDialog: Getting key properties for %s\n", filename);
-                            // Detect key type and other properties - using async versions
-                            var key_type = yield SSHOperations.get_key_type (private_path);
-                            var fingerprint = yield SSHOperations.get_fingerprint (private_path);
-                            var bit_size = yield SSHOperations.extract_bit_size (private_path);
-                            print ("CreateBackupDialog: Got properties - type=%d, fingerprint=%s\n", (int)key_type, fingerprint);
-                            
-                            // Extract comment from public key file if available
-                            string? comment = null;
-                            try {
-                                uint8[] contents;
-                                public_path.load_contents (null, out contents, null);
-                                var public_key_content = ((string) contents).strip ();
-                                var parts = public_key_content.split (" ");
-                                if (parts.length >= 3) {
-                                    comment = parts[2]; // Third part is usually the comment
-                                }
-                            } catch (Error e) {
-                                print ("CreateBackupDialog: Could not read comment from public key: %s\n", e.message);
-                            }
-                            
-                            print ("CreateBackupDialog: Creating SSH key object for %s\n", filename);
-                            // Create SSH key object with real data - same as main window
-                            var ssh_key = new SSHKey (
-                                private_path,
-                                public_path,
-                                key_type,
-                                fingerprint,
-                                comment,
-                                last_modified,
-                                bit_size ?? -1
-                            );
-                            
-                            print ("CreateBackupDialog: Adding key to manager: %s\n", filename);
-                            key_manager.add_available_key (ssh_key);
-                            key_count++;
-                            print ("CreateBackupDialog: Successfully added key %s, count now: %d\n", filename, key_count);
-                            
-                        } catch (Error key_error) {
-                            print ("CreateBackupDialog: Failed to create SSH key object for %s: %s\n", filename, key_error.message);
-                            continue;
+                    var key_type = key_info.key_type;
+                    var fingerprint = key_info.fingerprint;
+                    print ("CreateBackupDialog: Got properties - type=%d, fingerprint=%s\n", (int)key_type, fingerprint);
+                    
+                    // Extract comment from public key file if available
+                    string? comment = null;
+                    try {
+                        uint8[] contents;
+                        public_path.load_contents (null, out contents, null);
+                        var public_key_content = ((string) contents).strip ();
+                        var parts = public_key_content.split (" ", 3);
+                        if (parts.length >= 3) {
+                            comment = parts[2]; // Third part is usually the comment
                         }
+                    } catch (Error e) {
+                        print ("CreateBackupDialog: Could not read comment from public key: %s\n", e.message);
                     }
+                    
+                    print ("CreateBackupDialog: Creating SSH key object for %s\n", filename);
+                    // Create SSH key object with real data - same as main window
+                    var ssh_key = new SSHKey (
+                        private_path,
+                        public_path,
+                        key_type,
+                        fingerprint,
+                        comment,
+                        last_modified,
+                        key_info.bit_size
+                    );
+                    
+                    print ("CreateBackupDialog: Adding key to manager: %s\n", filename);
+                    key_manager.add_available_key (ssh_key);
+                    key_count++;
+                    print ("CreateBackupDialog: Successfully added key %s, count now: %d\n", filename, key_count);
+                    
+                } catch (Error key_error) {
+                    print ("CreateBackupDialog: Failed to create SSH key object for %s: %s\n", filename, key_error.message);
+                    continue;
                 }
             }
             
@@ -315,12 +333,7 @@ public class KeyMaker.CreateBackupDialog : Adw.Dialog {
     }
     
     private void clear_keys_list () {
-        Gtk.Widget? child = keys_list.get_first_child ();
-        while (child != null) {
-            var next = child.get_next_sibling ();
-            keys_list.remove (child);
-            child = next;
-        }
+        keys_list.remove_all ();
     }
     
     private void setup_expiry_controls () {
@@ -358,15 +371,8 @@ public class KeyMaker.CreateBackupDialog : Adw.Dialog {
     private void update_keys_ui_for_backup_type () {
         var selected_type = (BackupType) backup_type_combo.selected;
         
-        if (selected_type == BackupType.QR_CODE) {
-            // Show single key selector for QR code
-            keys_group.visible = false;
-            single_key_group.visible = true;
-        } else {
-            // Show multiple key selection list for other types
-            keys_group.visible = true;
-            single_key_group.visible = false;
-        }
+        // Single key selector for QR code, multiple key selection list for other types
+        keys_stack.visible_child_name = selected_type == BackupType.QR_CODE ? "single" : "multiple";
     }
     
     private void update_single_key_icon () {
@@ -659,7 +665,7 @@ public class KeyMaker.CreateBackupDialog : Adw.Dialog {
         switch (selected_type) {
             case BackupType.QR_CODE:
                 // QR Code: Just check if SSH keys exist on disk
-                var ssh_dir = File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+                var ssh_dir = KeyMaker.Filesystem.ssh_dir ();
                 bool has_ssh_keys = false;
                 if (ssh_dir.query_exists ()) {
                     try {
@@ -796,9 +802,6 @@ public class KeyMaker.CreateBackupDialog : Adw.Dialog {
     }
     
     private void show_error (string title, string message) {
-        var error_dialog = new Adw.AlertDialog (title, message);
-        error_dialog.add_response ("ok", "OK");
-        error_dialog.set_default_response ("ok");
-        error_dialog.present (this);
+        DialogHelpers.show_error (this, title, message);
     }
 }
\ No newline at end of file
@@ -53,14 +53,11 @@ public class KeyMaker.DeleteKeyDialog : GLib.Object {
             
         } catch (KeyMakerError e) {
             // Show error dialog
-            var error_dialog = new Adw.AlertDialog (
+            DialogHelpers.show_error (
+                parent_window,
                 _("Delete Failed"),
                 _("Failed to delete SSH key: %s").printf (e.message)
             );
-            error_dialog.add_response ("ok", _("OK"));
-            error_dialog.set_default_response ("ok");
-            error_dialog.set_close_response ("ok");
-            error_dialog.present (parent_window);
             
             warning ("Failed to delete SSH key: %s", e.message);
         }
@@ -14,11 +14,31 @@
 
 namespace KeyMaker {
 
+#if DEVELOPMENT
+    [GtkTemplate (ui = "/io/github/tobagin/keysmith/Devel/emergency_backup_auth_dialog.ui")]
+#else
+    [GtkTemplate (ui = "/io/github/tobagin/keysmith/emergency_backup_auth_dialog.ui")]
+#endif
     public class EmergencyBackupAuthDialog : Adw.Dialog {
-        private Gtk.Entry password_entry;
-        private Gtk.Button auth_button;
-        private Gtk.Label error_label;
-        private Gtk.Label countdown_label;
+        [GtkChild]
+        private unowned Adw.Banner warning_banner;
+        [GtkChild]
+        private unowned Adw.ActionRow operation_row;
+        [GtkChild]
+        private unowned Adw.ActionRow backup_row;
+        [GtkChild]
+        private unowned Gtk.Entry password_entry;
+        [GtkChild]
+        private unowned Gtk.ToggleButton visibility_toggle;
+        [GtkChild]
+        private unowned Gtk.Button auth_button;
+        [GtkChild]
+        private unowned Gtk.Button cancel_button;
+        [GtkChild]
+        private unowned Gtk.Label error_label;
+        [GtkChild]
+        private unowned Gtk.Label countdown_label;
+
         private int failed_attempts = 0;
         private const int MAX_ATTEMPTS = 3;
         private const int COOLDOWN_SECONDS = 30;
@@ -28,172 +48,44 @@ namespace KeyMaker {
         public string password { get; private set; default = ""; }
         public bool authenticated { get; private set; default = false; }
 
-        private string operation_name;
-        private string backup_name;
+        public string operation_name { get; construct; }
+        public string backup_name { get; construct; }
 
         public signal void authentication_result (bool success, string? password);
 
         public EmergencyBackupAuthDialog (string operation_name, string backup_name) {
-            this.operation_name = operation_name;
-            this.backup_name = backup_name;
-
-            build_ui ();
+            Object (
+                operation_name: operation_name,
+                backup_name: backup_name
+            );
         }
 
         ~EmergencyBackupAuthDialog () {
             stop_cooldown_timer ();
         }
 
-        private void build_ui () {
-            this.title = "Authentication Required";
-            this.content_width = 450;
-            this.content_height = 400;
-
-            var toolbar_view = new Adw.ToolbarView ();
-
-            var header_bar = new Adw.HeaderBar ();
-            toolbar_view.add_top_bar (header_bar);
-
-            var content = create_content ();
-            toolbar_view.content = content;
-
-            this.child = toolbar_view;
-        }
-
-        private Gtk.Widget create_content () {
-            var box = new Gtk.Box (Gtk.Orientation.VERTICAL, 24);
-            box.margin_top = 24;
-            box.margin_bottom = 24;
-            box.margin_start = 24;
-            box.margin_end = 24;
-
-            // Warning banner
-            var warning = create_warning_banner ();
-            box.append (warning);
-
-            // Operation info
-            var info_group = create_info_group ();
-            box.append (info_group);
-
-            // Authentication group
-            var auth_group = create_auth_group ();
-            box.append (auth_group);
-
-            // Error message (initially hidden)
-            error_label = new Gtk.Label ("");
-            error_label.add_css_class ("error");
-            error_label.wrap = true;
-            error_label.visible = false;
-            box.append (error_label);
-
-            // Cooldown countdown (initially hidden)
-            countdown_label = new Gtk.Label ("");
-            countdown_label.add_css_class ("warning");
-            countdown_label.add_css_class ("title-3");
-            countdown_label.visible = false;
-            box.append (countdown_label);
-
-            // Action buttons
-            var action_bar = create_action_bar ();
-            box.append (action_bar);
-
-            return box;
-        }
-
-        private Gtk.Widget create_warning_banner () {
-            var banner = new Adw.Banner (@"⚠️  Warning: $(operation_name) is irreversible");
-            banner.use_markup = true;
-            return banner;
-        }
-
-        private Gtk.Widget create_info_group () {
-            var group = new Adw.PreferencesGroup ();
-            group.title = "Operation Details";
-
-            var operation_row = new Adw.ActionRow ();
-            operation_row.title = "Operation";
+        construct {
+            // The widget tree comes from the template; only the per-use text is set here
+            warning_banner.title = @"⚠️  Warning: $(operation_name) is irreversible";
             operation_row.subtitle = operation_name;
-
-            var op_icon = new Gtk.Image.from_icon_name ("edit-delete-symbolic");
-            op_icon.icon_size = Gtk.IconSize.NORMAL;
-            operation_row.add_prefix (op_icon);
-            group.add (operation_row);
-
-            var backup_row = new Adw.ActionRow ();
-            backup_row.title = "Backup";
             backup_row.subtitle = backup_name;
 
-            var backup_icon = new Gtk.Image.from_icon_name ("security-high-symbolic");
-            backup_icon.icon_size = Gtk.IconSize.NORMAL;
-            backup_row.add_prefix (backup_icon);
-            group.add (backup_row);
-
-            return group;
-        }
-
-        private Gtk.Widget create_auth_group () {
-            var group = new Adw.PreferencesGroup ();
-            group.title = "Authentication";
-            group.description = "Enter the password or passphrase used to create this emergency backup.";
-
-            var password_row = new Adw.EntryRow ();
-            password_row.title = "Password";
-            password_row.show_apply_button = false;
-
-            password_entry = new Gtk.Entry ();
-            password_entry.visibility = false;
-            password_entry.input_purpose = Gtk.InputPurpose.PASSWORD;
-            password_entry.placeholder_text = "Enter password";
             password_entry.activate.connect (on_authenticate);
+            auth_button.clicked.connect (on_authenticate);
 
-            // Add show/hide toggle
-            var toggle_button = new Gtk.ToggleButton ();
-            toggle_button.icon_name = "view-reveal-symbolic";
-            toggle_button.tooltip_text = "Show password";
-            toggle_button.valign = Gtk.Align.CENTER;
-            toggle_button.toggled.connect (() => {
-                password_entry.visibility = toggle_button.active;
-                toggle_button.icon_name = toggle_button.active ?
+            visibility_toggle.toggled.connect (() => {
+                password_entry.visibility = visibility_toggle.active;
+                visibility_toggle.icon_name = visibility_toggle.active ?
                     "view-conceal-symbolic" : "view-reveal-symbolic";
-                toggle_button.tooltip_text = toggle_button.active ?
-                    "Hide password" : "Show password";
+                visibility_toggle.tooltip_text = visibility_toggle.active ?
+                    _("Hide password") : _("Show password");
             });
 
-            password_entry.secondary_icon_name = null;
-
-            // Create a box for the password entry with toggle button
-            var entry_box = new Gtk.Box (Gtk.Orientation.HORIZONTAL, 6);
-            entry_box.hexpand = true;
-            password_entry.hexpand = true;
-            entry_box.append (password_entry);
-            entry_box.append (toggle_button);
-
-            password_row.add_suffix (entry_box);
-            group.add (password_row);
-
-            return group;
-        }
-
-        private Gtk.Widget create_action_bar () {
-            var action_bar = new Gtk.Box (Gtk.Orientation.HORIZONTAL, 12);
-            action_bar.homogeneous = true;
-
-            auth_button = new Gtk.Button.with_label ("Authenticate & Continue");
-            auth_button.add_css_class ("destructive-action");
-            auth_button.clicked.connect (on_authenticate);
-            auth_button.sensitive = true;
-
-            var cancel_button = new Gtk.Button.with_label ("Cancel");
             cancel_button.clicked.connect (() => {
                 authenticated = false;
                 authentication_result (false, null);
                 this.close ();
             });
-
-            action_bar.append (auth_button);
-            action_bar.append (cancel_button);
-
-            return action_bar;
         }
 
         private void on_authenticate () {
@@ -148,12 +148,7 @@ public class KeyMaker.EmergencyVaultDialog : Adw.Dialog {
             return;
         }
         
-        Gtk.Widget? child = backups_list.get_first_child ();
-        while (child != null) {
-            var next = child.get_next_sibling ();
-            backups_list.remove (child);
-            child = next;
-        }
+        backups_list.remove_all ();
     }
     
     private void add_backup_row (BackupEntry backup) {
@@ -405,27 +400,37 @@ public class KeyMaker.EmergencyVaultDialog : Adw.Dialog {
         
         confirm_dialog.response.connect ((response) => {
             if (response == "delete") {
-                perform_backup_deletion (backup);
+                perform_backup_deletion.begin (backup);
             }
         });
         
         confirm_dialog.present (this);
     }
     
-    private void perform_backup_deletion (BackupEntry backup) {
+    private async void perform_backup_deletion (BackupEntry backup) {
         try {
-            if (backup.backup_file.query_exists ()) {
-                backup.backup_file.delete ();
-            }
-            
-            // Remove from vault
-            vault.remove_backup_legacy (backup);
-            
-            populate_backups_list ();
-            refresh_vault_status ();
-            
+            yield delete_backup_file (backup);
         } catch (Error e) {
             show_error ("Delete Failed", @"Could not delete backup: $(e.message)");
+            return;
+        }
+        
+        // Remove from vault
+        vault.remove_backup_legacy (backup);
+        
+        populate_backups_list ();
+        refresh_vault_status ();
+    }
+    
+    /**
+     * Delete a backup's file without blocking the dialog; the vault may sit on
+     * a slow or remote filesystem. A file that is already gone counts as deleted.
+     */
+    private async void delete_backup_file (BackupEntry backup) throws Error {
+        try {
+            yield backup.backup_file.delete_async (Priority.DEFAULT, null);
+        } catch (IOError.NOT_FOUND e) {
+            debug ("EmergencyVaultDialog: Backup file already removed: %s", backup.backup_file.get_path ());
         }
     }
     
@@ -479,23 +484,21 @@ public class KeyMaker.EmergencyVaultDialog : Adw.Dialog {
         
         confirm_dialog.response.connect ((response) => {
             if (response == "remove_all") {
-                perform_remove_all_backups ();
+                perform_remove_all_backups.begin ();
             }
         });
         
         confirm_dialog.present (this);
     }
     
-    private void perform_remove_all_backups () {
+    private async void perform_remove_all_backups () {
         var backups = vault.get_all_backups_legacy ();
         int deleted_count = 0;
         int failed_count = 0;
         
         for (int i = 0; i < backups.length; i++) {
             try {
-                if (backups[i].backup_file.query_exists ()) {
-                    backups[i].backup_file.delete ();
-                }
+                yield delete_backup_file (backups[i]);
                 
                 vault.remove_backup_legacy (backups[i]);
                 deleted_count++;
@@ -515,10 +518,7 @@ public class KeyMaker.EmergencyVaultDialog : Adw.Dialog {
     }
     
     private void show_error (string title, string message) {
-        var error_dialog = new Adw.AlertDialog (title, message);
-        error_dialog.add_response ("ok", "OK");
-        error_dialog.set_default_response ("ok");
-        error_dialog.present (this);
+        DialogHelpers.show_error (this, title, message);
     }
     
     private BackupEntry convert_to_legacy_backup (EmergencyBackupEntry emergency_backup) {
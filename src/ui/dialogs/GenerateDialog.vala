@@ -57,9 +57,51 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
     
     // toast_overlay not available in Blueprint
     
-    private Gtk.StringList key_type_model;
-    private Gtk.StringList rsa_bits_model;
-    private Gtk.StringList ecdsa_curve_model;
+    // Choices offered by the combo rows, in model order
+    private const SSHKeyType[] KEY_TYPES = { SSHKeyType.ED25519, SSHKeyType.RSA, SSHKeyType.ECDSA };
+    private const int[] RSA_BITS = { 2048, 3072, 4096, 8192 };
+    private const int[] ECDSA_CURVES = { 256, 384, 521 };
+    
+    // The choice models are the same for every dialog, so they are built once and shared
+    private static Gtk.StringList? _key_type_model = null;
+    private static Gtk.StringList? _rsa_bits_model = null;
+    private static Gtk.StringList? _ecdsa_curve_model = null;
+    
+    private static Gtk.StringList key_type_model {
+        get {
+            if (_key_type_model == null) {
+                _key_type_model = new Gtk.StringList ({ _("Ed25519 (Recommended)"), _("RSA"), _("ECDSA") });
+            }
+            return _key_type_model;
+        }
+    }
+    
+    private static Gtk.StringList rsa_bits_model {
+        get {
+            if (_rsa_bits_model == null) {
+                _rsa_bits_model = new Gtk.StringList (null);
+                foreach (var bits in RSA_BITS) {
+                    _rsa_bits_model.append (bits.to_string ());
+                }
+            }
+            return _rsa_bits_model;
+        }
+    }
+    
+    private static Gtk.StringList ecdsa_curve_model {
+        get {
+            if (_ecdsa_curve_model == null) {
+                _ecdsa_curve_model = new Gtk.StringList (null);
+                foreach (var curve in ECDSA_CURVES) {
+                    _ecdsa_curve_model.append ("P-%d (%d bits)".printf (curve, curve));
+                }
+            }
+            return _ecdsa_curve_model;
+        }
+    }
+    
+    // Cancels a running generation when the dialog is closed
+    private Cancellable? generate_cancellable = null;
     
     // Signals
     public signal void key_generated (SSHKey ssh_key);
@@ -72,26 +114,8 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
     }
     
     construct {
-        // Setup key type model
-        key_type_model = new Gtk.StringList (null);
-        key_type_model.append (_("Ed25519 (Recommended)"));
-        key_type_model.append (_("RSA"));
-        key_type_model.append (_("ECDSA"));
         key_type_row.set_model (key_type_model);
-        
-        // Setup RSA bits model
-        rsa_bits_model = new Gtk.StringList (null);
-        rsa_bits_model.append ("2048");
-        rsa_bits_model.append ("3072");
-        rsa_bits_model.append ("4096");
-        rsa_bits_model.append ("8192");
         rsa_bits_row.set_model (rsa_bits_model);
-        
-        // Setup ECDSA curve model
-        ecdsa_curve_model = new Gtk.StringList (null);
-        ecdsa_curve_model.append ("P-256 (256 bits)");
-        ecdsa_curve_model.append ("P-384 (384 bits)");
-        ecdsa_curve_model.append ("P-521 (521 bits)");
         ecdsa_curve_row.set_model (ecdsa_curve_model);
         
         // Connect signals
@@ -103,6 +127,11 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
         passphrase_confirm_row.notify["text"].connect (validate_form);
         passphrase_switch.notify["active"].connect (on_passphrase_switch_changed);
         generate_button.clicked.connect (() => generate_key_async.begin ());
+        closed.connect (() => {
+            if (generate_cancellable != null) {
+                generate_cancellable.cancel ();
+            }
+        });
         
         // Load settings defaults
         load_settings_defaults ();
@@ -118,56 +147,20 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
     }
     
     private void load_settings_defaults () {
-        // Load default key type
+        // Load default key type (Ed25519 unless the setting names another offered type)
         var default_key_type = SettingsManager.default_key_type;
-        switch (default_key_type) {
-            case "rsa":
-                key_type_row.set_selected (1);
-                break;
-            case "ecdsa":
-                key_type_row.set_selected (2);
-                break;
-            default: // "ed25519"
-                key_type_row.set_selected (0);
-                break;
-        }
-        
-        // Load default RSA bits
-        var default_rsa_bits = SettingsManager.default_rsa_bits;
-        switch (default_rsa_bits) {
-            case 2048:
-                rsa_bits_row.set_selected (0);
-                break;
-            case 3072:
-                rsa_bits_row.set_selected (1);
-                break;
-            case 4096:
-                rsa_bits_row.set_selected (2);
-                break;
-            case 8192:
-                rsa_bits_row.set_selected (3);
-                break;
-            default:
-                rsa_bits_row.set_selected (2); // 4096
+        uint key_type_index = 0;
+        for (uint i = 0; i < KEY_TYPES.length; i++) {
+            if (KEY_TYPES[i].to_string () == default_key_type) {
+                key_type_index = i;
                 break;
+            }
         }
+        key_type_row.set_selected (key_type_index);
         
-        // Load default ECDSA curve
-        var default_ecdsa_curve = SettingsManager.default_ecdsa_curve;
-        switch (default_ecdsa_curve) {
-            case 256:
-                ecdsa_curve_row.set_selected (0);
-                break;
-            case 384:
-                ecdsa_curve_row.set_selected (1);
-                break;
-            case 521:
-                ecdsa_curve_row.set_selected (2);
-                break;
-            default:
-                ecdsa_curve_row.set_selected (0); // P-256
-                break;
-        }
+        // Load default RSA bits and ECDSA curve, falling back to 4096 and P-256
+        rsa_bits_row.set_selected (index_of (RSA_BITS, SettingsManager.default_rsa_bits, 2));
+        ecdsa_curve_row.set_selected (index_of (ECDSA_CURVES, SettingsManager.default_ecdsa_curve, 0));
         
         // Load default comment
         var default_comment = SettingsManager.default_comment;
@@ -178,6 +171,15 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
         passphrase_switch.set_active (use_passphrase_by_default);
     }
     
+    private static uint index_of (int[] values, int value, uint fallback) {
+        for (uint i = 0; i < values.length; i++) {
+            if (values[i] == value) {
+                return i;
+            }
+        }
+        return fallback;
+    }
+    
     private void on_key_type_changed () {
         update_key_type_specific_visibility ();
         
@@ -197,14 +199,14 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
     }
     
     private void update_key_type_specific_visibility () {
-        var selected_type = key_type_row.get_selected ();
+        var selected_type = get_selected_key_type ();
         
         // Show RSA bits row only for RSA keys
-        var is_rsa = selected_type == 1;
+        var is_rsa = selected_type == SSHKeyType.RSA;
         rsa_bits_row.set_visible (is_rsa);
         
         // Show ECDSA curve row only for ECDSA keys
-        var is_ecdsa = selected_type == 2;
+        var is_ecdsa = selected_type == SSHKeyType.ECDSA;
         ecdsa_curve_row.set_visible (is_ecdsa);
     }
     
@@ -308,44 +310,18 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
     }
     
     private SSHKeyType get_selected_key_type () {
-        switch (key_type_row.get_selected ()) {
-            case 0:
-                return SSHKeyType.ED25519;
-            case 1:
-                return SSHKeyType.RSA;
-            case 2:
-                return SSHKeyType.ECDSA;
-            default:
-                return SSHKeyType.ED25519;
-        }
+        var selected = key_type_row.get_selected ();
+        return selected < KEY_TYPES.length ? KEY_TYPES[selected] : SSHKeyType.ED25519;
     }
     
     private int get_selected_rsa_bits () {
-        switch (rsa_bits_row.get_selected ()) {
-            case 0:
-                return 2048;
-            case 1:
-                return 3072;
-            case 2:
-                return 4096;
-            case 3:
-                return 8192;
-            default:
-                return 4096;
-        }
+        var selected = rsa_bits_row.get_selected ();
+        return selected < RSA_BITS.length ? RSA_BITS[selected] : 4096;
     }
     
     private int get_selected_ecdsa_curve () {
-        switch (ecdsa_curve_row.get_selected ()) {
-            case 0:
-                return 256;
-            case 1:
-                return 384;
-            case 2:
-                return 521;
-            default:
-                return 256;
-        }
+        var selected = ecdsa_curve_row.get_selected ();
+        return selected < ECDSA_CURVES.length ? ECDSA_CURVES[selected] : 256;
     }
     
     
@@ -353,6 +329,9 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
         // Disable the generate button to prevent double-clicking
         generate_button.set_sensitive (false);
         generate_button.set_label (_("Generating..."));
+        progress_box.visible = true;
+        progress_spinner.spinning = true;
+        generate_cancellable = new Cancellable ();
         
         try {
             // Create request
@@ -365,13 +344,21 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
             };
             
             // Generate the key
-            var ssh_key = yield SSHOperations.generate_key (request);
+            var ssh_key = yield SSHOperations.generate_key (request, generate_cancellable);
+            generate_cancellable = null;
             
             // Emit signal and close dialog
             key_generated (ssh_key);
             close ();
             
+        } catch (KeyMakerError.OPERATION_CANCELLED e) {
+            // Dialog was closed mid-generation; ssh-keygen has been stopped
+            debug ("GenerateKeyDialog: generation cancelled");
         } catch (KeyMakerError e) {
+            generate_cancellable = null;
+            progress_box.visible = false;
+            progress_spinner.spinning = false;
+            
             // Check if this is a "key already exists" error
             if (e.message.contains ("already exists")) {
                 // Re-enable button first
@@ -397,6 +384,14 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
         show_toast_requested (message);
     }
     
+    private static void move_if_present (File source, File destination) throws Error {
+        try {
+            source.move (destination, FileCopyFlags.OVERWRITE);
+        } catch (IOError.NOT_FOUND e) {
+            // Only one half of the pair existed
+        }
+    }
+    
     private async void show_name_conflict_dialog_async (string filename) {
         var dialog = new Adw.AlertDialog (
             _("Key Name Already Exists"),
@@ -428,20 +423,15 @@ public class KeyMaker.GenerateKeyDialog : Adw.Dialog {
                 
             case "overwrite":
                 // Create backup of existing key first
-                var ssh_dir = File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+                var ssh_dir = KeyMaker.Filesystem.ssh_dir ();
                 var existing_private = ssh_dir.get_child (filename);
                 var existing_public = ssh_dir.get_child (filename + ".pub");
                 
                 try {
-                    // Create backups by renaming existing files
-                    if (existing_private.query_exists ()) {
-                        var backup_private = ssh_dir.get_child (filename + "_backup");
-                        existing_private.move (backup_private, FileCopyFlags.OVERWRITE);
-                    }
-                    if (existing_public.query_exists ()) {
-                        var backup_public = ssh_dir.get_child (filename + "_backup.pub");
-                        existing_public.move (backup_public, FileCopyFlags.OVERWRITE);
-                    }
+                    // Create backups by renaming existing files; the rename itself
+                    // tells us whether a file was there, no stat beforehand
+                    move_if_present (existing_private, ssh_dir.get_child (filename + "_backup"));
+                    move_if_present (existing_public, ssh_dir.get_child (filename + "_backup.pub"));
                     show_toast (_("Existing key backed up. Generating new key..."));
                     
                     // First refresh to show the backup names
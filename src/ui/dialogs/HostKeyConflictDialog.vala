@@ -115,17 +115,9 @@ public class KeyMaker.HostKeyConflictDialog : Adw.AlertDialog {
     ) {
         var dialog = new HostKeyConflictDialog (parent, hostname, old_entry, new_fingerprint);
 
-        var promise = new GLib.MainLoop ();
-        bool should_update = false;
+        // Suspend the caller until a response instead of spinning a nested main loop
+        var response = yield dialog.choose (parent, null);
 
-        dialog.response.connect ((response_id) => {
-            should_update = (response_id == "update");
-            promise.quit ();
-        });
-
-        dialog.present (parent);
-        promise.run ();
-
-        return should_update;
+        return response == "update";
     }
 }
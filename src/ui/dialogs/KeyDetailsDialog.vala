@@ -59,10 +59,13 @@ public class KeyMaker.KeyDetailsDialog : Adw.Dialog {
     
     public SSHKey ssh_key { get; construct; }
     
+    // Shared by all copy buttons; handed over by the window that opens the dialog
+    public Gdk.Clipboard clipboard { get; construct; }
     
-    public KeyDetailsDialog (Gtk.Window parent, SSHKey ssh_key) {
+    public KeyDetailsDialog (Gtk.Window parent, SSHKey ssh_key, Gdk.Clipboard clipboard) {
         Object (
-            ssh_key: ssh_key
+            ssh_key: ssh_key,
+            clipboard: clipboard
         );
     }
     
@@ -73,7 +76,7 @@ public class KeyMaker.KeyDetailsDialog : Adw.Dialog {
         copy_fingerprint_button.clicked.connect (copy_fingerprint);
         copy_private_path_button.clicked.connect (copy_private_path);
         copy_public_path_button.clicked.connect (copy_public_path);
-        copy_public_key_button.clicked.connect (copy_public_key_content);
+        copy_public_key_button.clicked.connect (() => copy_public_key_content.begin ());
     }
     
     private void update_display () {
@@ -91,8 +94,8 @@ public class KeyMaker.KeyDetailsDialog : Adw.Dialog {
         }
         
         // Set paths
-        private_path_row.set_subtitle (ssh_key.private_path.get_path ());
-        public_path_row.set_subtitle (ssh_key.public_path.get_path ());
+        private_path_row.set_subtitle (ssh_key.private_path_str);
+        public_path_row.set_subtitle (ssh_key.public_path_str);
         
         // Set file permissions
         set_file_permissions ();
@@ -109,13 +112,21 @@ public class KeyMaker.KeyDetailsDialog : Adw.Dialog {
             bit_size_row.set_visible (false);
         }
         
-        // Set public key content
+        // Public key content is filled in once the read completes
+        load_public_key_content.begin ();
+    }
+    
+    /**
+     * Read the public key without blocking the dialog from presenting
+     */
+    private async void load_public_key_content () {
+        var buffer = public_key_text.get_buffer ();
         try {
-            var content = SSHOperations.get_public_key_content (ssh_key);
-            var buffer = public_key_text.get_buffer ();
+            // Served from the metadata cache while the .pub is unchanged
+            var content = yield SSHOperations.get_public_key_content_async (ssh_key);
             buffer.set_text (content, -1);
         } catch (KeyMakerError e) {
-            var buffer = public_key_text.get_buffer ();
+            warning ("Failed to load public key content: %s", e.message);
             buffer.set_text (_("Error loading public key content"), -1);
         }
     }
@@ -183,9 +194,8 @@ public class KeyMaker.KeyDetailsDialog : Adw.Dialog {
     
     private async void copy_public_key_async () {
         try {
-            var content = SSHOperations.get_public_key_content (ssh_key);
+            var content = yield SSHOperations.get_public_key_content_async (ssh_key);
             
-            var clipboard = get_clipboard ();
             clipboard.set_text (content);
             
             // Public key copied successfully (no visual feedback for now)
@@ -196,24 +206,20 @@ public class KeyMaker.KeyDetailsDialog : Adw.Dialog {
     }
     
     private void copy_fingerprint () {
-        var clipboard = get_clipboard ();
         clipboard.set_text (ssh_key.fingerprint);
     }
     
     private void copy_private_path () {
-        var clipboard = get_clipboard ();
-        clipboard.set_text (ssh_key.private_path.get_path ());
+        clipboard.set_text (ssh_key.private_path_str);
     }
     
     private void copy_public_path () {
-        var clipboard = get_clipboard ();
-        clipboard.set_text (ssh_key.public_path.get_path ());
+        clipboard.set_text (ssh_key.public_path_str);
     }
     
-    private void copy_public_key_content () {
+    private async void copy_public_key_content () {
         try {
-            var content = SSHOperations.get_public_key_content (ssh_key);
-            var clipboard = get_clipboard ();
+            var content = yield SSHOperations.get_public_key_content_async (ssh_key);
             clipboard.set_text (content.strip());
         } catch (KeyMakerError e) {
             warning ("Failed to copy public key content: %s", e.message);
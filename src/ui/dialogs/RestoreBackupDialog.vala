@@ -121,12 +121,7 @@ public class KeyMaker.RestoreBackupDialog : Adw.Dialog {
     }
     
     private void clear_backups_list () {
-        Gtk.Widget? child = backups_list.get_first_child ();
-        while (child != null) {
-            var next = child.get_next_sibling ();
-            backups_list.remove (child);
-            child = next;
-        }
+        backups_list.remove_all ();
     }
     
     private void add_backup_row (EmergencyBackupEntry backup) {
@@ -453,10 +448,7 @@ public class KeyMaker.RestoreBackupDialog : Adw.Dialog {
     }
     
     private void show_error (string title, string message) {
-        var error_dialog = new Adw.AlertDialog (title, message);
-        error_dialog.add_response ("ok", "OK");
-        error_dialog.set_default_response ("ok");
-        error_dialog.present (this);
+        DialogHelpers.show_error (this, title, message);
     }
 }
 
@@ -11,8 +11,12 @@
 
 public class KeyMaker.ShortcutsDialog : GLib.Object {
     
+    // Built from the UI resource on first use and presented again afterwards,
+    // so the builder XML is only parsed once per process
+    private static Adw.ShortcutsDialog? cached_dialog = null;
+    
     public static void show (Gtk.Window? parent = null) {
-        try {
+        if (cached_dialog == null) {
             #if DEVELOPMENT
             var resource_path = "/io/github/tobagin/keysmith/Devel/shortcuts_dialog.ui";
             #else
@@ -20,15 +24,14 @@ public class KeyMaker.ShortcutsDialog : GLib.Object {
             #endif
             
             var builder = new Gtk.Builder.from_resource (resource_path);
-            var dialog = builder.get_object ("shortcuts_dialog") as Adw.ShortcutsDialog;
+            cached_dialog = builder.get_object ("shortcuts_dialog") as Adw.ShortcutsDialog;
             
-            if (dialog != null) {
-                dialog.present (parent);
-            } else {
+            if (cached_dialog == null) {
                 warning ("Could not find shortcuts_dialog object in %s", resource_path);
+                return;
             }
-        } catch (Error e) {
-            warning ("Could not load shortcuts dialog: %s", e.message);
         }
+        
+        cached_dialog.present (parent);
     }
-}
\ No newline at end of file
+}
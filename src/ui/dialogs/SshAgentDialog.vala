@@ -42,6 +42,8 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
     private SSHAgent ssh_agent;
     private GenericArray<SSHKey> available_keys;
     private GenericArray<SSHKey>? provided_keys;
+    // Found once when the dialog opens; Remove All is disabled while the keyring reloads keys
+    private bool gnome_keyring_detected = false;
     
     public SSHAgentDialog (Gtk.Window parent, GenericArray<SSHKey>? keys = null) {
         Object ();
@@ -59,23 +61,17 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
             available_keys = provided_keys;
         }
         
+        // ssh-add and pgrep run without blocking, so the dialog presents right away
+        load_initial_state.begin ();
+    }
+    
+    private async void load_initial_state () {
         // Check if GNOME Keyring is managing SSH keys
-        bool has_gnome_keyring = detect_gnome_keyring ();
-        
-        // Load agent keys using synchronous method to avoid crashes
-        try {
-            load_agent_keys_sync ();
-            // Set agent availability flag after successful load
-            set_agent_available (true);
-        } catch (Error e) {
-            warning ("Failed to load agent keys: %s", e.message);
-            show_error (e.message);
-            set_agent_available (false);
-        }
+        gnome_keyring_detected = yield detect_gnome_keyring ();
         
         // Configure Remove All button based on SSH agent type
         if (remove_all_button != null) {
-            if (has_gnome_keyring) {
+            if (gnome_keyring_detected) {
                 // Disable Remove All button for GNOME Keyring users
                 remove_all_button.visible = true;
                 remove_all_button.sensitive = false;
@@ -84,6 +80,20 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
                 remove_all_button.visible = false; // Will be shown when keys are loaded
             }
         }
+        
+        yield reload_agent_keys ();
+    }
+    
+    private async void reload_agent_keys () {
+        try {
+            yield load_agent_keys_from_ssh_add ();
+            // Set agent availability flag after successful load
+            set_agent_available (true);
+        } catch (Error e) {
+            warning ("Failed to load agent keys: %s", e.message);
+            show_error (e.message);
+            set_agent_available (false);
+        }
     }
     
     private void setup_signals () {
@@ -121,7 +131,7 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
             }
             
             // Load available SSH keys for adding
-            var ssh_dir = File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+            var ssh_dir = KeyMaker.Filesystem.ssh_dir ();
             available_keys = yield KeyScanner.scan_ssh_directory (ssh_dir);
             
         } catch (KeyMakerError e) {
@@ -196,12 +206,7 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
     private void clear_agent_keys_list () {
         if (agent_keys_list == null) return;
         
-        Gtk.Widget? child = agent_keys_list.get_first_child ();
-        while (child != null) {
-            var next = child.get_next_sibling ();
-            agent_keys_list.remove (child);
-            child = next;
-        }
+        agent_keys_list.remove_all ();
     }
     
     private Gtk.Widget create_agent_key_row (SSHAgent.AgentKey key) {
@@ -252,44 +257,26 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
         }
     }
     
-    // Synchronous version to avoid async subprocess crashes
-    private void load_agent_keys_sync () throws Error {
-        debug ("SSHAgentDialog: Loading agent keys synchronously");
+    private async void load_agent_keys_from_ssh_add () throws Error {
+        debug ("SSHAgentDialog: Loading agent keys");
         
         // Check if SSH agent is available by running ssh-add -l
-        string stdout_output, stderr_output;
-        int exit_status;
-        
-        string[] cmd = {"ssh-add", "-l", null};
-        
-        bool success = Process.spawn_sync (
-            null, // working_directory
-            cmd,
-            null, // envp
-            SpawnFlags.SEARCH_PATH,
-            null, // child_setup
-            out stdout_output,
-            out stderr_output,
-            out exit_status
-        );
-        
-        if (!success) {
-            throw new IOError.FAILED ("Failed to execute ssh-add command");
-        }
+        string[] cmd = {"ssh-add", "-l"};
+        var result = yield KeyMaker.Command.run_capture (cmd);
         
-        debug ("SSHAgentDialog: ssh-add -l exit status: %d", exit_status);
-        debug ("SSHAgentDialog: stdout: %s", stdout_output);
-        debug ("SSHAgentDialog: stderr: %s", stderr_output);
+        debug ("SSHAgentDialog: ssh-add -l exit status: %d", result.status);
+        debug ("SSHAgentDialog: stdout: %s", result.stdout);
+        debug ("SSHAgentDialog: stderr: %s", result.stderr);
         
-        if (exit_status == 0) {
+        if (result.status == 0) {
             // Agent has keys loaded
-            show_loaded_keys (stdout_output);
-        } else if (exit_status == 1) {
+            show_loaded_keys (result.stdout);
+        } else if (result.status == 1) {
             // Agent is running but no keys loaded
             show_no_keys_loaded ();
         } else {
             // Agent not available or other error
-            throw new IOError.FAILED ("SSH agent not available: %s".printf (stderr_output.strip ()));
+            throw new IOError.FAILED ("SSH agent not available: %s".printf (result.stderr.strip ()));
         }
     }
     
@@ -382,8 +369,7 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
             remove_all_button.visible = (key_count > 0);
             
             // Enable only if not using GNOME Keyring
-            bool has_gnome_keyring = detect_gnome_keyring ();
-            if (has_gnome_keyring) {
+            if (gnome_keyring_detected) {
                 remove_all_button.sensitive = false;
                 remove_all_button.tooltip_text = "Remove All is disabled because GNOME Keyring automatically reloads SSH keys. Use system settings to manage key auto-loading.";
             } else {
@@ -399,12 +385,7 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
     
     
     private void on_refresh_clicked () {
-        try {
-            load_agent_keys_sync ();
-        } catch (Error e) {
-            warning ("Failed to refresh agent keys: %s", e.message);
-            show_error (e.message);
-        }
+        reload_agent_keys.begin ();
     }
     
     private void on_add_key_clicked () {
@@ -414,43 +395,40 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
     
     private void on_remove_all_clicked () {
         // Skip operation if GNOME Keyring is detected (button should be disabled anyway)
-        if (detect_gnome_keyring ()) {
+        if (gnome_keyring_detected) {
             debug ("SSHAgentDialog: Remove All clicked but GNOME Keyring detected - operation skipped");
             return;
         }
         
+        remove_all_and_recheck.begin ();
+    }
+    
+    private async void remove_all_and_recheck () {
         try {
-            remove_all_keys_sync ();
+            yield remove_all_keys ();
             
             // Check immediately after removal to see if keys are still gone
             debug ("SSHAgentDialog: Checking keys immediately after removal...");
-            check_agent_keys_immediately ();
+            yield check_agent_keys_immediately ();
             
             // Small delay to see if keys get auto-reloaded and inform user
-            GLib.Timeout.add (500, () => {
-                debug ("SSHAgentDialog: Checking keys 500ms after removal...");
-                try {
-                    // Check if keys are back (GNOME Keyring auto-reload)
-                    string stdout_output, stderr_output;
-                    int exit_status;
-                    string[] cmd = {"ssh-add", "-l", null};
-                    
-                    bool success = Process.spawn_sync (
-                        null, cmd, null, SpawnFlags.SEARCH_PATH,
-                        null, out stdout_output, out stderr_output, out exit_status
-                    );
-                    
-                    if (success && exit_status == 0 && stdout_output.strip () != "") {
-                        // Keys were auto-reloaded - show user feedback
-                        show_keyring_auto_reload_info ();
-                    }
-                    
-                    load_agent_keys_sync ();
-                } catch (Error e) {
-                    warning ("Failed to refresh after delay: %s", e.message);
+            Timeout.add (500, remove_all_and_recheck.callback);
+            yield;
+            
+            debug ("SSHAgentDialog: Checking keys 500ms after removal...");
+            try {
+                // Check if keys are back (GNOME Keyring auto-reload)
+                string[] cmd = {"ssh-add", "-l"};
+                var result = yield KeyMaker.Command.run_capture (cmd);
+                if (result.status == 0 && result.stdout.strip () != "") {
+                    // Keys were auto-reloaded - show user feedback
+                    show_keyring_auto_reload_info ();
                 }
-                return false; // Don't repeat
-            });
+                
+                yield load_agent_keys_from_ssh_add ();
+            } catch (Error e) {
+                warning ("Failed to refresh after delay: %s", e.message);
+            }
             
         } catch (Error e) {
             warning ("Failed to remove all keys: %s", e.message);
@@ -469,9 +447,8 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
         debug ("SSHAgentDialog: Setting agent availability to %s", available.to_string ());
     }
     
-    // Synchronous method to remove all keys from SSH agent
-    private void remove_all_keys_sync () throws Error {
-        debug ("SSHAgentDialog: Removing all keys synchronously");
+    private async void remove_all_keys () throws Error {
+        debug ("SSHAgentDialog: Removing all keys");
         
         // First, let's check the SSH agent environment and diagnose the issue
         var ssh_auth_sock = Environment.get_variable ("SSH_AUTH_SOCK");
@@ -480,60 +457,34 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
         debug ("SSHAgentDialog: SSH_AGENT_PID = %s", ssh_agent_pid ?? "(null)");
         
         // Diagnose what SSH agents might be running on the host
-        diagnose_ssh_agents ();
+        yield diagnose_ssh_agents ();
         
-        string stdout_output, stderr_output;
-        int exit_status;
+        string[] cmd = {"ssh-add", "-D"};
+        var result = yield KeyMaker.Command.run_capture (cmd);
         
-        string[] cmd = {"ssh-add", "-D", null};
+        debug ("SSHAgentDialog: ssh-add -D exit status: %d", result.status);
+        debug ("SSHAgentDialog: ssh-add -D stdout: %s", result.stdout.strip ());
+        debug ("SSHAgentDialog: ssh-add -D stderr: %s", result.stderr.strip ());
         
-        bool success = Process.spawn_sync (
-            null, // working_directory
-            cmd,
-            null, // use default environment
-            SpawnFlags.SEARCH_PATH,
-            null, // child_setup
-            out stdout_output,
-            out stderr_output,
-            out exit_status
-        );
-        
-        debug ("SSHAgentDialog: ssh-add -D exit status: %d", exit_status);
-        debug ("SSHAgentDialog: ssh-add -D stdout: %s", stdout_output.strip ());
-        debug ("SSHAgentDialog: ssh-add -D stderr: %s", stderr_output.strip ());
-        
-        if (!success) {
-            throw new IOError.FAILED ("Failed to execute ssh-add -D command");
-        }
-        
-        if (exit_status != 0) {
-            throw new IOError.FAILED ("ssh-add -D failed: %s".printf (stderr_output.strip ()));
+        if (result.status != 0) {
+            throw new IOError.FAILED ("ssh-add -D failed: %s".printf (result.stderr.strip ()));
         }
         
         debug ("SSHAgentDialog: ssh-add -D command completed successfully");
     }
     
     // Quick check of agent keys without updating UI
-    private void check_agent_keys_immediately () {
+    private async void check_agent_keys_immediately () {
         try {
-            string stdout_output, stderr_output;
-            int exit_status;
-            
-            string[] cmd = {"ssh-add", "-l", null};
-            
-            bool success = Process.spawn_sync (
-                null, cmd, null, SpawnFlags.SEARCH_PATH,
-                null, out stdout_output, out stderr_output, out exit_status
-            );
+            string[] cmd = {"ssh-add", "-l"};
+            var result = yield KeyMaker.Command.run_capture (cmd);
             
-            if (success) {
-                debug ("SSHAgentDialog: Immediate check - exit status: %d", exit_status);
-                debug ("SSHAgentDialog: Immediate check - stdout: %s", stdout_output.strip ());
-                if (exit_status == 1) {
-                    debug ("SSHAgentDialog: Keys successfully removed - agent has no keys");
-                } else if (exit_status == 0) {
-                    debug ("SSHAgentDialog: WARNING - Keys are still present after removal!");
-                }
+            debug ("SSHAgentDialog: Immediate check - exit status: %d", result.status);
+            debug ("SSHAgentDialog: Immediate check - stdout: %s", result.stdout.strip ());
+            if (result.status == 1) {
+                debug ("SSHAgentDialog: Keys successfully removed - agent has no keys");
+            } else if (result.status == 0) {
+                debug ("SSHAgentDialog: WARNING - Keys are still present after removal!");
             }
         } catch (Error e) {
             debug ("SSHAgentDialog: Error in immediate check: %s", e.message);
@@ -616,7 +567,7 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
     }
     
     // Diagnose SSH agent situation to understand the issue
-    private void diagnose_ssh_agents () {
+    private async void diagnose_ssh_agents () {
         debug ("SSHAgentDialog: === SSH Agent Diagnosis ===");
         
         // Check if we can access /proc to see running processes
@@ -633,24 +584,18 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
         
         // Try to list SSH agent processes using ps
         try {
-            string stdout_output, stderr_output;
-            int exit_status;
-            
-            string[] cmd = {"ps", "aux", null};
-            bool success = Process.spawn_sync (
-                null, cmd, null, SpawnFlags.SEARCH_PATH,
-                null, out stdout_output, out stderr_output, out exit_status
-            );
+            string[] cmd = {"ps", "aux"};
+            var result = yield KeyMaker.Command.run_capture (cmd);
             
-            if (success && exit_status == 0) {
-                var lines = stdout_output.split ("\n");
+            if (result.status == 0) {
+                var lines = result.stdout.split ("\n");
                 foreach (string line in lines) {
                     if ("ssh-agent" in line || "gnome-keyring" in line) {
                         debug ("SSHAgentDialog: Found agent process: %s", line.strip ());
                     }
                 }
             } else {
-                debug ("SSHAgentDialog: Cannot run 'ps aux' command (exit: %d)", exit_status);
+                debug ("SSHAgentDialog: Cannot run 'ps aux' command (exit: %d)", result.status);
             }
         } catch (Error e) {
             debug ("SSHAgentDialog: Error running ps command: %s", e.message);
@@ -688,7 +633,7 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
     }
     
     // Detect if GNOME Keyring is managing SSH keys
-    private bool detect_gnome_keyring () {
+    private async bool detect_gnome_keyring () {
         var ssh_auth_sock = Environment.get_variable ("SSH_AUTH_SOCK");
         
         // Check if SSH_AUTH_SOCK points to GNOME Keyring
@@ -699,16 +644,10 @@ public class KeyMaker.SSHAgentDialog : Adw.Dialog {
         
         // Also check if gnome-keyring-daemon is running
         try {
-            string stdout_output, stderr_output;
-            int exit_status;
-            
-            string[] cmd = {"pgrep", "-f", "gnome-keyring-daemon", null};
-            bool success = Process.spawn_sync (
-                null, cmd, null, SpawnFlags.SEARCH_PATH,
-                null, out stdout_output, out stderr_output, out exit_status
-            );
+            string[] cmd = {"pgrep", "-f", "gnome-keyring-daemon"};
+            var result = yield KeyMaker.Command.run_capture (cmd);
             
-            if (success && exit_status == 0 && stdout_output.strip () != "") {
+            if (result.status == 0 && result.stdout.strip () != "") {
                 debug ("SSHAgentDialog: Found gnome-keyring-daemon process");
                 return true;
             }
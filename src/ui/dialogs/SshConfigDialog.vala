@@ -137,12 +137,7 @@ public class KeyMaker.SSHConfigDialog : Adw.Dialog {
     }
     
     private void clear_hosts_list () {
-        Gtk.Widget? child = hosts_list.get_first_child ();
-        while (child != null) {
-            var next = child.get_next_sibling ();
-            hosts_list.remove (child);
-            child = next;
-        }
+        hosts_list.remove_all ();
     }
     
     private void populate_hosts_list () {
@@ -439,9 +434,6 @@ public class KeyMaker.SSHConfigDialog : Adw.Dialog {
     
     
     private void show_error (string title, string message) {
-        var dialog = new Adw.AlertDialog (title, message);
-        dialog.add_response ("ok", "OK");
-        dialog.set_default_response ("ok");
-        dialog.present (this);
+        DialogHelpers.show_error (this, title, message);
     }
 }
\ No newline at end of file
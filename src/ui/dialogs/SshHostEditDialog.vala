@@ -145,7 +145,7 @@ public class KeyMaker.SSHHostEditDialog : Adw.Dialog {
                         // Create switch row for multiple selection
                         var switch_row = new Adw.SwitchRow ();
                         switch_row.set_title (display_name);
-                        switch_row.set_subtitle (key.private_path.get_path ());
+                        switch_row.set_subtitle (key.private_path_str);
                         identity_files_expander.add_row (switch_row);
                         key_switch_rows.add (switch_row);
                     });
@@ -414,7 +414,7 @@ public class KeyMaker.SSHHostEditDialog : Adw.Dialog {
         
         if (key_index >= 0 && key_index < available_keys.length) {
             var key = available_keys[key_index];
-            return key.private_path.get_path ();
+            return key.private_path_str;
         }
         
         return null;
@@ -486,7 +486,7 @@ public class KeyMaker.SSHHostEditDialog : Adw.Dialog {
         // Try to find the matching key in the available keys
         for (uint i = 0; i < available_keys.length; i++) {
             var key = available_keys[i];
-            if (key.private_path.get_path () == identity_file_path) {
+            if (key.private_path_str == identity_file_path) {
                 identity_file_row.selected = i + 1; // +1 because index 0 is "None"
                 return;
             }
@@ -504,7 +504,7 @@ public class KeyMaker.SSHHostEditDialog : Adw.Dialog {
         // Find and activate the switch for this path
         for (uint i = 0; i < available_keys.length; i++) {
             var key = available_keys[i];
-            if (key.private_path.get_path () == identity_file_path) {
+            if (key.private_path_str == identity_file_path) {
                 if (i < key_switch_rows.length) {
                     key_switch_rows[i].active = true;
                 }
@@ -550,13 +550,11 @@ public class KeyMaker.SSHHostEditDialog : Adw.Dialog {
 
         // Validate: no spaces allowed in host name
         if (" " in host_name) {
-            var error_dialog = new Adw.AlertDialog (
+            DialogHelpers.show_error (
+                this,
                 _("Invalid Host Name"),
                 _("Host name cannot contain spaces. Please use a single name like 'myserver' or 'web-server'.")
             );
-            error_dialog.add_response ("ok", _("OK"));
-            error_dialog.set_default_response ("ok");
-            error_dialog.present (this);
             return;
         }
 
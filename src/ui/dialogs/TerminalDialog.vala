@@ -255,13 +255,11 @@ public class KeyMaker.TerminalDialog : Adw.Dialog {
     private void show_connection_error (string message) {
         var safe_host = host_name ?? "unknown host";
         var safe_message = message ?? "Unknown error";
-        var dialog = new Adw.AlertDialog (
+        DialogHelpers.show_error (
+            this,
             "Connection Failed",
             "Failed to establish SSH connection to " + safe_host + ":\n\n" + safe_message
         );
-        dialog.add_response ("ok", "OK");
-        dialog.set_default_response ("ok");
-        dialog.present (this);
     }
     
     private void show_close_confirmation () {
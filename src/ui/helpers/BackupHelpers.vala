@@ -213,10 +213,7 @@ namespace KeyMaker.BackupHelpers {
      * Create error dialog with consistent styling
      */
     public void show_error_dialog (Gtk.Window parent, string title, string message) {
-        var dialog = new Adw.AlertDialog (title, message);
-        dialog.add_response ("ok", "OK");
-        dialog.set_default_response ("ok");
-        dialog.present (parent);
+        DialogHelpers.show_error (parent, title, message);
     }
 
     /**
@@ -0,0 +1,46 @@
+/*
+ * SSHer - Dialog Helper Utilities
+ *
+ * Shared constructors for the simple alert dialogs used across pages
+ * and dialogs.
+ *
+ * Copyright (C) 2025 Thiago Fernandes
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ */
+
+namespace KeyMaker.DialogHelpers {
+
+    /**
+     * Show an error alert with a single OK response
+     *
+     * The dialog is only built when an error is actually shown.
+     */
+    public void show_error (Gtk.Widget? parent, string title, string message) {
+        var dialog = new Adw.AlertDialog (title, message);
+        dialog.add_response ("ok", _("OK"));
+        dialog.set_default_response ("ok");
+        dialog.set_close_response ("ok");
+        dialog.present (parent);
+    }
+
+    /**
+     * Ask to confirm a destructive action, returning true if it was chosen
+     *
+     * Awaits the response instead of connecting a handler per dialog.
+     */
+    public async bool confirm_destructive (Gtk.Widget? parent, string title, string message, string action_id, string action_label) {
+        var dialog = new Adw.AlertDialog (title, message);
+        dialog.add_response ("cancel", _("Cancel"));
+        dialog.add_response (action_id, action_label);
+        dialog.set_response_appearance (action_id, Adw.ResponseAppearance.DESTRUCTIVE);
+        dialog.set_default_response ("cancel");
+        dialog.set_close_response ("cancel");
+
+        var response = yield dialog.choose (parent, null);
+        return response == action_id;
+    }
+}
@@ -67,9 +67,15 @@ public class KeyMaker.BackupPage : Adw.Bin {
         // Delay initialization until the template is loaded
         Idle.add (() => {
             setup_signals ();
+            return false;
+        });
+        
+        // Backups are only listed once the page is first shown
+        ulong map_handler = 0;
+        map_handler = map.connect (() => {
+            disconnect (map_handler);
             populate_regular_backups_list ();
             populate_emergency_backups_list ();
-            return false;
         });
     }
     
@@ -88,7 +94,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
         }
         
         if (remove_all_regular_backups_button != null) {
-            remove_all_regular_backups_button.clicked.connect (remove_all_regular_backups_ui);
+            remove_all_regular_backups_button.clicked.connect (() => remove_all_regular_backups_ui.begin ());
         }
         if (regular_mobile_menu_button != null) {
             regular_mobile_menu_button.clicked.connect (show_regular_mobile_menu);
@@ -104,7 +110,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
         }
         
         if (remove_all_emergency_backups_button != null) {
-            remove_all_emergency_backups_button.clicked.connect (remove_all_emergency_backups_ui);
+            remove_all_emergency_backups_button.clicked.connect (() => remove_all_emergency_backups_ui.begin ());
         }
         if (emergency_mobile_menu_button != null) {
             emergency_mobile_menu_button.clicked.connect (show_emergency_mobile_menu);
@@ -166,7 +172,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
         row_delete_all.add_css_class ("destructive-action");
         row_delete_all.activated.connect (() => {
             sheet.close ();
-            remove_all_regular_backups_ui ();
+            remove_all_regular_backups_ui.begin ();
         });
         destructive.add (row_delete_all);
         
@@ -217,7 +223,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
         row_delete_all.add_css_class ("destructive-action");
         row_delete_all.activated.connect (() => {
             sheet.close ();
-            remove_all_emergency_backups_ui ();
+            remove_all_emergency_backups_ui.begin ();
         });
         destructive.add (row_delete_all);
         
@@ -397,7 +403,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
              row_delete.add_css_class ("destructive-action");
              row_delete.activated.connect (() => {
                  sheet.close ();
-                 delete_regular_backup (backup);
+                 delete_regular_backup.begin (backup);
              });
              sheet_destructive.add (row_delete);
              
@@ -435,7 +441,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
         delete_button.add_css_class ("flat");
         delete_button.add_css_class ("destructive-action");
         delete_button.valign = Gtk.Align.CENTER;
-        delete_button.clicked.connect (() => delete_regular_backup (backup));
+        delete_button.clicked.connect (() => delete_regular_backup.begin (backup));
         desktop_buttons_box.append (delete_button);
         
         // Add buttons to suffix (status icon includes in desktop box)
@@ -591,7 +597,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
                  row_delete.add_css_class ("destructive-action");
                  row_delete.activated.connect (() => {
                      sheet.close ();
-                     delete_emergency_backup (backup);
+                     delete_emergency_backup.begin (backup);
                  });
                  sheet_destructive.add (row_delete);
                  
@@ -639,7 +645,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
             delete_button.sensitive = false;
             delete_button.tooltip_text = "Cannot delete time-locked backup until unlock time";
         }
-        delete_button.clicked.connect (() => delete_emergency_backup (backup));
+        delete_button.clicked.connect (() => delete_emergency_backup.begin (backup));
         desktop_buttons_box.append (delete_button);
         
         // Add buttons to suffix
@@ -660,12 +666,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
     }
     
     private void clear_list_box (Gtk.ListBox list_box) {
-        Gtk.Widget? child = list_box.get_first_child ();
-        while (child != null) {
-            var next = child.get_next_sibling ();
-            list_box.remove (child);
-            child = next;
-        }
+        list_box.remove_all ();
     }
     
     // Signal handlers
@@ -689,40 +690,32 @@ public class KeyMaker.BackupPage : Adw.Bin {
         populate_emergency_backups_list ();
     }
     
-    public void remove_all_regular_backups_ui () {
-        var window = get_root () as Gtk.Window;
-        var alert = new Adw.AlertDialog ("Remove All Regular Backups?", 
-                                          "Are you sure you want to remove all regular backups? This action cannot be undone.");
-        alert.add_response ("cancel", "Cancel");
-        alert.add_response ("remove", "Remove All");
-        alert.set_response_appearance ("remove", Adw.ResponseAppearance.DESTRUCTIVE);
-        alert.set_default_response ("cancel");
-        
-        alert.response.connect ((response) => {
-            if (response == "remove") {
-                remove_all_regular_backups.begin ();
-            }
-        });
+    public async void remove_all_regular_backups_ui () {
+        var confirmed = yield DialogHelpers.confirm_destructive (
+            this,
+            "Remove All Regular Backups?",
+            "Are you sure you want to remove all regular backups? This action cannot be undone.",
+            "remove", "Remove All"
+        );
+        if (!confirmed) {
+            return;
+        }
         
-        alert.present (window);
+        yield remove_all_regular_backups ();
     }
     
-    public void remove_all_emergency_backups_ui () {
-        var window = get_root () as Gtk.Window;
-        var alert = new Adw.AlertDialog ("Remove All Emergency Backups?", 
-                                          "Are you sure you want to remove all emergency backups? This will require authentication and cannot be undone.");
-        alert.add_response ("cancel", "Cancel");
-        alert.add_response ("remove", "Remove All");
-        alert.set_response_appearance ("remove", Adw.ResponseAppearance.DESTRUCTIVE);
-        alert.set_default_response ("cancel");
-        
-        alert.response.connect ((response) => {
-            if (response == "remove") {
-                show_emergency_auth_and_delete_all ();
-            }
-        });
+    public async void remove_all_emergency_backups_ui () {
+        var confirmed = yield DialogHelpers.confirm_destructive (
+            this,
+            "Remove All Emergency Backups?",
+            "Are you sure you want to remove all emergency backups? This will require authentication and cannot be undone.",
+            "remove", "Remove All"
+        );
+        if (!confirmed) {
+            return;
+        }
         
-        alert.present (window);
+        show_emergency_auth_and_delete_all ();
     }
     
     private void on_regular_backup_created (RegularBackupEntry backup) {
@@ -749,7 +742,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
         });
 
         dialog.delete_requested.connect ((b) => {
-            delete_regular_backup (b);
+            delete_regular_backup.begin (b);
         });
 
         dialog.present (window);
@@ -761,28 +754,24 @@ public class KeyMaker.BackupPage : Adw.Bin {
         dialog.present (window);
     }
     
-    private void delete_regular_backup (RegularBackupEntry backup) {
-        var window = get_root () as Gtk.Window;
-        var alert = new Adw.AlertDialog ("Delete Backup?", 
-                                          @"Are you sure you want to delete the backup \"$(backup.name)\"?");
-        alert.add_response ("cancel", "Cancel");
-        alert.add_response ("delete", "Delete");
-        alert.set_response_appearance ("delete", Adw.ResponseAppearance.DESTRUCTIVE);
-        alert.set_default_response ("cancel");
-        
-        alert.response.connect ((response) => {
-            if (response == "delete") {
-                bool success = backup_manager.remove_backup (backup);
-                if (success) {
-                    populate_regular_backups_list ();
-                    show_toast_requested (@"Backup '$(backup.name)' deleted");
-                } else {
-                    show_error ("Delete Failed", "Could not delete backup");
-                }
-            }
-        });
+    private async void delete_regular_backup (RegularBackupEntry backup) {
+        var confirmed = yield DialogHelpers.confirm_destructive (
+            this,
+            "Delete Backup?",
+            @"Are you sure you want to delete the backup \"$(backup.name)\"?",
+            "delete", "Delete"
+        );
+        if (!confirmed) {
+            return;
+        }
         
-        alert.present (window);
+        bool success = backup_manager.remove_backup (backup);
+        if (success) {
+            populate_regular_backups_list ();
+            show_toast_requested (@"Backup '$(backup.name)' deleted");
+        } else {
+            show_error ("Delete Failed", "Could not delete backup");
+        }
     }
     
     private void show_emergency_backup_details (EmergencyBackupEntry backup) {
@@ -794,7 +783,7 @@ public class KeyMaker.BackupPage : Adw.Bin {
         });
 
         dialog.delete_requested.connect ((b) => {
-            delete_emergency_backup (b);
+            delete_emergency_backup.begin (b);
         });
 
         dialog.present (window);
@@ -806,32 +795,24 @@ public class KeyMaker.BackupPage : Adw.Bin {
         dialog.present (window);
     }
     
-    private void delete_emergency_backup (EmergencyBackupEntry backup) {
-        var window = get_root () as Gtk.Window;
+    private async void delete_emergency_backup (EmergencyBackupEntry backup) {
         // For emergency backups, use the same authentication as restore
-        var alert = new Adw.AlertDialog ("Delete Emergency Backup?", 
-                                          @"Deleting \"$(backup.name)\" requires the same authentication as restoring it. Continue?");
-        alert.add_response ("cancel", "Cancel");
-        alert.add_response ("continue", "Continue");
-        alert.set_response_appearance ("continue", Adw.ResponseAppearance.DESTRUCTIVE);
-        alert.set_default_response ("cancel");
-        
-        alert.response.connect ((response) => {
-            if (response == "continue") {
-                show_emergency_auth_and_delete_single (backup);
-            }
-        });
+        var confirmed = yield DialogHelpers.confirm_destructive (
+            this,
+            "Delete Emergency Backup?",
+            @"Deleting \"$(backup.name)\" requires the same authentication as restoring it. Continue?",
+            "continue", "Continue"
+        );
+        if (!confirmed) {
+            return;
+        }
         
-        alert.present (window);
+        show_emergency_auth_and_delete_single (backup);
     }
     
     
     private void show_error (string title, string message) {
-        var window = get_root () as Gtk.Window;
-        var error_dialog = new Adw.AlertDialog (title, message);
-        error_dialog.add_response ("ok", "OK");
-        error_dialog.set_default_response ("ok");
-        error_dialog.present (window);
+        DialogHelpers.show_error (get_root () as Gtk.Window, title, message);
     }
 
     // New bulk deletion methods
@@ -28,6 +28,8 @@ public class KeyMaker.HostsPage : Adw.Bin {
     
     private GenericArray<SSHConfigHost> hosts;
     private GenericArray<SSHConfigHost> filtered_hosts;
+    // What hosts_list shows; rows are created by the list box as items are added
+    private GLib.ListStore host_store;
 
     // Signals for window integration
     public signal void show_toast_requested (string message);
@@ -38,9 +40,13 @@ public class KeyMaker.HostsPage : Adw.Bin {
         // Initialize hosts lists
         hosts = new GenericArray<SSHConfigHost> ();
         filtered_hosts = new GenericArray<SSHConfigHost> ();
+        host_store = new GLib.ListStore (typeof (SSHConfigHost));
         
         // Listen for mobile view changes
         notify["mobile-view"].connect (on_mobile_view_changed);
+        
+        hosts_list.bind_model (host_store, (item) => create_host_row ((SSHConfigHost) item));
+        hosts_list.set_placeholder (create_empty_row ());
 
         // Setup button signals with null checks
         if (add_host_button != null) {
@@ -56,8 +62,13 @@ public class KeyMaker.HostsPage : Adw.Bin {
             mobile_menu_button.clicked.connect (show_header_mobile_menu);
         }
         
-        // Load hosts
-        load_hosts ();
+        // Parse ~/.ssh/config the first time the page is shown rather than
+        // while the window is being built
+        ulong map_handler = 0;
+        map_handler = map.connect (() => {
+            disconnect (map_handler);
+            load_hosts ();
+        });
     }
     
     private void show_header_mobile_menu () {
@@ -150,6 +161,12 @@ public class KeyMaker.HostsPage : Adw.Bin {
 
             // Refresh the UI
             refresh_hosts_display ();
+            // An edited host is the same object, so the diff above keeps its
+            // stale row; put it back to have the row rebuilt
+            uint position;
+            if (found && host_store.find (host, out position)) {
+                host_store.splice (position, 1, { host });
+            }
             show_toast_requested (_("Host '%s' saved successfully").printf (host.name));
 
         } catch (Error e) {
@@ -189,36 +206,40 @@ public class KeyMaker.HostsPage : Adw.Bin {
             filtered_hosts.add (hosts[i]);
         }
         
-        // Clear current display
-        var child = hosts_list.get_first_child ();
-        while (child != null) {
-            var next = child.get_next_sibling ();
-            hosts_list.remove (child);
-            child = next;
+        // Replace only the changed middle of the list: hosts kept at either end
+        // keep their rows, so an edit or removal doesn't rebuild every row
+        uint n_old = host_store.get_n_items ();
+        uint n_new = filtered_hosts.length;
+        uint prefix = 0;
+        while (prefix < n_old && prefix < n_new && host_store.get_item (prefix) == filtered_hosts[prefix]) {
+            prefix++;
         }
-
-        // If no hosts, show empty state row
-        if (filtered_hosts.length == 0) {
-            var empty_row = new Adw.ActionRow ();
-            empty_row.title = _("No SSH Hosts");
-            empty_row.subtitle = _("Click the + button above to add your first SSH host configuration");
-            empty_row.sensitive = false;
-
-            var icon = new Gtk.Image ();
-            icon.icon_name = "network-server-symbolic";
-            icon.opacity = 0.5;
-            empty_row.add_prefix (icon);
-
-            hosts_list.append (empty_row);
-            return;
+        uint suffix = 0;
+        while (suffix < n_old - prefix && suffix < n_new - prefix &&
+               host_store.get_item (n_old - 1 - suffix) == filtered_hosts[n_new - 1 - suffix]) {
+            suffix++;
         }
-
-        // Add hosts to display
-        for (int i = 0; i < filtered_hosts.length; i++) {
-            var host = filtered_hosts[i];
-            var row = create_host_row (host);
-            hosts_list.append (row);
+        
+        var added = new Object[n_new - prefix - suffix];
+        for (uint i = 0; i < added.length; i++) {
+            added[i] = filtered_hosts[prefix + i];
         }
+        host_store.splice (prefix, n_old - prefix - suffix, added);
+    }
+    
+    // Shown by hosts_list while it has no rows
+    private Gtk.Widget create_empty_row () {
+        var empty_row = new Adw.ActionRow ();
+        empty_row.title = _("No SSH Hosts");
+        empty_row.subtitle = _("Click the + button above to add your first SSH host configuration");
+        empty_row.sensitive = false;
+
+        var icon = new Gtk.Image ();
+        icon.icon_name = "network-server-symbolic";
+        icon.opacity = 0.5;
+        empty_row.add_prefix (icon);
+        
+        return empty_row;
     }
     
     
@@ -15,19 +15,17 @@
 [GtkTemplate (ui = "/io/github/tobagin/keysmith/keys_page.ui")]
 #endif
 public class KeyMaker.KeysPage : Adw.Bin {
-    [GtkChild]
-    private unowned Gtk.Box child_box;
     [GtkChild]
     private unowned Gtk.ListBox key_list_box;
     [GtkChild]
     private unowned Gtk.Button refresh_button;
     [GtkChild]
-    private unowned Gtk.MenuButton generate_button;
-    [GtkChild]
     private unowned Gtk.Button mobile_menu_button; // Changed to Button
     
-    private GenericArray<KeyMaker.KeyRowWidget> key_rows;
-    private GenericArray<SSHKey> ssh_keys;
+    // Backing model for key_list_box; rows are created from it by create_key_row
+    private GLib.ListStore key_store;
+    // Rows by private key path, so single-key updates don't walk the model
+    private HashTable<string, KeyMaker.KeyRowWidget> row_index;
     private Cancellable? refresh_cancellable;
 
     
@@ -44,9 +42,9 @@ public class KeyMaker.KeysPage : Adw.Bin {
     public bool mobile_view { get; set; default = false; }
 
     construct {
-        // Initialize arrays
-        ssh_keys = new GenericArray<SSHKey> ();
-        key_rows = new GenericArray<KeyMaker.KeyRowWidget> ();
+        // Initialize the key model
+        key_store = new GLib.ListStore (typeof (SSHKey));
+        row_index = new HashTable<string, KeyMaker.KeyRowWidget> (str_hash, str_equal);
 
         // Listen for mobile view changes
         notify["mobile-view"].connect (on_mobile_view_changed);
@@ -69,15 +67,18 @@ public class KeyMaker.KeysPage : Adw.Bin {
         // Setup the key list box
         if (key_list_box != null) {
             key_list_box.set_selection_mode (Gtk.SelectionMode.NONE);
+            key_list_box.bind_model (key_store, create_key_row);
         }
         
-        // Load SSH keys and agent keys
-        refresh_keys ();
+        // The initial scan is started by Application once the window is on screen
     }
 
     private void on_mobile_view_changed () {
-        for (int i = 0; i < key_rows.length; i++) {
-            key_rows[i].set_mobile_mode (mobile_view);
+        if (key_list_box == null) return;
+        
+        Gtk.ListBoxRow? row;
+        for (int i = 0; (row = key_list_box.get_row_at_index (i)) != null; i++) {
+            ((KeyMaker.KeyRowWidget) row).set_mobile_mode (mobile_view);
         }
     }
 
@@ -131,6 +132,10 @@ public class KeyMaker.KeysPage : Adw.Bin {
     
     
     public GenericArray<SSHKey> get_ssh_keys () {
+        var ssh_keys = new GenericArray<SSHKey> ();
+        for (uint i = 0; i < key_store.get_n_items (); i++) {
+            ssh_keys.add ((SSHKey) key_store.get_item (i));
+        }
         return ssh_keys;
     }
     
@@ -144,24 +149,22 @@ public class KeyMaker.KeysPage : Adw.Bin {
             try { refresh_cancellable.cancel (); } catch (Error e) { }
         }
         refresh_cancellable = new Cancellable ();
+        var cancellable = refresh_cancellable;
+        
+        // Disabled while a scan is in flight; a superseding scan keeps it disabled
+        if (refresh_button != null) {
+            refresh_button.sensitive = false;
+        }
 
         debug ("KeysPage: starting async key scan");
         try {
-            var keys = yield KeyMaker.KeyScanner.scan_ssh_directory_with_cancellable (null, refresh_cancellable);
+            var keys = yield KeyMaker.KeyScanner.scan_ssh_directory_with_cancellable (null, cancellable);
 
-            // Clear current list
-            clear_key_list ();
-            ssh_keys.remove_range (0, ssh_keys.length);
-            
-            // Add keys
-            for (int i = 0; i < keys.length; i++) {
-                ssh_keys.add (keys[i]);
-                add_key_to_list (keys[i]);
-            }
+            update_key_store (keys);
 
 
             debug ("KeysPage: async key scan complete: %d keys", keys.length);
-        } catch (IOError.CANCELLED e) {
+        } catch (KeyMakerError.OPERATION_CANCELLED e) {
             debug ("KeysPage: key scan cancelled");
         } catch (KeyMakerError e) {
             show_toast_requested (_("Failed to scan SSH keys: %s").printf (e.message));
@@ -170,18 +173,66 @@ public class KeyMaker.KeysPage : Adw.Bin {
             show_toast_requested (_("Failed to scan SSH keys: %s").printf (e.message));
             clear_key_list ();
         }
+        
+        if (refresh_button != null && cancellable == refresh_cancellable) {
+            refresh_button.sensitive = true;
+        }
     }
     
-    public void on_key_deleted (SSHKey deleted_key) {
-        // Remove the key from our list
-        for (int i = 0; i < ssh_keys.length; i++) {
-            if (ssh_keys[i] == deleted_key) {
-                ssh_keys.remove_index (i);
-                break;
+    /**
+     * Bring key_store in line with a fresh scan, touching only changed entries
+     *
+     * The scanner hands back the same SSHKey for unchanged files, so most rows
+     * survive a rescan untouched and only added, removed or rebuilt keys get
+     * new rows.
+     */
+    private void update_key_store (GenericArray<SSHKey> keys) {
+        var wanted = new GenericSet<string> (str_hash, str_equal);
+        foreach (var key in keys) {
+            wanted.add (key.private_path_str);
+        }
+        
+        // Drop keys that are gone, back to front so positions stay valid
+        for (int i = (int) key_store.get_n_items () - 1; i >= 0; i--) {
+            var old_key = (SSHKey) key_store.get_item (i);
+            if (!wanted.contains (old_key.private_path_str)) {
+                row_index.remove (old_key.private_path_str);
+                key_store.remove (i);
             }
         }
         
-        remove_key_from_list (deleted_key);
+        // Walk the scan order, keeping matching items and splicing in the rest
+        for (uint i = 0; i < keys.length; i++) {
+            var key = keys[i];
+            var current = i < key_store.get_n_items () ? (SSHKey) key_store.get_item (i) : null;
+            if (current == key) {
+                continue;
+            }
+            
+            Object[] replacement = { key };
+            if (current != null && current.private_path_str == key.private_path_str) {
+                // Same file, new metadata
+                key_store.splice (i, 1, replacement);
+                continue;
+            }
+            
+            // Moved or new: drop any stale entry further down, then insert here
+            var existing = row_index.lookup (key.private_path_str);
+            if (existing != null) {
+                row_index.remove (key.private_path_str);
+                key_store.remove (existing.get_index ());
+            }
+            key_store.splice (i, 0, replacement);
+        }
+    }
+    
+    public void on_key_deleted (SSHKey deleted_key) {
+        // Remove the key from our list; its row goes with it
+        var row = row_index.lookup (deleted_key.private_path_str);
+        if (row != null) {
+            row_index.remove (deleted_key.private_path_str);
+            key_store.remove (row.get_index ());
+        }
     }
     
 
@@ -197,21 +248,15 @@ public class KeyMaker.KeysPage : Adw.Bin {
     }
     
     private void clear_key_list () {
-        if (key_list_box == null) return;
-        
-        // Remove all key rows
-        while (key_rows.length > 0) {
-            var row = key_rows[0];
-            key_list_box.remove (row);
-            key_rows.remove_index (0);
-        }
+        row_index.remove_all ();
+        key_store.remove_all ();
     }
     
-    private void add_key_to_list (SSHKey ssh_key) {
-        if (key_list_box == null) return;
-        
+    private Gtk.Widget create_key_row (Object item) {
+        var ssh_key = (SSHKey) item;
         var key_row = new KeyMaker.KeyRowWidget (ssh_key);
         key_row.set_mobile_mode (mobile_view);
+        row_index.replace (ssh_key.private_path_str, key_row);
         
         // Connect signals
         key_row.copy_requested.connect ((key) => key_copy_requested (key));
@@ -220,32 +265,14 @@ public class KeyMaker.KeysPage : Adw.Bin {
         key_row.passphrase_change_requested.connect ((key) => key_passphrase_change_requested (key));
         key_row.copy_id_requested.connect ((key) => key_copy_id_requested (key));
         
-        key_rows.add (key_row);
-        key_list_box.append (key_row);
-    }
-    
-    private void remove_key_from_list (SSHKey ssh_key) {
-        if (key_list_box == null) return;
-        
-        // Find and remove the key row
-        for (int i = 0; i < key_rows.length; i++) {
-            var row = key_rows[i];
-            if (row.ssh_key == ssh_key) {
-                key_list_box.remove (row);
-                key_rows.remove_index (i);
-                break;
-            }
-        }
+        return key_row;
     }
     
     private void refresh_key_in_list (SSHKey ssh_key) {
         // Find the key row and refresh it
-        for (int i = 0; i < key_rows.length; i++) {
-            var row = key_rows[i];
-            if (row.ssh_key == ssh_key) {
-                row.refresh ();
-                break;
-            }
+        var row = row_index.lookup (ssh_key.private_path_str);
+        if (row != null) {
+            row.refresh ();
         }
     }
-}
\ No newline at end of file
+}
@@ -34,6 +34,8 @@ public class KeyMaker.KnownHostsPage : Adw.Bin {
     private GenericArray<KnownHostEntry> entries;
     private GenericArray<KnownHostEntry> filtered_entries;
     private string current_filter = "";
+    // Placeholder the list shows by itself while empty; only its text changes
+    private Adw.ActionRow empty_row;
 
     // Signals for window integration
     public signal void show_toast_requested (string message);
@@ -45,6 +47,14 @@ public class KeyMaker.KnownHostsPage : Adw.Bin {
         entries = new GenericArray<KnownHostEntry> ();
         filtered_entries = new GenericArray<KnownHostEntry> ();
         
+        empty_row = new Adw.ActionRow ();
+        empty_row.sensitive = false;
+        var empty_icon = new Gtk.Image ();
+        empty_icon.icon_name = "security-high-symbolic";
+        empty_icon.opacity = 0.5;
+        empty_row.add_prefix (empty_icon);
+        known_hosts_list.set_placeholder (empty_row);
+        
         // Listen for mobile view changes
         notify["mobile-view"].connect (on_mobile_view_changed);
 
@@ -73,8 +83,13 @@ public class KeyMaker.KnownHostsPage : Adw.Bin {
         // Listen to manager changes
         manager.entries_changed.connect (refresh_display);
 
-        // Load entries
-        load_entries ();
+        // Load entries the first time the page is shown rather than while
+        // the window is being built
+        ulong map_handler = 0;
+        map_handler = map.connect (() => {
+            disconnect (map_handler);
+            load_entries ();
+        });
     }
 
     private void load_entries () {
@@ -122,16 +137,10 @@ public class KeyMaker.KnownHostsPage : Adw.Bin {
         }
 
         // Clear current display
-        var child = known_hosts_list.get_first_child ();
-        while (child != null) {
-            var next = child.get_next_sibling ();
-            known_hosts_list.remove (child);
-            child = next;
-        }
+        known_hosts_list.remove_all ();
 
-        // Show empty state if no entries
+        // The placeholder appears by itself when no rows are added
         if (filtered_entries.length == 0) {
-            var empty_row = new Adw.ActionRow ();
             if (entries.length == 0) {
                 empty_row.title = _("No Known Hosts");
                 empty_row.subtitle = _("Known hosts will be added automatically when you connect to SSH servers");
@@ -139,14 +148,6 @@ public class KeyMaker.KnownHostsPage : Adw.Bin {
                 empty_row.title = _("No Matching Hosts");
                 empty_row.subtitle = _("Try a different search term");
             }
-            empty_row.sensitive = false;
-
-            var icon = new Gtk.Image ();
-            icon.icon_name = "security-high-symbolic";
-            icon.opacity = 0.5;
-            empty_row.add_prefix (icon);
-
-            known_hosts_list.append (empty_row);
             return;
         }
 
@@ -0,0 +1,68 @@
+/*
+ * SSHer - Passphrase Handoff for ssh-keygen
+ *
+ * Answers ssh-keygen's passphrase prompts through SSH_ASKPASS, so
+ * passphrases stay out of its command line. Needs OpenSSH 8.4 or newer
+ * for SSH_ASKPASS_REQUIRE.
+ */
+
+namespace KeyMaker {
+    public class Askpass {
+        // Picks the answer from the prompt ssh-keygen passes as $1. Only the
+        // start of the prompt is matched: newer releases put the key path in
+        // it, and a path containing "old" must not select the old passphrase
+        private const string SCRIPT = """#!/bin/sh
+case "$1" in
+    "Enter old passphrase"*) printf '%s\n' "$KEYMAKER_OLD_PASSPHRASE" ;;
+    *) printf '%s\n' "$KEYMAKER_NEW_PASSPHRASE" ;;
+esac
+""";
+
+        // Written once per run into the private runtime directory
+        private static string? _script_path = null;
+
+        private static string script_path () throws KeyMakerError {
+            if (_script_path == null) {
+                var path = Path.build_filename (Environment.get_user_runtime_dir (), "keymaker-askpass");
+                try {
+                    FileUtils.set_contents (path, SCRIPT);
+                } catch (FileError e) {
+                    throw new KeyMakerError.OPERATION_FAILED ("Failed to write askpass helper: %s", e.message);
+                }
+                FileUtils.chmod (path, 0700);
+                _script_path = path;
+            }
+            return _script_path;
+        }
+
+        /**
+         * Environment for an ssh-keygen run that prompts for passphrases
+         *
+         * A command line is readable by every user through /proc/<pid>/cmdline,
+         * a process environment only by its owner. Pass the result to
+         * Command.run_status_with_env and wipe () it afterwards. Requires
+         * OpenSSH 8.4+, the first release honouring SSH_ASKPASS_REQUIRE.
+         */
+        public static string[] environment (string? old_passphrase, string? new_passphrase) throws KeyMakerError {
+            return {
+                "SSH_ASKPASS=" + script_path (),
+                // Use the helper even without a display and with a terminal attached
+                "SSH_ASKPASS_REQUIRE=force",
+                "KEYMAKER_OLD_PASSPHRASE=" + (old_passphrase ?? ""),
+                "KEYMAKER_NEW_PASSPHRASE=" + (new_passphrase ?? "")
+            };
+        }
+
+        /**
+         * Overwrite the entries' bytes in place
+         *
+         * Only clears this array. The copy SubprocessLauncher.setenv keeps
+         * is freed with the launcher without being wiped.
+         */
+        public static void wipe (string[] env) {
+            foreach (unowned string entry in env) {
+                Memory.set ((void*) entry, 0, entry.length);
+            }
+        }
+    }
+}
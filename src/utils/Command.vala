@@ -16,49 +16,161 @@ namespace KeyMaker {
             }
         }
 
-        public static async Result run_capture (string[] argv, Cancellable? cancellable = null) throws KeyMakerError {
-            try {
-                var subprocess = new Subprocess.newv (argv, SubprocessFlags.STDOUT_PIPE | SubprocessFlags.STDERR_PIPE);
-                yield subprocess.wait_async (cancellable);
+        // One launcher for every spawn instead of a fresh launcher (and environment copy) per call
+        private static SubprocessLauncher? _launcher = null;
 
-                int status = subprocess.get_exit_status ();
+        private static SubprocessLauncher launcher {
+            get {
+                if (_launcher == null) {
+                    _launcher = new SubprocessLauncher (SubprocessFlags.STDOUT_PIPE | SubprocessFlags.STDERR_PIPE);
+                }
+                return _launcher;
+            }
+        }
 
-                var out_stream = subprocess.get_stdout_pipe ();
-                var err_stream = subprocess.get_stderr_pipe ();
+        // For commands whose stdout nobody reads: it goes to /dev/null instead of a pipe we'd have to drain
+        private static SubprocessLauncher? _status_launcher = null;
 
-                var out_reader = new DataInputStream (out_stream);
-                var err_reader = new DataInputStream (err_stream);
+        private static SubprocessLauncher status_launcher {
+            get {
+                if (_status_launcher == null) {
+                    _status_launcher = new SubprocessLauncher (SubprocessFlags.STDOUT_SILENCE | SubprocessFlags.STDERR_PIPE);
+                }
+                return _status_launcher;
+            }
+        }
 
-                var out_buf = new StringBuilder ();
-                var err_buf = new StringBuilder ();
+        // For commands fed on stdin
+        private static SubprocessLauncher? _input_launcher = null;
 
-                // Read all stdout lines (best-effort)
-                while (true) {
-                    string? line;
-                    try {
-                        line = cancellable != null ? (yield out_reader.read_line_async (GLib.Priority.DEFAULT, cancellable)) : out_reader.read_line ();
-                    } catch (Error e) {
-                        break;
-                    }
-                    if (line == null) break;
-                    out_buf.append (line);
-                    out_buf.append ("\n");
+        private static SubprocessLauncher input_launcher {
+            get {
+                if (_input_launcher == null) {
+                    _input_launcher = new SubprocessLauncher (SubprocessFlags.STDIN_PIPE | SubprocessFlags.STDOUT_PIPE | SubprocessFlags.STDERR_PIPE);
                 }
+                return _input_launcher;
+            }
+        }
+
+        // Absolute paths of the programs we run, so PATH is searched once per program, not per spawn
+        private static HashTable<string, string>? _program_paths = null;
+
+        private static HashTable<string, string> program_paths {
+            get {
+                if (_program_paths == null) {
+                    _program_paths = new HashTable<string, string> (str_hash, str_equal);
+                }
+                return _program_paths;
+            }
+        }
 
-                // Read all stderr lines (best-effort)
-                while (true) {
-                    string? line;
-                    try {
-                        line = cancellable != null ? (yield err_reader.read_line_async (GLib.Priority.DEFAULT, cancellable)) : err_reader.read_line ();
-                    } catch (Error e) {
-                        break;
+        /**
+         * Resolve a program name through PATH, remembering the result
+         *
+         * Names that aren't found are returned unchanged, so the spawn reports
+         * the missing program as before.
+         */
+        public static string find_program (string program) {
+            if (Path.is_absolute (program)) {
+                return program;
+            }
+            unowned string? cached = program_paths.lookup (program);
+            if (cached != null) {
+                return cached;
+            }
+            var path = Environment.find_program_in_path (program);
+            if (path == null) {
+                return program;
+            }
+            program_paths.insert (program, path);
+            return path;
+        }
+
+        /**
+         * Copy of argv with the program resolved by find_program; the caller's array is left alone
+         */
+        private static string[] resolve_argv (string[] argv) {
+            var resolved = argv.copy ();
+            resolved[0] = find_program (argv[0]);
+            return resolved;
+        }
+
+        // Most stderr kept by run_status; diagnostics past this are logged but not stored
+        private const int STDERR_LIMIT = 8192;
+
+        /**
+         * Execute a command for its exit status, capturing only stderr for error reporting
+         *
+         * stderr is read line by line as the command writes it, so diagnostics
+         * show up in the log while it runs rather than only once it exits.
+         */
+        public static async Result run_status (string[] argv, Cancellable? cancellable = null) throws KeyMakerError {
+            return yield run_status_on (status_launcher, argv, cancellable);
+        }
+        
+        /**
+         * Execute a command like run_status, with NAME=VALUE entries added to its environment
+         *
+         * The command gets a launcher of its own, so the variables never reach
+         * other spawns. Values are wiped after being handed to the launcher;
+         * the launcher's own copies are not.
+         */
+        public static async Result run_status_with_env (string[] argv, string[] env, Cancellable? cancellable = null) throws KeyMakerError {
+            var env_launcher = new SubprocessLauncher (SubprocessFlags.STDOUT_SILENCE | SubprocessFlags.STDERR_PIPE);
+            foreach (unowned string entry in env) {
+                var separator = entry.index_of_char ('=');
+                var value = entry.substring (separator + 1);
+                env_launcher.setenv (entry.substring (0, separator), value, true);
+                Memory.set ((void*) value, 0, value.length);
+            }
+            return yield run_status_on (env_launcher, argv, cancellable);
+        }
+        
+        private static async Result run_status_on (SubprocessLauncher spawner, string[] argv, Cancellable? cancellable) throws KeyMakerError {
+            // Disconnected however the run ends, so the cancellable doesn't keep the child alive
+            ulong cancel_handler = 0;
+            try {
+                var subprocess = spawner.spawnv (resolve_argv (argv));
+                
+                // Don't leave the command running once nobody waits for it
+                if (cancellable != null) {
+                    cancel_handler = cancellable.connect (() => subprocess.force_exit ());
+                }
+                
+                var stderr_stream = new DataInputStream (subprocess.get_stderr_pipe ());
+                var err = new StringBuilder ();
+                string? line;
+                while ((line = yield stderr_stream.read_line_async (Priority.DEFAULT, cancellable)) != null) {
+                    KeyMaker.Log.debug ("COMMAND", "%s: %s", argv[0], line);
+                    if (err.len + line.length < STDERR_LIMIT) {
+                        err.append (line);
+                        err.append_c ('\n');
                     }
-                    if (line == null) break;
-                    err_buf.append (line);
-                    err_buf.append ("\n");
                 }
+                yield subprocess.wait_async (cancellable);
+                
+                return new Result (subprocess.get_exit_status (), "", err.str);
+            } catch (IOError.CANCELLED e) {
+                throw new KeyMakerError.OPERATION_CANCELLED ("Command was cancelled");
+            } catch (Error e) {
+                throw new KeyMakerError.OPERATION_FAILED ("Failed to run command: %s", e.message);
+            } finally {
+                if (cancel_handler != 0) {
+                    cancellable.disconnect (cancel_handler);
+                }
+            }
+        }
 
-                return new Result (status, out_buf.str, err_buf.str);
+        public static async Result run_capture (string[] argv, Cancellable? cancellable = null) throws KeyMakerError {
+            try {
+                var subprocess = launcher.spawnv (resolve_argv (argv));
+                
+                // Drain both pipes while waiting, so a child that fills a pipe can't block forever
+                Bytes? out_bytes = null;
+                Bytes? err_bytes = null;
+                yield subprocess.communicate_async (null, cancellable, out out_bytes, out err_bytes);
+                
+                return new Result (subprocess.get_exit_status (), bytes_to_string (out_bytes), bytes_to_string (err_bytes));
             } catch (IOError.CANCELLED e) {
                 // Handle cancellation gracefully - don't re-throw as unhandled error
                 throw new KeyMakerError.OPERATION_CANCELLED ("Command was cancelled");
@@ -67,6 +179,36 @@ namespace KeyMaker {
             }
         }
         
+        /**
+         * Execute a command with input written to its stdin, capturing its output
+         */
+        public static async Result run_capture_input (string[] argv, string input, Cancellable? cancellable = null) throws KeyMakerError {
+            try {
+                var subprocess = input_launcher.spawnv (resolve_argv (argv));
+                
+                Bytes? out_bytes = null;
+                Bytes? err_bytes = null;
+                yield subprocess.communicate_async (new Bytes (input.data), cancellable, out out_bytes, out err_bytes);
+                
+                return new Result (subprocess.get_exit_status (), bytes_to_string (out_bytes), bytes_to_string (err_bytes));
+            } catch (IOError.CANCELLED e) {
+                throw new KeyMakerError.OPERATION_CANCELLED ("Command was cancelled");
+            } catch (Error e) {
+                throw new KeyMakerError.OPERATION_FAILED ("Failed to run command: %s", e.message);
+            }
+        }
+        
+        private static string bytes_to_string (Bytes? bytes) {
+            if (bytes == null) {
+                return "";
+            }
+            // Pipe data is not NUL-terminated
+            unowned uint8[] data = bytes.get_data ();
+            var buf = new StringBuilder.sized (data.length + 1);
+            buf.append_len ((string) data, data.length);
+            return buf.str;
+        }
+        
         /**
          * Execute a command with a timeout
          */
@@ -74,8 +216,7 @@ namespace KeyMaker {
             try {
                 KeyMaker.Log.debug("COMMAND", "Executing command with timeout: %s", string.joinv(" ", command));
                 
-                var launcher = new SubprocessLauncher (SubprocessFlags.STDOUT_PIPE | SubprocessFlags.STDERR_PIPE);
-                var subprocess = launcher.spawnv (command);
+                var subprocess = launcher.spawnv (resolve_argv (command));
                 
                 // Set up timeout
                 var timeout_reached = false;
@@ -85,10 +226,14 @@ namespace KeyMaker {
                     return false;
                 });
                 
+                Bytes? out_bytes = null;
+                Bytes? err_bytes = null;
                 try {
-                    yield subprocess.wait_async (cancellable);
+                    yield subprocess.communicate_async (null, cancellable, out out_bytes, out err_bytes);
                 } finally {
-                    Source.remove (timeout_source);
+                    if (!timeout_reached) {
+                        Source.remove (timeout_source);
+                    }
                 }
                 
                 if (timeout_reached) {
@@ -97,29 +242,7 @@ namespace KeyMaker {
                 
                 var status = subprocess.get_exit_status ();
                 
-                // Read stdout
-                var out_stream = subprocess.get_stdout_pipe ();
-                var out_buf = new StringBuilder ();
-                if (out_stream != null) {
-                    var data_stream = new DataInputStream (out_stream);
-                    string? line;
-                    while ((line = data_stream.read_line ()) != null) {
-                        out_buf.append (line).append ("\n");
-                    }
-                }
-                
-                // Read stderr
-                var err_stream = subprocess.get_stderr_pipe ();
-                var err_buf = new StringBuilder ();
-                if (err_stream != null) {
-                    var data_stream = new DataInputStream (err_stream);
-                    string? line;
-                    while ((line = data_stream.read_line ()) != null) {
-                        err_buf.append (line).append ("\n");
-                    }
-                }
-                
-                return new Result (status, out_buf.str, err_buf.str);
+                return new Result (status, bytes_to_string (out_bytes), bytes_to_string (err_bytes));
             } catch (IOError.CANCELLED e) {
                 // Handle cancellation gracefully - don't re-throw as unhandled error
                 throw new KeyMakerError.OPERATION_CANCELLED ("Command was cancelled");
@@ -10,20 +10,37 @@ namespace KeyMaker {
         public const uint PERM_FILE_PRIVATE = 0x180; // 0600
         public const uint PERM_FILE_PUBLIC = 0x1A4;  // 0644
 
+        // The home directory doesn't change while we run, so ~/.ssh is resolved once
+        private static File? _ssh_dir = null;
+        // Set once ensure_ssh_dir has created or verified the directory
+        private static bool ssh_dir_ready = false;
+
         public static File ssh_dir () {
-            return File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+            if (_ssh_dir == null) {
+                _ssh_dir = File.new_for_path (Path.build_filename (Environment.get_home_dir (), ".ssh"));
+            }
+            return _ssh_dir;
         }
 
         public static void ensure_ssh_dir () throws Error {
-            var dir = ssh_dir ();
-            ensure_directory_with_perms (dir);
+            if (ssh_dir_ready) {
+                return;
+            }
+            ensure_directory_with_perms (ssh_dir ());
+            ssh_dir_ready = true;
         }
         
         public static void ensure_directory_with_perms (File dir) throws Error {
-            if (!dir.query_exists ()) {
+            // One stat tells us both whether to create and whether to chmod
+            try {
+                var info = dir.query_info (FileAttribute.UNIX_MODE, FileQueryInfoFlags.NONE);
+                if ((info.get_attribute_uint32 (FileAttribute.UNIX_MODE) & 0x1FF) == PERM_DIR_PRIVATE) {
+                    return;
+                }
+            } catch (IOError.NOT_FOUND e) {
                 dir.make_directory_with_parents ();
             }
-            // Always enforce permission
+            // Enforce permission on new or too permissive directories
             Posix.chmod (dir.get_path (), PERM_DIR_PRIVATE);
         }
 